@@ -0,0 +1,245 @@
+# api/client.py
+# OOP Concept: Proxy Objects, Composition, Encapsulation
+
+import functools
+import http.client
+import json
+import os
+import sqlite3
+import threading
+from urllib.parse import urlsplit
+from StudentAttendanceTracker.controller.attendance_controller import AttendanceController
+from StudentAttendanceTracker.controller.instructor_controller import InstructorController
+from StudentAttendanceTracker.model.events import (AttendanceChanged, ClassesChanged, EventBus, InstructorsChanged,
+                                                   StudentsChanged)
+from StudentAttendanceTracker.model.export import CsvExporter
+from StudentAttendanceTracker.model.reports import AttendanceReport
+from StudentAttendanceTracker.model.roster_import import ImportResult
+from StudentAttendanceTracker.utils.security import Security
+
+
+class ApiError(RuntimeError):
+    """The API server could not be reached or the call failed there."""
+
+
+class ApiClient:
+    """Calls api.server endpoints, keeping one HTTP connection open per thread."""
+
+    def __init__(self, url, timeout=60, token=None):
+        """Initialize with the server address, e.g. http://127.0.0.1:8765, and its token if it has one."""
+        self.url = url.rstrip("/")
+        self.headers = {"Content-Type": "application/json"}
+        if token:
+            self.headers["Authorization"] = f"Bearer {token}"
+        parts = urlsplit(self.url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            self._local.connection = connection
+        return connection
+
+    def _drop_connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def call(self, service, method, *args, **kwargs):
+        """Run service.method(*args, **kwargs) on the server and return its result.
+
+        Raises:
+            sqlite3.IntegrityError: For duplicate keys and other constraint failures, as locally.
+            ApiError: If the server is unreachable or the call failed there.
+        """
+        body = json.dumps({"args": args, "kwargs": kwargs})
+        reused = getattr(self._local, "connection", None) is not None
+        try:
+            try:
+                response = self._request(service, method, body)
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                if not reused:
+                    raise
+                # The server closed an idle keep-alive connection before reading the request
+                self._drop_connection()
+                response = self._request(service, method, body)
+            status, data = response.status, response.read()
+        except (OSError, http.client.HTTPException) as e:
+            self._drop_connection()
+            raise ApiError(f"Cannot reach the attendance server at {self.url}: {e}") from e
+
+        payload = json.loads(data)
+        if status == 200:
+            return payload["result"]
+        if payload.get("type") == "IntegrityError":
+            raise sqlite3.IntegrityError(payload["error"])
+        raise ApiError(f"{payload.get('type', status)}: {payload.get('error')}")
+
+    def _request(self, service, method, body):
+        connection = self._connection()
+        connection.request("POST", f"/api/{service}/{method}", body, self.headers)
+        return connection.getresponse()
+
+    def metrics(self):
+        """Return the server's request and group-commit counters."""
+        return self._get("/api/metrics")
+
+    def version(self):
+        """Return the server's data version (see ApiServer.version)."""
+        return self._get("/api/version")
+
+    def _get(self, path):
+        try:
+            connection = self._connection()
+            connection.request("GET", path, headers=self.headers)
+            response = connection.getresponse()
+            status, payload = response.status, json.loads(response.read())
+        except (OSError, http.client.HTTPException) as e:
+            self._drop_connection()
+            raise ApiError(f"Cannot reach the attendance server at {self.url}: {e}") from e
+        if status != 200:
+            raise ApiError(f"{payload.get('type', status)}: {payload.get('error')}")
+        return payload["result"]
+
+
+class RemoteController:
+    """Stand-in for a controller: every public method call runs on the server.
+
+    The server's change events stay in its process, so a write listed in
+    CHANGES publishes its event type on the local ``events`` bus once the
+    server has answered (without details, so subscribers assume the worst).
+    """
+
+    CHANGES = {}  # method name -> DataChanged subclass
+
+    def __init__(self, client, service, events=None):
+        self.client = client
+        self.service = service
+        self.events = events
+
+    def __getattr__(self, method):
+        if method.startswith("_"):
+            raise AttributeError(method)
+        call = functools.partial(self.client.call, self.service, method)
+        if method not in self.CHANGES or self.events is None:
+            return call
+
+        def write(*args, **kwargs):
+            result = call(*args, **kwargs)
+            self._changed(method)
+            return result
+        return write
+
+    def _changed(self, method):
+        if self.events is not None:
+            self.events.publish(self.CHANGES[method](method))
+
+
+class RemoteAuth(RemoteController):
+    def login_async(self, username, password):
+        """Run login() on the hashing pool and return a Future of the role (or None)."""
+        return Security.submit(self.login, username, password)
+
+
+class RemoteStudents(RemoteController):
+    CHANGES = dict.fromkeys(("add", "update", "delete", "import_file"), StudentsChanged)
+
+    def import_file(self, file_path, instructor_username=None):
+        """Read a roster file here and send its contents for the server to import."""
+        with open(file_path, newline="", encoding="utf-8-sig") as file:
+            text = file.read()
+        result = ImportResult.from_dict(self.client.call(self.service, "import_text", text,
+                                                         os.path.basename(file_path), instructor_username))
+        if result.inserted:
+            self._changed("import_file")
+        return result
+
+
+class RemoteClasses(RemoteController):
+    CHANGES = dict.fromkeys(("add", "rename", "delete"), ClassesChanged)
+
+
+class RemoteInstructors(RemoteController):
+    CHANGES = dict.fromkeys(("create", "update", "delete", "assign_class"), InstructorsChanged)
+    DEFAULT_PASSWORD = InstructorController.DEFAULT_PASSWORD
+
+
+class RemoteAttendance(RemoteController):
+    CHANGES = dict.fromkeys(("mark", "save_roster", "save_by_roll_number", "mark_class"), AttendanceChanged)
+    today = staticmethod(AttendanceController.today)
+
+
+class RemoteReport:
+    """AttendanceReport look-alike whose pages are fetched from the server."""
+
+    COLUMNS = AttendanceReport.COLUMNS
+
+    def __init__(self, client, **filters):
+        self.client = client
+        self.filters = filters
+
+    def page(self, after=None, limit=200):
+        """Fetch up to limit rows that sort after the row `after` (None for the first page)."""
+        return self.client.call("reports", "page", self.filters, after, limit)
+
+    def count(self):
+        """Return the number of rows matching the filters."""
+        return self.client.call("reports", "count", self.filters)
+
+    def iter_chunks(self, chunk_size=2000):
+        """Yield every matching row as (date, name, roll_number, status), one page per chunk."""
+        after = None
+        while True:
+            rows = self.page(after, chunk_size)
+            if not rows:
+                return
+            yield [row[1:] for row in rows]
+            after = rows[-1]
+
+
+class RemoteReports(RemoteController):
+    def report(self, instructor_username=None, class_name=None, start_date=None, end_date=None):
+        """Return a RemoteReport for the given filters."""
+        return RemoteReport(self.client, instructor_username=instructor_username, class_name=class_name,
+                            start_date=start_date, end_date=end_date)
+
+    def totals(self, report):
+        """Return (present, absent) totals for a report's filters."""
+        return self.client.call(self.service, "totals", report.filters)
+
+    def exporter(self, report, file_path, progress=None):
+        """Return a CsvExporter that streams the report's pages from the server."""
+        return CsvExporter(report, file_path, progress=progress)
+
+    def export(self, report, file_path):
+        """Write a report to CSV (gzipped for .gz paths) and return the number of rows written."""
+        return self.exporter(report, file_path).export()
+
+
+class RemoteServices:
+    """Services look-alike backed by an api.server at url."""
+
+    def __init__(self, url, token=None):
+        self.client = ApiClient(url, token=token)
+        self.events = EventBus()
+        self.auth = RemoteAuth(self.client, "auth")
+        self.students = RemoteStudents(self.client, "students", self.events)
+        self.classes = RemoteClasses(self.client, "classes", self.events)
+        self.instructors = RemoteInstructors(self.client, "instructors", self.events)
+        self.attendance = RemoteAttendance(self.client, "attendance", self.events)
+        self.reports = RemoteReports(self.client, "reports")
+
+    def data_version(self):
+        """Return the server's data version, or None (assume unchanged) if it cannot be reached."""
+        try:
+            return self.client.version()
+        except ApiError:
+            return None
+
+    def close(self):
+        """Nothing is subscribed outside this object, so there is nothing to release."""
@@ -0,0 +1,310 @@
+# api/server.py
+# OOP Concept: Class, Encapsulation, Asynchronous I/O
+
+"""Local JSON API that owns attendance.db: python -m StudentAttendanceTracker.api.server
+
+Every controller method the windows use is served as
+
+    POST /api/<service>/<method>   body {"args": [...], "kwargs": {...}}
+    -> 200 {"result": ...}  or  4xx/5xx {"error": "...", "type": "ExceptionName"}
+
+plus GET /api/health, GET /api/metrics and GET /api/version. Point the dashboards at it with
+SAT_API_URL=http://127.0.0.1:8765 (see controller/services.py).
+
+With a token (--token or SAT_API_TOKEN), every endpoint except health needs
+"Authorization: Bearer <token>". The server listens on loopback only unless
+it has a token.
+"""
+
+import argparse
+import asyncio
+import functools
+import hmac
+import inspect
+import ipaddress
+import json
+import logging
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import urlsplit
+from StudentAttendanceTracker.controller.services import Services
+from StudentAttendanceTracker.model.database import Database
+from StudentAttendanceTracker.model.events import DataChanged
+from StudentAttendanceTracker.utils.security import Security
+
+logger = logging.getLogger(__name__)
+
+# How a route runs: on the read pool, through the Database's WriteCoordinator
+# (group commit), or on the bcrypt pool (password work must not hold the write lock).
+POOL, GROUP, HASH = "pool", "group", "hash"
+
+ROUTES = {
+    "auth": {"login": HASH, "register_admin": HASH, "change_password": HASH, "rename_user": GROUP},
+    "students": {"list_students": POOL, "list_details": POOL, "class_names": POOL, "class_roster": POOL,
+                 "roster_entries": POOL, "get": POOL, "search": POOL, "import_text": POOL,
+                 "page": POOL, "add": GROUP, "update": GROUP, "delete": GROUP},
+    "classes": {"list_classes": POOL, "page": POOL, "add": GROUP, "rename": GROUP, "delete": GROUP},
+    "instructors": {"list_instructors": POOL, "list_details": POOL, "names": POOL, "get": POOL,
+                    "page": POOL, "create": HASH,
+                    "update": GROUP, "delete": GROUP, "assign_class": GROUP},
+    "attendance": {"mark": GROUP, "save_roster": GROUP, "save_by_roll_number": GROUP, "mark_class": GROUP},
+    "reports": {"overview_counts": POOL, "instructor_counts": POOL, "class_analytics": POOL},
+}
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+
+def is_loopback(host):
+    """True if host names only this machine (127.0.0.0/8, ::1 or localhost)."""
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return host == "localhost"
+
+
+class ApiServer:
+    """Serves the controllers over HTTP/1.1 keep-alive connections on localhost.
+
+    Reads run on a thread pool sized to the Database reader pool. Writes are
+    handed straight from the event loop to the Database's WriteCoordinator,
+    whose single writer thread commits everything waiting in one
+    transaction, so a burst of hundreds of markers costs one commit instead
+    of hundreds of competing ones, and no request thread sits waiting.
+    """
+
+    def __init__(self, db=None, host="127.0.0.1", port=8765, token=None):
+        """Initialize the server (call start() from a running event loop).
+
+        Args:
+            token (str): Bearer token every request must carry; required to bind beyond loopback.
+
+        Raises:
+            ValueError: If host is not a loopback address and there is no token.
+        """
+        if not token and not is_loopback(host):
+            raise ValueError(f"Refusing to serve on {host} without a token; set --token or SAT_API_TOKEN")
+        self.db = db or Database.shared()
+        self.host = host
+        self.port = port
+        self.token = token
+        self.services = Services(self.db)
+        self.routes = self._build_routes()
+        self._pool = ThreadPoolExecutor(max_workers=Database.READER_POOL_SIZE, thread_name_prefix="api-read")
+        self._server = None
+        self.requests = 0
+        self.changes = 0
+        self._external_version = None
+        self._unsubscribe = self.db.events.subscribe(DataChanged, self._count_change)
+
+    def _build_routes(self):
+        """Map "service.method" to (callable, mode)."""
+        routes = {}
+        for service, methods in ROUTES.items():
+            controller = getattr(self.services, service)
+            for method, mode in methods.items():
+                routes[f"{service}.{method}"] = (getattr(controller, method), mode)
+
+        # Report objects stay on the server; clients send their filters instead
+        reports = self.services.reports
+
+        def check(filters, after=None, limit=200):
+            """Raise TypeError or ValueError for arguments the report routes cannot use (a 400, not a 500)."""
+            if not isinstance(filters, dict):
+                raise TypeError("filters must be an object")
+            inspect.signature(reports.report).bind(**filters)
+            if after is not None and not (isinstance(after, list) and len(after) >= 2):
+                raise ValueError("after must be a row from the previous page")
+            if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+                raise ValueError("limit must be a positive integer")
+
+        def page(filters, after=None, limit=200):
+            return reports.report(**filters).page(after, limit)
+
+        def count(filters):
+            return reports.report(**filters).count()
+
+        def totals(filters):
+            return reports.totals(reports.report(**filters))
+
+        page.check = count.check = totals.check = check
+        routes.update({"reports.page": (page, POOL), "reports.count": (count, POOL),
+                       "reports.totals": (totals, POOL)})
+        return routes
+
+    async def start(self):
+        """Open the database and begin listening."""
+        self.db.migrate()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]  # the real port when started with port 0
+        logger.info("✅ Attendance API listening on http://%s:%s", self.host, self.port)
+
+    async def serve_forever(self):
+        """Start and serve until cancelled."""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Stop accepting connections, commit queued writes and release the threads."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        await asyncio.get_running_loop().run_in_executor(None, self.db.coordinator.close)
+        self._unsubscribe()
+        self.services.close()
+        self._pool.shutdown()
+
+    def _count_change(self, event):
+        self.changes += 1
+
+    def version(self):
+        """Return a value that changes whenever anything commits to the file, through this server or not.
+
+        Dashboards compare it with the one they saw at a page's last refresh
+        (see PaneStack), as local ones do with Database.external_version().
+        """
+        external = self.db.external_version()
+        if external is not None:
+            self._external_version = external
+        return [self._external_version, self.changes]
+
+    def metrics(self):
+        """Return the request count plus the WriteCoordinator's queue, group and latency metrics."""
+        return {"requests": self.requests, "writes": self.db.coordinator.metrics()}
+
+    # ---------------- HTTP ----------------
+
+    async def _run(self, mode, call):
+        """Run one call in the way its route requires."""
+        if mode == GROUP:
+            return await asyncio.wrap_future(self.db.coordinator.submit(call))
+        if mode == HASH:
+            return await asyncio.wrap_future(Security.submit(call))
+        return await asyncio.get_running_loop().run_in_executor(self._pool, call)
+
+    def _authorized(self, headers):
+        if not self.token:
+            return True
+        scheme, _, credentials = headers.get("authorization", "").partition(" ")
+        return scheme.lower() == "bearer" and hmac.compare_digest(credentials.strip().encode(), self.token.encode())
+
+    async def _dispatch(self, method, target, body, headers):
+        """Return (status, payload) for one request."""
+        path = urlsplit(target).path.rstrip("/")
+        if method == "GET" and path == "/api/health":
+            return HTTPStatus.OK, {"result": "ok"}
+        if not self._authorized(headers):
+            return HTTPStatus.UNAUTHORIZED, {"error": "Missing or wrong API token.", "type": "Unauthorized"}
+        if method == "GET" and path == "/api/metrics":
+            return HTTPStatus.OK, {"result": self.metrics()}
+        if method == "GET" and path == "/api/version":
+            return HTTPStatus.OK, {"result": self.version()}
+
+        parts = path.split("/")
+        route = self.routes.get(".".join(parts[2:])) if len(parts) == 4 and parts[1] == "api" else None
+        if route is None:
+            return HTTPStatus.NOT_FOUND, {"error": f"No such endpoint: {path}", "type": "NotFound"}
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use POST.", "type": "MethodNotAllowed"}
+
+        func, mode = route
+        try:
+            request = json.loads(body or b"{}")
+            args, kwargs = request.get("args", []), request.get("kwargs", {})
+            inspect.signature(func).bind(*args, **kwargs)
+            if hasattr(func, "check"):
+                func.check(*args, **kwargs)
+        except (ValueError, TypeError, AttributeError) as e:
+            return HTTPStatus.BAD_REQUEST, {"error": f"Bad request: {e}", "type": "BadRequest"}
+
+        try:
+            result = await self._run(mode, functools.partial(func, *args, **kwargs))
+        except sqlite3.IntegrityError as e:
+            return HTTPStatus.CONFLICT, {"error": str(e), "type": "IntegrityError"}
+        except Exception as e:
+            logger.exception("❌ %s failed", path)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e), "type": type(e).__name__}
+        if hasattr(result, "as_dict"):
+            result = result.as_dict()
+        return HTTPStatus.OK, {"result": result}
+
+    async def _handle_connection(self, reader, writer):
+        """Serve requests on one connection until the client closes it."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    status, payload = HTTPStatus.BAD_REQUEST, {"error": "Invalid Content-Length.",
+                                                               "type": "BadRequest"}
+                    keep_alive = False  # the body's extent is unknown, so the stream cannot be resynced
+                elif length > MAX_BODY_BYTES:
+                    status, payload = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Body too large.",
+                                                                           "type": "BadRequest"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    self.requests += 1
+                    status, payload = await self._dispatch(method, target, body, headers)
+                    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+                data = json.dumps(payload).encode("utf-8")
+                writer.write(f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                             f"Content-Type: application/json\r\n"
+                             f"Content-Length: {len(data)}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1")
+                             + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve attendance.db to the dashboards over a local JSON API.")
+    parser.add_argument("--db", default="attendance.db", help="database file (default: attendance.db)")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="interface to bind (default: localhost only; any other needs a token)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--token", default=os.environ.get("SAT_API_TOKEN"),
+                        help="bearer token clients must send (default: $SAT_API_TOKEN)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    try:
+        server = ApiServer(Database.shared(args.db), host=args.host, port=args.port, token=args.token)
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
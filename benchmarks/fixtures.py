@@ -0,0 +1,102 @@
+# benchmarks/fixtures.py
+# OOP Concept: Class, Encapsulation, Reproducible Synthetic Data
+
+import datetime
+import os
+import random
+from StudentAttendanceTracker.model.database import Database
+from StudentAttendanceTracker.utils.security import Security
+
+FIRST_NAMES = ("Aarav", "Amelia", "Arjun", "Chloe", "Daniel", "Emma", "Gurpreet", "Hannah", "Ishaan", "Jasleen",
+               "Liam", "Maya", "Noah", "Olivia", "Priya", "Rohan", "Sophia", "Simran", "William", "Zara")
+LAST_NAMES = ("Brown", "Chen", "Dhillon", "Garcia", "Gill", "Kaur", "Kim", "Martin", "Nguyen", "Patel",
+              "Purohit", "Sandhu", "Sharma", "Singh", "Smith", "Taylor", "Thomas", "Tremblay", "Wilson", "Wong")
+DEPARTMENTS = ("CS", "IT", "BUS", "ENG", "MTH", "SCI")
+
+
+class FixtureSpec:
+    """Shape of a generated attendance.db.
+
+    Students are spread evenly over classes and each class belongs to one
+    instructor. Attendance is marked for every student on each weekday of
+    the `days` calendar days ending at `end_date`. Each student gets their own
+    absence rate drawn around `absence_rate`, so some students are chronically
+    absent and most rarely are.
+    """
+
+    def __init__(self, students=2000, instructors=10, classes=40, days=120, absence_rate=0.1,
+                 end_date="2025-06-30", seed=1):
+        self.students = students
+        self.instructors = instructors
+        self.classes = classes
+        self.days = days
+        self.absence_rate = absence_rate
+        self.end_date = end_date
+        self.seed = seed
+
+    def as_dict(self):
+        """Return the spec as plain data for benchmark reports."""
+        return dict(vars(self))
+
+    def school_days(self):
+        """Return the weekday dates ("YYYY-MM-DD") covered by the fixture, oldest first."""
+        end = datetime.date.fromisoformat(self.end_date)
+        dates = (end - datetime.timedelta(days=offset) for offset in range(self.days - 1, -1, -1))
+        return [date.isoformat() for date in dates if date.weekday() < 5]
+
+
+def generate(path, spec=None):
+    """Create a fresh attendance.db at `path` shaped by `spec` and return the open Database.
+
+    Rows go through the normal schema, migrations and triggers, so the
+    summary tables and search index are exactly what the app would build.
+    """
+    spec = spec or FixtureSpec()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    rng = random.Random(spec.seed)
+    db = Database(path)
+    db.migrate()
+
+    # One cheap hash shared by every account; login cost is not what is measured here
+    password = Security.hash_password("12345", rounds=4).decode("utf-8")
+    instructors = [f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {number}"
+                   for number in range(1, spec.instructors + 1)]
+    class_names = [f"{DEPARTMENTS[number % len(DEPARTMENTS)]}-{101 + number}" for number in range(spec.classes)]
+    class_owner = {class_name: instructors[number % len(instructors)] for number, class_name in enumerate(class_names)}
+
+    with db.writer() as cursor:
+        cursor.execute("INSERT INTO users (username, password, role) VALUES (?, ?, ?)", ("admin", password, "Admin"))
+        cursor.executemany("INSERT INTO users (username, password, role) VALUES (?, ?, ?)",
+                           [(name, password, "Instructor") for name in instructors])
+        cursor.executemany("INSERT INTO instructors (name, instructor_id, email, department) VALUES (?, ?, ?, ?)",
+                           [(name, f"INS{number:04d}", f"ins{number}@example.edu", DEPARTMENTS[number % len(DEPARTMENTS)])
+                            for number, name in enumerate(instructors, start=1)])
+        cursor.executemany("INSERT INTO classes (class_name) VALUES (?)", [(name,) for name in class_names])
+
+        students = []
+        for number in range(spec.students):
+            class_name = class_names[number % len(class_names)]
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            students.append((name, f"{class_name}-{number:06d}", f"student{number}@example.edu", class_name,
+                             class_owner[class_name]))
+        cursor.executemany(
+            "INSERT INTO students (name, roll_number, email, class_name, instructor_username) VALUES (?, ?, ?, ?, ?)",
+            students)
+        cursor.execute("SELECT id FROM students ORDER BY id")
+        student_ids = [row[0] for row in cursor.fetchall()]
+
+    # Beta(2, b) has mean absence_rate and a long tail of frequently absent students
+    rate = min(max(spec.absence_rate, 0.001), 0.999)
+    absence = {student_id: rng.betavariate(2, 2 * (1 - rate) / rate) for student_id in student_ids}
+    for date in spec.school_days():
+        with db.writer() as cursor:
+            cursor.executemany("INSERT INTO attendance (student_id, date, status) VALUES (?, ?, ?)",
+                               [(student_id, date, "Absent" if rng.random() < absence[student_id] else "Present")
+                                for student_id in student_ids])
+
+    with db.writer() as cursor:
+        cursor.execute("ANALYZE")
+    return db
@@ -0,0 +1,243 @@
+# benchmarks/load_test.py
+# OOP Concept: Class, Encapsulation, Multi-Process Simulation
+#
+# Usage (from the directory containing StudentAttendanceTracker/):
+#     python -m StudentAttendanceTracker.benchmarks.load_test --processes 8 16 32 --duration 20
+#
+# Spawns N processes against one shared database file, each acting as an
+# instructor on their own PC: saving a class roster (save_all_attendance),
+# opening their attendance report (load_all_attendance) and filtering it by
+# class and date (filter_attendance_reports), through the same controllers
+# the dashboards call. Prints one JSON document with throughput, p50/p99
+# latency and lock errors for every journal mode and process count.
+
+import argparse
+import collections
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from StudentAttendanceTracker.benchmarks.fixtures import FixtureSpec, generate
+from StudentAttendanceTracker.controller.services import Services
+from StudentAttendanceTracker.model.database import Database
+from StudentAttendanceTracker.model.write_coordinator import is_busy
+
+OPERATIONS = ("save_all_attendance", "load_all_attendance", "filter_attendance_reports")
+
+
+def percentiles(samples):
+    """Return count, p50, p99 and max of a list of millisecond samples."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {"count": 0, "p50_ms": None, "p99_ms": None, "max_ms": None}
+    return {"count": len(ordered),
+            "p50_ms": round(ordered[len(ordered) // 2], 3),
+            "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3),
+            "max_ms": round(ordered[-1], 3)}
+
+
+class InstructorSession:
+    """One simulated instructor, run inside its own process with its own connections."""
+
+    def __init__(self, number, path, journal_mode, instructor, dates, think_ms):
+        self.rng = random.Random(number)
+        self.db = Database(path)
+        self.db.PRAGMAS = tuple(pragma for pragma in Database.PRAGMAS if "journal_mode" not in pragma) + (
+            f"PRAGMA journal_mode={journal_mode}",)
+        self.services = Services(self.db)
+        self.instructor = instructor
+        self.dates = dates
+        self.think_ms = think_ms
+        self.classes = self.services.students.class_names(instructor)
+        self.rosters = {class_name: self.services.students.class_roster(class_name, instructor)
+                        for class_name in self.classes}
+        self.latencies = {operation: [] for operation in OPERATIONS}
+        self.errors = collections.Counter()
+        self.busy_errors = 0
+
+    def save_all_attendance(self):
+        # InstructorDashboard.save_all_attendance: one class roster for one day
+        roster = self.rosters[self.rng.choice(self.classes)]
+        statuses = [(student_id, "Absent" if self.rng.random() < 0.1 else "Present") for student_id, _, _ in roster]
+        self.services.attendance.save_roster(self.rng.choice(self.dates), statuses)
+
+    def load_all_attendance(self):
+        # InstructorDashboard.load_all_attendance: first report page plus the summary totals
+        report = self.services.reports.report(instructor_username=self.instructor)
+        report.page()
+        self.services.reports.totals(report)
+
+    def filter_attendance_reports(self):
+        # InstructorDashboard.filter_attendance_reports with a class and a two-week range
+        start = self.rng.randrange(max(1, len(self.dates) - 10))
+        report = self.services.reports.report(instructor_username=self.instructor,
+                                              class_name=self.rng.choice(self.classes),
+                                              start_date=self.dates[start],
+                                              end_date=self.dates[min(start + 10, len(self.dates) - 1)])
+        report.page()
+        self.services.reports.totals(report)
+
+    def run(self, duration):
+        """Run random operations until duration seconds have passed."""
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            operation = self.rng.choice(OPERATIONS)
+            started = time.perf_counter()
+            try:
+                getattr(self, operation)()
+            except sqlite3.Error as e:
+                self.busy_errors += is_busy(e)
+                self.errors[f"{operation}: {e}"] += 1
+            else:
+                self.latencies[operation].append((time.perf_counter() - started) * 1000)
+            if self.think_ms:
+                time.sleep(self.rng.expovariate(1000 / self.think_ms))
+
+    def result(self):
+        return {"latencies": self.latencies, "errors": dict(self.errors), "busy_errors": self.busy_errors,
+                "busy_retries": self.db.coordinator.metrics()["retries"]}
+
+
+def run_session(number, path, journal_mode, instructor, dates, think_ms, duration, ready, start, results):
+    """Process entry point: set up, wait for the start signal, run and report."""
+    session = InstructorSession(number, path, journal_mode, instructor, dates, think_ms)
+    ready.put(number)
+    start.wait()
+    session.run(duration)
+    results.put(session.result())
+    session.db.close()
+
+
+class LoadTest:
+    """Runs the simulation for each journal mode and process count on copies of one fixture."""
+
+    def __init__(self, fixture_path, spec, directory, duration=10.0, think_ms=0.0):
+        self.fixture_path = fixture_path
+        self.spec = spec
+        self.directory = directory
+        self.duration = duration
+        self.think_ms = think_ms
+        with sqlite3.connect(fixture_path) as connection:
+            self.instructors = [row[0] for row in connection.execute(
+                "SELECT DISTINCT instructor_username FROM students ORDER BY instructor_username")]
+        # Recent school days plus a week of new ones, so saves both update and insert
+        end = datetime.date.fromisoformat(spec.end_date)
+        self.dates = spec.school_days()[-20:] + [(end + datetime.timedelta(days=offset)).isoformat()
+                                                 for offset in range(1, 8)]
+
+    def run(self, journal_mode, processes):
+        """Run one configuration on a fresh copy of the fixture and return its summary."""
+        path = os.path.join(self.directory, f"load_{journal_mode}_{processes}.db")
+        shutil.copyfile(self.fixture_path, path)
+        connection = sqlite3.connect(path)
+        connection.execute(f"PRAGMA journal_mode={journal_mode}")
+        connection.close()
+
+        context = multiprocessing.get_context("spawn")  # fresh interpreters, like separate PCs
+        ready, results, start = context.Queue(), context.Queue(), context.Event()
+        workers = [context.Process(target=run_session,
+                                   args=(number, path, journal_mode, self.instructors[number % len(self.instructors)],
+                                         self.dates, self.think_ms, self.duration, ready, start, results))
+                   for number in range(processes)]
+        for worker in workers:
+            worker.start()
+        for _ in workers:
+            ready.get()
+        started = time.perf_counter()
+        start.set()
+        sessions = [results.get() for _ in workers]
+        elapsed = time.perf_counter() - started
+        for worker in workers:
+            worker.join()
+        os.remove(path)
+
+        latencies = {operation: [] for operation in OPERATIONS}
+        errors = collections.Counter()
+        for session in sessions:
+            for operation, samples in session["latencies"].items():
+                latencies[operation].extend(samples)
+            errors.update(session["errors"])
+        completed = sum(len(samples) for samples in latencies.values())
+        return {
+            "journal_mode": journal_mode,
+            "processes": processes,
+            "seconds": round(elapsed, 3),
+            "operations": completed,
+            "throughput_ops_per_second": round(completed / elapsed, 2),
+            "roster_saves_per_second": round(len(latencies["save_all_attendance"]) / elapsed, 2),
+            "latency": {"all": percentiles([ms for samples in latencies.values() for ms in samples]),
+                        **{operation: percentiles(samples) for operation, samples in latencies.items()}},
+            "busy_retries": sum(session["busy_retries"] for session in sessions),
+            "busy_errors": sum(session["busy_errors"] for session in sessions),
+            "errors": sum(errors.values()),
+            "error_messages": dict(errors.most_common(5)),
+        }
+
+
+def main():
+    defaults = FixtureSpec(students=1000, classes=20, days=60)
+    parser = argparse.ArgumentParser(description="Multi-process contention test for a shared attendance.db.")
+    parser.add_argument("--db", help="fixture path (default: a temporary file removed afterwards)")
+    parser.add_argument("--regenerate", action="store_true", help="rebuild --db even if it already exists")
+    parser.add_argument("--students", type=int, default=defaults.students)
+    parser.add_argument("--instructors", type=int, default=defaults.instructors)
+    parser.add_argument("--classes", type=int, default=defaults.classes)
+    parser.add_argument("--days", type=int, default=defaults.days, help="calendar days of history (weekdays marked)")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 4, 16],
+                        help="simultaneous instructors to simulate (several values run one after another)")
+    parser.add_argument("--journal-modes", nargs="+", default=["wal", "delete"],
+                        choices=["wal", "delete", "truncate", "persist"])
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per configuration")
+    parser.add_argument("--think-ms", type=float, default=0.0,
+                        help="mean pause between one instructor's actions (0 = back to back)")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    args = parser.parse_args()
+
+    spec = FixtureSpec(students=args.students, instructors=args.instructors, classes=args.classes, days=args.days,
+                       seed=args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.db or os.path.join(directory, "fixture.db")
+        if args.regenerate or not os.path.exists(path):
+            generate(path, spec).close()
+        load_test = LoadTest(path, spec, directory, duration=args.duration, think_ms=args.think_ms)
+        results = []
+        for journal_mode in args.journal_modes:
+            for processes in args.processes:
+                result = load_test.run(journal_mode, processes)
+                results.append(result)
+                print(f"   {journal_mode:<9}{processes:>4} proc {result['throughput_ops_per_second']:>9.1f} ops/s"
+                      f"   p50 {result['latency']['all']['p50_ms'] or 0:>8.2f} ms"
+                      f"   p99 {result['latency']['all']['p99_ms'] or 0:>9.2f} ms"
+                      f"   busy retries {result['busy_retries']:>4}   errors {result['errors']:>4}",
+                      file=sys.stderr)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "fixture": spec.as_dict(),
+            "duration": args.duration,
+            "think_ms": args.think_ms,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# benchmarks/run.py
+# OOP Concept: Class, Encapsulation, Repeatable Measurements
+#
+# Usage (from the directory containing StudentAttendanceTracker/):
+#     python -m StudentAttendanceTracker.benchmarks.run --students 5000 --output results.json
+#
+# Times the model paths the dashboards use against a generated fixture and
+# prints one JSON document, so runs can be diffed or charted over time.
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from StudentAttendanceTracker.benchmarks.fixtures import FixtureSpec, generate
+from StudentAttendanceTracker.model.attendance import Attendance
+from StudentAttendanceTracker.model.database import Database
+from StudentAttendanceTracker.model.export import CsvExporter
+from StudentAttendanceTracker.model.reports import AttendanceReport
+from StudentAttendanceTracker.model.roster_index import RosterIndex
+from StudentAttendanceTracker.model.student_search import StudentSearch
+from StudentAttendanceTracker.model.summary import AttendanceSummary
+
+
+class BenchmarkSuite:
+    """Runs each benchmark `repeat` times and collects timing statistics."""
+
+    def __init__(self, db, repeat=5):
+        self.db = db
+        self.repeat = repeat
+        self.results = {}
+
+    def measure(self, name, func, rows=None):
+        """Time func() `repeat` times; `rows(result)` optionally reports how many rows it handled."""
+        samples, result = [], None
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            result = func()
+            samples.append((time.perf_counter() - started) * 1000)
+        entry = {
+            "runs": len(samples),
+            "min_ms": round(min(samples), 3),
+            "median_ms": round(statistics.median(samples), 3),
+            "mean_ms": round(statistics.fmean(samples), 3),
+            "max_ms": round(max(samples), 3),
+        }
+        if rows:
+            entry["rows"] = rows(result)
+            entry["rows_per_second"] = round(entry["rows"] / (entry["median_ms"] / 1000)) if entry["median_ms"] else None
+        self.results[name] = entry
+        print(f"   {name:<34}{entry['median_ms']:>10.2f} ms", file=sys.stderr)
+        return result
+
+    def run(self, spec):
+        """Run every benchmark; reads first, then the writes that change the fixture."""
+        db = self.db
+        with db.reader() as cursor:
+            cursor.execute("SELECT class_name, instructor_username FROM students ORDER BY id LIMIT 1")
+            class_name, instructor = cursor.fetchone()
+        school_days = spec.school_days()
+        last_month = (school_days[-min(len(school_days), 22)], school_days[-1])
+
+        summary = AttendanceSummary(db)
+        self.measure("overview.table_counts", summary.table_counts)
+        self.measure("overview.instructor_counts", lambda: summary.instructor_counts(instructor))
+
+        def load_class_roster():
+            # Same query as InstructorDashboard.load_students_for_selected_class
+            with db.reader() as cursor:
+                cursor.execute("SELECT id, name, roll_number FROM students WHERE class_name=? AND instructor_username=?",
+                               (class_name, instructor))
+                return cursor.fetchall()
+
+        roster = self.measure("roster.class_load", load_class_roster, rows=len)
+        index = RosterIndex(instructor, db)
+        self.measure("roster.index_build", index.build, rows=lambda snapshot: len(snapshot[2]))
+        self.measure("roster.index_lookup", lambda: index.lookup("s"), rows=len)
+        self.measure("search.students", lambda: StudentSearch(db).search("pat"), rows=len)
+
+        everything = AttendanceReport(db)
+        by_class = AttendanceReport(db, instructor_username=instructor, class_name=class_name,
+                                    start_date=last_month[0], end_date=last_month[1])
+        self.measure("reports.first_page", everything.page, rows=len)
+        self.measure("reports.first_page_filtered", by_class.page, rows=len)
+
+        def scroll(pages=10):
+            rows, after = 0, None
+            for _ in range(pages):
+                page = everything.page(after=after)
+                if not page:
+                    break
+                rows += len(page)
+                after = (page[-1][0], page[-1][1])
+            return rows
+
+        self.measure("reports.scroll_10_pages", scroll, rows=lambda rows: rows)
+        self.measure("reports.count", everything.count)
+        self.measure("reports.count_filtered", by_class.count)
+        self.measure("reports.summary_totals", lambda: summary.totals_for(everything))
+        self.measure("reports.summary_totals_filtered", lambda: summary.totals_for(by_class))
+        self.measure("reports.full_scan", lambda: sum(len(chunk) for chunk in everything.iter_chunks()),
+                     rows=lambda rows: rows)
+
+        with tempfile.TemporaryDirectory() as directory:
+            def export(file_name):
+                exporter = CsvExporter(AttendanceReport(db), os.path.join(directory, file_name))
+                exporter.export()
+                return exporter.rows_written
+
+            self.measure("export.csv", lambda: export("report.csv"), rows=lambda rows: rows)
+            self.measure("export.csv_gzip", lambda: export("report.csv.gz"), rows=lambda rows: rows)
+
+        try:
+            from StudentAttendanceTracker.model.analytics import ClassAnalytics
+        except ImportError:
+            print("   analytics skipped (NumPy not installed)", file=sys.stderr)
+        else:
+            self.measure("analytics.class", lambda: ClassAnalytics.load(class_name, instructor, db=db).student_rows(),
+                         rows=len)
+
+        # Writes last: each run marks one more school day after the fixture's range
+        attendance = Attendance(db)
+        statuses = [(student_id, "Present") for student_id, _, _ in roster]
+        new_dates = iter(datetime.date.fromisoformat(spec.end_date) + datetime.timedelta(days=offset)
+                         for offset in range(1, 10 * self.repeat + 1))
+        self.measure("attendance.save_roster_insert",
+                     lambda: attendance.save_roster(next(new_dates).isoformat(), statuses), rows=len)
+        same_day = school_days[-1]
+        self.measure("attendance.save_roster_unchanged", lambda: attendance.save_roster(same_day, statuses), rows=len)
+        flips = iter(range(10 * self.repeat))
+
+        def save_flipped():
+            status = "Absent" if next(flips) % 2 == 0 else "Present"
+            return attendance.save_roster(same_day, [(student_id, status) for student_id, _ in statuses])
+
+        self.measure("attendance.save_roster_update", save_flipped, rows=len)
+        return self.results
+
+
+def main():
+    defaults = FixtureSpec()
+    parser = argparse.ArgumentParser(description="Benchmark the Student Attendance Tracker model paths.")
+    parser.add_argument("--db", help="fixture path (default: a temporary file removed afterwards)")
+    parser.add_argument("--regenerate", action="store_true", help="rebuild --db even if it already exists")
+    parser.add_argument("--students", type=int, default=defaults.students)
+    parser.add_argument("--instructors", type=int, default=defaults.instructors)
+    parser.add_argument("--classes", type=int, default=defaults.classes)
+    parser.add_argument("--days", type=int, default=defaults.days, help="calendar days of history (weekdays marked)")
+    parser.add_argument("--absence-rate", type=float, default=defaults.absence_rate)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    args = parser.parse_args()
+
+    spec = FixtureSpec(students=args.students, instructors=args.instructors, classes=args.classes, days=args.days,
+                       absence_rate=args.absence_rate, seed=args.seed)
+    directory = None
+    path = args.db
+    if not path:
+        directory = tempfile.TemporaryDirectory()
+        path = os.path.join(directory.name, "attendance.db")
+
+    started = time.perf_counter()
+    if args.regenerate or not os.path.exists(path):
+        db = generate(path, spec)
+        generated_in = round(time.perf_counter() - started, 3)
+    else:
+        db = Database(path)
+        db.migrate()
+        generated_in = None
+    print(f"⏱️ Benchmarking {path}", file=sys.stderr)
+    results = BenchmarkSuite(db, repeat=args.repeat).run(spec)
+    db.close()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "fixture": spec.as_dict(),
+            "fixture_seconds": generated_in,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    if directory:
+        directory.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# cli.py
+# OOP Concept: Composition (controllers), Command Dispatch
+
+"""Headless command line for batch jobs: python -m StudentAttendanceTracker.cli <command> ...
+
+    mark     save one day's attendance for a class, a list of roll numbers or a CSV file
+    import   import a .csv or .jsonl student roster
+    report   print attendance totals, or export the matching rows to CSV (.csv.gz compresses)
+    list     list students, classes or instructors
+"""
+
+import argparse
+import csv
+import logging
+import sys
+from StudentAttendanceTracker.controller.attendance_controller import AttendanceController
+from StudentAttendanceTracker.controller.class_controller import ClassController
+from StudentAttendanceTracker.controller.instructor_controller import InstructorController
+from StudentAttendanceTracker.controller.report_controller import ReportController
+from StudentAttendanceTracker.controller.student_controller import StudentController
+from StudentAttendanceTracker.model.attendance import VALID_STATUSES
+from StudentAttendanceTracker.model.database import Database
+
+
+def read_marks(file_path):
+    """Yield (roll_number, status) from a CSV file with roll_number and status columns."""
+    with open(file_path, newline="", encoding="utf-8-sig") as file:
+        for row in csv.DictReader(file):
+            row = {(key or "").strip().lower(): (value or "").strip() for key, value in row.items()}
+            yield row.get("roll_number") or row.get("roll", ""), row.get("status", "").title()
+
+
+def print_outcomes(outcomes):
+    """Print a one-line count per save outcome; returns True if every row was saved."""
+    counts = {}
+    for _, outcome in outcomes:
+        counts[outcome] = counts.get(outcome, 0) + 1
+    print(", ".join(f"{outcome.title()}: {count}" for outcome, count in sorted(counts.items())) or "Nothing to save.")
+    return not any(outcome in ("invalid", "unknown") for _, outcome in outcomes)
+
+
+def run_mark(db, args):
+    attendance = AttendanceController(db)
+    date = args.date or attendance.today()
+    if args.class_name:
+        outcomes = attendance.mark_class(args.class_name, date, args.status, args.instructor)
+        return 0 if print_outcomes(outcomes) else 1
+
+    if args.file:
+        marks = list(read_marks(args.file))
+    else:
+        marks = [(roll_number, args.status) for roll_number in args.roll]
+    outcomes = attendance.save_by_roll_number(date, marks, args.instructor)
+    for roll_number, outcome in outcomes:
+        if outcome in ("invalid", "unknown"):
+            print(f"❌ {roll_number}: {outcome}", file=sys.stderr)
+    return 0 if print_outcomes(outcomes) else 1
+
+
+def run_import(db, args):
+    result = StudentController(db).import_file(args.file, args.instructor)
+    print(result.summary())
+    for line, reason in result.rejected:
+        print(f"❌ Line {line}: {reason}", file=sys.stderr)
+    return 1 if result.rejected else 0
+
+
+def run_report(db, args):
+    reports = ReportController(db)
+    report = reports.report(instructor_username=args.instructor, class_name=args.class_name,
+                            start_date=args.start_date, end_date=args.end_date)
+    if args.output:
+        rows_written = reports.export(report, args.output)
+        print(f"Exported {rows_written} rows to {args.output}")
+        return 0
+
+    present, absent = reports.totals(report)
+    marked = present + absent
+    rate = f"{100 * present / marked:.1f}%" if marked else "-"
+    print(f"Present: {present}  Absent: {absent}  Rate: {rate}")
+    return 0
+
+
+def run_list(db, args):
+    if args.what == "students":
+        rows = StudentController(db).list_details(class_name=args.class_name, instructor_username=args.instructor)
+    elif args.what == "classes":
+        rows = [(class_name,) for class_name in ClassController(db).list_classes()]
+    else:
+        rows = InstructorController(db).list_details()
+    writer = csv.writer(sys.stdout, delimiter="\t", lineterminator="\n")
+    writer.writerows(tuple("" if value is None else value for value in row) for row in rows)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m StudentAttendanceTracker.cli",
+                                     description="Student Attendance Tracker batch commands.")
+    parser.add_argument("--db", default="attendance.db", help="database file (default: attendance.db)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    mark = commands.add_parser("mark", help="save one day's attendance")
+    targets = mark.add_mutually_exclusive_group(required=True)
+    targets.add_argument("--class", dest="class_name", help="mark every student in this class")
+    targets.add_argument("--roll", nargs="+", help="roll numbers to mark")
+    targets.add_argument("--file", help="CSV file with roll_number and status columns")
+    mark.add_argument("--status", choices=VALID_STATUSES, default="Present",
+                      help="status for --class and --roll (default: Present)")
+    mark.add_argument("--date", help="YYYY-MM-DD (default: today)")
+    mark.add_argument("--instructor", help="only match this instructor's students")
+    mark.set_defaults(run=run_mark)
+
+    roster = commands.add_parser("import", help="import a .csv or .jsonl student roster")
+    roster.add_argument("file")
+    roster.add_argument("--instructor", help="instructor for rows that do not name one")
+    roster.set_defaults(run=run_import)
+
+    report = commands.add_parser("report", help="attendance totals, or a CSV export with --output")
+    report.add_argument("--instructor")
+    report.add_argument("--class", dest="class_name")
+    report.add_argument("--from", dest="start_date", help="YYYY-MM-DD")
+    report.add_argument("--to", dest="end_date", help="YYYY-MM-DD")
+    report.add_argument("--output", help="export rows to this .csv or .csv.gz file")
+    report.set_defaults(run=run_report)
+
+    listing = commands.add_parser("list", help="print tab-separated students, classes or instructors")
+    listing.add_argument("what", choices=("students", "classes", "instructors"))
+    listing.add_argument("--class", dest="class_name", help="students: only this class")
+    listing.add_argument("--instructor", help="students: only this instructor's")
+    listing.set_defaults(run=run_list)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    db = Database.shared(args.db)
+    db.migrate()  # logs to stderr, keeping stdout for command output
+    try:
+        return args.run(db, args)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,17 @@
+# conftest.py
+# Lets pytest run from the checkout: the code imports itself as the StudentAttendanceTracker package.
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+if ROOT.name == "StudentAttendanceTracker":
+    sys.path.insert(0, str(ROOT.parent))
+elif importlib.util.find_spec("StudentAttendanceTracker") is None:
+    # Checked out under another directory name: serve the package from here
+    package = types.ModuleType("StudentAttendanceTracker")
+    package.__path__ = [str(ROOT)]
+    sys.modules["StudentAttendanceTracker"] = package
@@ -0,0 +1,72 @@
+# controller/attendance_controller.py
+# OOP Concept: Class, Encapsulation, Composition (Database and Attendance classes)
+
+import datetime
+from StudentAttendanceTracker.model.attendance import Attendance, LOOKUP_CHUNK_SIZE
+from StudentAttendanceTracker.model.database import Database
+from StudentAttendanceTracker.model.events import AttendanceChanged
+from StudentAttendanceTracker.model.write_coordinator import coordinated
+
+
+class AttendanceController:
+    """Attendance marking by student id, by roll number or for a whole class."""
+
+    def __init__(self, db=None):
+        """Initialize with a Database (the shared one by default)."""
+        self.db = db or Database.shared()
+        self.attendance = Attendance(self.db)
+
+    @staticmethod
+    def today():
+        """Today's date as YYYY-MM-DD, the format attendance is stored in."""
+        return datetime.date.today().strftime("%Y-%m-%d")
+
+    @coordinated
+    def mark(self, student_id, date, status):
+        """Record one student's status for a date, replacing any earlier mark that day."""
+        self.attendance.mark(student_id, date, status)
+        self.db.publish(AttendanceChanged("mark"))
+
+    @coordinated
+    def save_roster(self, date, statuses):
+        """Write (student_id, status) pairs for one date; see Attendance.save_roster for outcomes."""
+        outcomes = self.attendance.save_roster(date, statuses)
+        self.db.publish(AttendanceChanged("save_roster"))
+        return outcomes
+
+    def save_by_roll_number(self, date, statuses, instructor_username=None):
+        """Write (roll_number, status) pairs for one date.
+
+        Returns:
+            list: (roll_number, outcome) in input order; outcome is a save_roster
+            outcome or "unknown" for a roll number with no (matching) student.
+        """
+        statuses = list(statuses)
+        ids = {}
+        roll_numbers = list({roll_number for roll_number, _ in statuses})
+        with self.db.reader() as cursor:
+            for start in range(0, len(roll_numbers), LOOKUP_CHUNK_SIZE):
+                chunk = roll_numbers[start:start + LOOKUP_CHUNK_SIZE]
+                query = f"SELECT roll_number, id FROM students WHERE roll_number IN ({', '.join('?' * len(chunk))})"
+                params = list(chunk)
+                if instructor_username:
+                    query += " AND instructor_username = ?"
+                    params.append(instructor_username)
+                cursor.execute(query, tuple(params))
+                ids.update(cursor.fetchall())
+
+        known = [(ids[roll_number], status) for roll_number, status in statuses if roll_number in ids]
+        outcomes = iter(self.save_roster(date, known))
+        return [(roll_number, next(outcomes)[1] if roll_number in ids else "unknown")
+                for roll_number, _ in statuses]
+
+    def mark_class(self, class_name, date, status, instructor_username=None):
+        """Give every student in a class the same status for a date; returns save_roster outcomes."""
+        query, params = "SELECT id FROM students WHERE class_name = ?", [class_name]
+        if instructor_username:
+            query += " AND instructor_username = ?"
+            params.append(instructor_username)
+        with self.db.reader() as cursor:
+            cursor.execute(query, tuple(params))
+            student_ids = [row[0] for row in cursor.fetchall()]
+        return self.save_roster(date, [(student_id, status) for student_id in student_ids])
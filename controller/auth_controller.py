@@ -1,21 +1,28 @@
 # controller/auth_controller.py
 # OOP Concept: Class, Encapsulation, Composition (Database and Security classes)
 
+import logging
+import sqlite3
 from StudentAttendanceTracker.model.database import Database
+from StudentAttendanceTracker.model.write_coordinator import coordinated
 from StudentAttendanceTracker.utils.security import Security
 
+logger = logging.getLogger(__name__)
+
 
 class AuthController:
     """Handles user authentication by connecting to the database and verifying credentials."""
 
-    def __init__(self):
-        """Initialize the database connection."""
-        self.db = Database()
-        self.db.connect()
+    def __init__(self, db=None):
+        """Initialize with a Database (the shared one by default)."""
+        self.db = db or Database.shared()
 
     def login(self, username, password):
         """Authenticate user with username and password.
 
+        Blocks for one bcrypt check (two if the stored hash is re-hashed), so
+        the GUI calls login_async() instead.
+
         Args:
             username (str): Entered username.
             password (str): Entered password.
@@ -23,20 +30,90 @@ class AuthController:
         Returns:
             str or None: Returns user's role if authentication is successful, otherwise None.
         """
-        cursor = self.db.connection.cursor()
-        cursor.execute("SELECT password, role FROM users WHERE username = ?", (username,))
-        user = cursor.fetchone()
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT password, role FROM users WHERE username = ?", (username,))
+            user = cursor.fetchone()
 
         if user:
             stored_hashed_password, role = user
             stored_hashed_password = stored_hashed_password.encode('utf-8')  # Fix: encode to bytes
             if Security.verify_password(password, stored_hashed_password):
+                if Security.needs_rehash(stored_hashed_password):
+                    self.rehash(username, password, stored_hashed_password)
                 return role
             else:
                 return None  # Password incorrect
         else:
             return None  # Username not found
 
-    def __del__(self):
-        """Ensure the database connection is closed when object is deleted."""
-        self.db.close()
+    def login_async(self, username, password):
+        """Run login() on the hashing pool and return a Future of the role (or None)."""
+        return Security.submit(self.login, username, password)
+
+    def rehash(self, username, password, old_hashed_password):
+        """Store the password re-hashed at the current bcrypt cost.
+
+        Only replaces the exact hash that was verified, so a password changed
+        meanwhile is never overwritten. A failure here never blocks the login.
+        """
+        new_hashed_password = Security.hash_password(password).decode('utf-8')
+        try:
+            self._replace_password(username, new_hashed_password, old_hashed_password.decode('utf-8'))
+        except sqlite3.Error as e:
+            logger.error("❌ Could not upgrade password hash for '%s': %s", username, e)
+
+    def register_admin(self, username, password):
+        """Create an Admin account; returns False if the username is taken.
+
+        Blocks for one bcrypt hash; GUI callers run it off the Tk thread.
+        """
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT 1 FROM users WHERE username = ?", (username,))
+            if cursor.fetchone():
+                return False
+
+        hashed_password = Security.hash_password(password).decode('utf-8')
+        self._insert_user(username, hashed_password, "Admin")
+        return True
+
+    def change_password(self, username, old_password, new_password):
+        """Replace a user's password after checking the old one.
+
+        Blocks for two bcrypt operations; GUI callers run it off the Tk thread.
+
+        Returns:
+            str: "changed", "not_found" or "wrong_password".
+        """
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT password FROM users WHERE username = ?", (username,))
+            record = cursor.fetchone()
+        if not record:
+            return "not_found"
+        if not Security.verify_password(old_password, record[0]):
+            return "wrong_password"
+        self._replace_password(username, Security.hash_password(new_password).decode('utf-8'))
+        return "changed"
+
+    # Hashing happens before these, so the writer thread never waits on bcrypt
+    @coordinated
+    def _insert_user(self, username, hashed_password, role):
+        with self.db.writer() as cursor:
+            cursor.execute("INSERT INTO users (username, password, role) VALUES (?, ?, ?)",
+                           (username, hashed_password, role))
+
+    @coordinated
+    def _replace_password(self, username, hashed_password, expected_hash=None):
+        """Store a new hash; with expected_hash, only if that is still the stored one."""
+        query, params = "UPDATE users SET password = ? WHERE username = ?", [hashed_password, username]
+        if expected_hash is not None:
+            query += " AND password = ?"
+            params.append(expected_hash)
+        with self.db.writer() as cursor:
+            cursor.execute(query, tuple(params))
+
+    @coordinated
+    def rename_user(self, old_username, new_username):
+        """Change a login name; returns how many rows changed."""
+        with self.db.writer() as cursor:
+            cursor.execute("UPDATE users SET username = ? WHERE username = ?", (new_username, old_username))
+            return cursor.rowcount
@@ -0,0 +1,64 @@
+# controller/class_controller.py
+# OOP Concept: Class, Encapsulation, Composition (Database, LookupCache)
+
+from StudentAttendanceTracker.model.database import Database
+from StudentAttendanceTracker.model.events import ClassesChanged
+from StudentAttendanceTracker.model.listing import TableListing
+from StudentAttendanceTracker.model.lookup_cache import LookupCache
+from StudentAttendanceTracker.model.write_coordinator import coordinated
+
+
+class ClassController:
+    """The list of classes: listing, add, rename and delete.
+
+    list_classes() is cached until a ClassesChanged event says the list changed.
+    """
+
+    def __init__(self, db=None):
+        """Initialize with a Database (the shared one by default)."""
+        self.db = db or Database.shared()
+        self.listing = TableListing("classes", (("class_name", "class_name"),), sortable=("class_name",), db=self.db)
+        self.lookups = LookupCache(self.db)
+        self._unsubscribe = self.db.events.subscribe(ClassesChanged, lambda event: self.lookups.invalidate("classes"))
+
+    def close(self):
+        """Stop following change events; the controller must not be used afterwards."""
+        self._unsubscribe()
+
+    def list_classes(self):
+        """Return every class name, alphabetically."""
+        return list(self.lookups.get(("classes",), self._read_classes))
+
+    def _read_classes(self):
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT class_name FROM classes ORDER BY class_name ASC")
+            return tuple(row[0] for row in cursor.fetchall())
+
+    def page(self, after=None, limit=200, sort=None, descending=False):
+        """Fetch one page of the View All classes table (see TableListing.page)."""
+        return self.listing.page(after, limit, sort, descending)
+
+    @coordinated
+    def add(self, class_name):
+        """Add a class (raises sqlite3.IntegrityError if it already exists)."""
+        with self.db.writer() as cursor:
+            cursor.execute("INSERT INTO classes (class_name) VALUES (?)", (class_name,))
+            self.db.publish(ClassesChanged("add", class_names=(class_name,)))
+
+    @coordinated
+    def rename(self, old_class_name, new_class_name):
+        """Rename a class; returns how many rows changed."""
+        with self.db.writer() as cursor:
+            cursor.execute("UPDATE classes SET class_name=? WHERE class_name=?", (new_class_name, old_class_name))
+            if cursor.rowcount:
+                self.db.publish(ClassesChanged("rename", class_names=(old_class_name, new_class_name)))
+            return cursor.rowcount
+
+    @coordinated
+    def delete(self, class_name):
+        """Delete a class; returns how many rows were deleted."""
+        with self.db.writer() as cursor:
+            cursor.execute("DELETE FROM classes WHERE class_name=?", (class_name,))
+            if cursor.rowcount:
+                self.db.publish(ClassesChanged("delete", class_names=(class_name,)))
+            return cursor.rowcount
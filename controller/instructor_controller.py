@@ -0,0 +1,96 @@
+# controller/instructor_controller.py
+# OOP Concept: Class, Encapsulation, Composition (Database and Security classes)
+
+from StudentAttendanceTracker.model.database import Database
+from StudentAttendanceTracker.model.events import InstructorsChanged
+from StudentAttendanceTracker.model.listing import TableListing
+from StudentAttendanceTracker.model.write_coordinator import coordinated
+from StudentAttendanceTracker.utils.security import Security
+
+
+class InstructorController:
+    """Instructor records and their login accounts."""
+
+    DEFAULT_PASSWORD = "12345"
+
+    def __init__(self, db=None):
+        """Initialize with a Database (the shared one by default)."""
+        self.db = db or Database.shared()
+        self.listing = TableListing("instructors", (("instructor_id", "instructor_id"), ("name", "name"),
+                                                    ("email", "IFNULL(email, '')"),
+                                                    ("department", "IFNULL(department, '')")),
+                                    sortable=("instructor_id", "name", "department"), db=self.db)
+
+    def list_instructors(self):
+        """Return (name, instructor_id) for every instructor."""
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT name, instructor_id FROM instructors")
+            return cursor.fetchall()
+
+    def list_details(self):
+        """Return (instructor_id, name, email, department) for every instructor."""
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT instructor_id, name, email, department FROM instructors")
+            return cursor.fetchall()
+
+    def page(self, after=None, limit=200, sort=None, descending=False):
+        """Fetch one page of the View All instructors table (see TableListing.page)."""
+        return self.listing.page(after, limit, sort, descending)
+
+    def names(self):
+        """Return every instructor name."""
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT name FROM instructors")
+            return [row[0] for row in cursor.fetchall()]
+
+    def get(self, instructor_id):
+        """Return (name, instructor_id, email, department), or None."""
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT name, instructor_id, email, department FROM instructors WHERE instructor_id = ?",
+                           (instructor_id,))
+            return cursor.fetchone()
+
+    def create(self, name, instructor_id, email, department):
+        """Add an instructor and a login account (username = name, password = DEFAULT_PASSWORD).
+
+        Blocks for one bcrypt hash; GUI callers run it off the Tk thread.
+        """
+        hashed_password = Security.hash_password(self.DEFAULT_PASSWORD).decode('utf-8')
+        self._insert(name, instructor_id, email, department, hashed_password)
+
+    @coordinated
+    def _insert(self, name, instructor_id, email, department, hashed_password):
+        with self.db.writer() as cursor:
+            cursor.execute("INSERT INTO instructors (name, instructor_id, email, department) VALUES (?, ?, ?, ?)",
+                           (name, instructor_id, email, department))
+            cursor.execute("INSERT INTO users (username, password, role) VALUES (?, ?, ?)",
+                           (name, hashed_password, "Instructor"))
+            self.db.publish(InstructorsChanged("create", name, (department,)))
+
+    @coordinated
+    def update(self, instructor_id, name, email, department):
+        """Update an instructor's details; returns how many rows changed."""
+        with self.db.writer() as cursor:
+            cursor.execute("UPDATE instructors SET name=?, email=?, department=? WHERE instructor_id=?",
+                           (name, email, department, instructor_id))
+            if cursor.rowcount:
+                self.db.publish(InstructorsChanged("update", name, (department,)))
+            return cursor.rowcount
+
+    @coordinated
+    def delete(self, instructor_id):
+        """Delete an instructor; returns how many rows were deleted."""
+        with self.db.writer() as cursor:
+            cursor.execute("DELETE FROM instructors WHERE instructor_id=?", (instructor_id,))
+            if cursor.rowcount:
+                self.db.publish(InstructorsChanged("delete"))
+            return cursor.rowcount
+
+    @coordinated
+    def assign_class(self, instructor_name, class_name):
+        """Record class_name as the instructor's department; returns False if no such instructor."""
+        with self.db.writer() as cursor:
+            cursor.execute("UPDATE instructors SET department=? WHERE name=?", (class_name, instructor_name))
+            if cursor.rowcount:
+                self.db.publish(InstructorsChanged("assign_class", instructor_name, (class_name,)))
+            return cursor.rowcount > 0
@@ -0,0 +1,52 @@
+# controller/report_controller.py
+# OOP Concept: Class, Encapsulation, Composition (AttendanceReport, AttendanceSummary, CsvExporter)
+
+from StudentAttendanceTracker.model.database import Database
+from StudentAttendanceTracker.model.export import CsvExporter
+from StudentAttendanceTracker.model.reports import AttendanceReport
+from StudentAttendanceTracker.model.summary import AttendanceSummary
+
+
+class ReportController:
+    """Attendance reports, their totals, overview counts and CSV export."""
+
+    def __init__(self, db=None):
+        """Initialize with a Database (the shared one by default)."""
+        self.db = db or Database.shared()
+        self.summary = AttendanceSummary(self.db)
+
+    def report(self, instructor_username=None, class_name=None, start_date=None, end_date=None):
+        """Return an AttendanceReport for the given filters (rows are read lazily)."""
+        return AttendanceReport(self.db, instructor_username=instructor_username, class_name=class_name,
+                                start_date=start_date, end_date=end_date)
+
+    def totals(self, report):
+        """Return (present, absent) totals for a report's filters."""
+        return self.summary.totals_for(report)
+
+    def overview_counts(self):
+        """Return {table_name: row_count} for the admin overview cards."""
+        return self.summary.table_counts()
+
+    def instructor_counts(self, instructor_username):
+        """Return (students, attendance_records, classes) for one instructor's overview."""
+        return self.summary.instructor_counts(instructor_username)
+
+    def class_analytics(self, class_name, instructor_username=None):
+        """Compute one class's attendance analytics (needs NumPy).
+
+        Returns:
+            tuple: ((students, dates, overall_rate), student_rows, daily_rows), see ClassAnalytics.
+        """
+        from StudentAttendanceTracker.model.analytics import ClassAnalytics
+        analytics = ClassAnalytics.load(class_name, instructor_username=instructor_username, db=self.db)
+        students, dates = analytics.matrix.shape
+        return (students, dates, analytics.overall_rate()), analytics.student_rows(), analytics.daily_rows()
+
+    def exporter(self, report, file_path, progress=None):
+        """Return a CsvExporter for a report; call export() on it (off the Tk thread in the GUI)."""
+        return CsvExporter(report, file_path, progress=progress)
+
+    def export(self, report, file_path):
+        """Write a report to CSV (gzipped for .gz paths) and return the number of rows written."""
+        return self.exporter(report, file_path).export()
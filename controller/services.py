@@ -0,0 +1,56 @@
+# controller/services.py
+# OOP Concept: Composition, Factory Method
+
+import os
+from StudentAttendanceTracker.controller.attendance_controller import AttendanceController
+from StudentAttendanceTracker.controller.auth_controller import AuthController
+from StudentAttendanceTracker.controller.class_controller import ClassController
+from StudentAttendanceTracker.controller.instructor_controller import InstructorController
+from StudentAttendanceTracker.controller.report_controller import ReportController
+from StudentAttendanceTracker.controller.student_controller import StudentController
+from StudentAttendanceTracker.model.database import Database
+
+
+class Services:
+    """The controllers the windows use, all bound to one Database.
+
+    Services.default() returns API-backed stand-ins with the same methods
+    instead when SAT_API_URL points at a running api.server (sending
+    SAT_API_TOKEN as its token, if set), so the windows
+    do not care whether they talk to the file or to the server. Either way,
+    ``events`` is the bus their writes announce changes on.
+    """
+
+    def __init__(self, db=None):
+        """Initialize every controller on db (the shared Database by default)."""
+        self.db = db or Database.shared()
+        self.events = self.db.events
+        self.auth = AuthController(self.db)
+        self.students = StudentController(self.db)
+        self.classes = ClassController(self.db)
+        self.instructors = InstructorController(self.db)
+        self.attendance = AttendanceController(self.db)
+        self.reports = ReportController(self.db)
+
+    def data_version(self):
+        """Return a value that changes when another process commits, or None if unknown (see PaneStack)."""
+        return self.db.external_version()
+
+    def close(self):
+        """Release the controllers' event subscriptions on the shared Database (e.g. at logout)."""
+        self.students.close()
+        self.classes.close()
+
+    @staticmethod
+    def api_url():
+        """Return the SAT_API_URL server address, or None to use the database file directly."""
+        return os.environ.get("SAT_API_URL") or None
+
+    @classmethod
+    def default(cls):
+        """Remote services when SAT_API_URL is set, otherwise local ones on the shared Database."""
+        url = cls.api_url()
+        if url:
+            from StudentAttendanceTracker.api.client import RemoteServices
+            return RemoteServices(url, token=os.environ.get("SAT_API_TOKEN") or None)
+        return cls()
@@ -0,0 +1,156 @@
+# controller/student_controller.py
+# OOP Concept: Class, Encapsulation, Composition (Database, StudentSearch, RosterImporter, TableListing, LookupCache)
+
+from StudentAttendanceTracker.model.database import Database
+from StudentAttendanceTracker.model.events import StudentsChanged
+from StudentAttendanceTracker.model.listing import TableListing
+from StudentAttendanceTracker.model.lookup_cache import LookupCache
+from StudentAttendanceTracker.model.roster_import import RosterImporter
+from StudentAttendanceTracker.model.student_search import StudentSearch
+from StudentAttendanceTracker.model.write_coordinator import coordinated
+
+
+class StudentController:
+    """Student records: listing, lookup, add/edit/delete, search and roster import.
+
+    Most methods take an optional instructor_username; when given, the call
+    only sees or changes that instructor's students. page() covers every
+    student, for the admin's View All table. class_names() is cached per
+    instructor until a StudentsChanged event for that instructor arrives.
+    """
+
+    def __init__(self, db=None):
+        """Initialize with a Database (the shared one by default)."""
+        self.db = db or Database.shared()
+        self.student_search = StudentSearch(self.db)
+        self.listing = TableListing("students", (("roll_number", "roll_number"), ("name", "name"),
+                                                 ("email", "IFNULL(email, '')"),
+                                                 ("class_name", "IFNULL(class_name, '')")),
+                                    sortable=("roll_number", "name", "class_name"), db=self.db)
+        self.lookups = LookupCache(self.db)
+        self._unsubscribe = self.db.events.subscribe(StudentsChanged, self._students_changed)
+
+    def close(self):
+        """Stop following change events; the controller must not be used afterwards."""
+        self._unsubscribe()
+
+    def _students_changed(self, event):
+        if event.instructor_username:
+            # Only that instructor's list and the all-students list can have changed
+            self.lookups.invalidate("class_names", event.instructor_username)
+            self.lookups.invalidate("class_names", None)
+        else:
+            self.lookups.invalidate("class_names")
+
+    @staticmethod
+    def _filters(class_name=None, instructor_username=None):
+        clauses, params = [], []
+        if class_name:
+            clauses.append("class_name = ?")
+            params.append(class_name)
+        if instructor_username:
+            clauses.append("instructor_username = ?")
+            params.append(instructor_username)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), tuple(params)
+
+    def list_students(self, class_name=None, instructor_username=None):
+        """Return (name, roll_number) for every matching student."""
+        where, params = self._filters(class_name, instructor_username)
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT name, roll_number FROM students" + where, params)
+            return cursor.fetchall()
+
+    def list_details(self, class_name=None, instructor_username=None):
+        """Return (roll_number, name, email, class_name) for every matching student."""
+        where, params = self._filters(class_name, instructor_username)
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT roll_number, name, email, class_name FROM students" + where, params)
+            return cursor.fetchall()
+
+    def page(self, after=None, limit=200, sort=None, descending=False):
+        """Fetch one page of the View All students table (see TableListing.page)."""
+        return self.listing.page(after, limit, sort, descending)
+
+    def class_names(self, instructor_username=None):
+        """Return the distinct class names students are enrolled in, alphabetically."""
+        return list(self.lookups.get(("class_names", instructor_username or None),
+                                     lambda: self._read_class_names(instructor_username)))
+
+    def _read_class_names(self, instructor_username):
+        where, params = self._filters(instructor_username=instructor_username)
+        where += (" AND" if where else " WHERE") + " class_name IS NOT NULL ORDER BY class_name"
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT DISTINCT class_name FROM students" + where, params)
+            return tuple(row[0] for row in cursor.fetchall())
+
+    def class_roster(self, class_name, instructor_username=None):
+        """Return (id, name, roll_number) for one class, as used for marking attendance."""
+        where, params = self._filters(class_name, instructor_username)
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT id, name, roll_number FROM students" + where, params)
+            return cursor.fetchall()
+
+    def roster_entries(self, instructor_username):
+        """Return (id, name, roll_number, class_name) for every student of one instructor."""
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT id, name, roll_number, class_name FROM students WHERE instructor_username = ?",
+                           (instructor_username,))
+            return cursor.fetchall()
+
+    def get(self, roll_number, instructor_username=None):
+        """Return (name, roll_number, email, class_name) for one student, or None."""
+        query, params = "SELECT name, roll_number, email, class_name FROM students WHERE roll_number = ?", [roll_number]
+        if instructor_username:
+            query += " AND instructor_username = ?"
+            params.append(instructor_username)
+        with self.db.reader() as cursor:
+            cursor.execute(query, tuple(params))
+            return cursor.fetchone()
+
+    @coordinated
+    def add(self, name, roll_number, email, class_name, instructor_username):
+        """Insert a student (raises sqlite3.IntegrityError for a duplicate roll number)."""
+        with self.db.writer() as cursor:
+            cursor.execute(
+                "INSERT INTO students (name, roll_number, email, class_name, instructor_username) VALUES (?, ?, ?, ?, ?)",
+                (name, roll_number, email, class_name, instructor_username))
+            self.db.publish(StudentsChanged("add", instructor_username, (class_name,)))
+
+    @coordinated
+    def update(self, roll_number, name, email, class_name, instructor_username=None):
+        """Update a student's details by roll number; returns how many rows changed."""
+        query, params = "UPDATE students SET name=?, email=?, class_name=? WHERE roll_number=?", [
+            name, email, class_name, roll_number]
+        if instructor_username:
+            query += " AND instructor_username=?"
+            params.append(instructor_username)
+        with self.db.writer() as cursor:
+            cursor.execute(query, tuple(params))
+            if cursor.rowcount:
+                self.db.publish(StudentsChanged("update", instructor_username, (class_name,)))
+            return cursor.rowcount
+
+    @coordinated
+    def delete(self, roll_number, instructor_username=None):
+        """Delete a student by roll number; returns how many rows were deleted."""
+        query, params = "DELETE FROM students WHERE roll_number=?", [roll_number]
+        if instructor_username:
+            query += " AND instructor_username=?"
+            params.append(instructor_username)
+        with self.db.writer() as cursor:
+            cursor.execute(query, tuple(params))
+            if cursor.rowcount:
+                self.db.publish(StudentsChanged("delete", instructor_username))
+            return cursor.rowcount
+
+    def search(self, text, class_name=None):
+        """Return (name, roll_number, class_name) matches for free text, best first."""
+        return self.student_search.search(text, class_name=class_name)
+
+    def import_file(self, file_path, instructor_username=None):
+        """Import a .csv or .jsonl roster and return its ImportResult."""
+        return RosterImporter(self.db, instructor_username=instructor_username).import_file(file_path)
+
+    def import_text(self, text, file_name, instructor_username=None):
+        """Import roster contents (named like the .csv or .jsonl file they came from) and return the ImportResult."""
+        return RosterImporter(self.db, instructor_username=instructor_username).import_text(text, file_name)
@@ -1,20 +1,70 @@
 # main.py
 # OOP Concept: Object Initialization, Class Usage
 
+import time
+
+STARTED = time.perf_counter()  # before any other import, so import cost is measured too
+
+import argparse
+import logging
+import sys
 import tkinter as tk
 from StudentAttendanceTracker.view.login_window import LoginWindow
 from StudentAttendanceTracker.model.database import Database
+from StudentAttendanceTracker.controller.services import Services
+
+
+class StartupProfile:
+    """Records time-to-first-window phases for --profile-startup."""
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.marks = [("start", STARTED)]
+
+    def mark(self, phase):
+        """Record the end of a startup phase."""
+        if self.enabled:
+            self.marks.append((phase, time.perf_counter()))
+
+    def report(self):
+        """Print each phase's duration and the running total in milliseconds."""
+        if not self.enabled:
+            return
+        print("⏱️ Startup profile")
+        print(f"   {'phase':<24}{'ms':>9}{'total ms':>11}")
+        for (_, previous), (phase, at) in zip(self.marks, self.marks[1:]):
+            print(f"   {phase:<24}{(at - previous) * 1000:>9.1f}{(at - STARTED) * 1000:>11.1f}")
+        sys.stdout.flush()
+
 
 def main():
-    # Initialize database and create tables
-    db = Database()
-    db.connect()
-    db.create_tables()
-    db.close()
+    parser = argparse.ArgumentParser(description="Student Attendance Tracker")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print how long each step takes until the login window is on screen")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    profile = StartupProfile(args.profile_startup)
+    profile.mark("imports")
+
+    if Services.api_url():
+        profile.mark("using API server")  # the server owns the database
+    else:
+        # Initialize database and apply any pending schema migrations
+        db = Database.shared()
+        db.connect()
+        profile.mark("database open")
+        applied = db.migrate()
+        profile.mark(f"schema ({len(applied)} applied)" if applied else "schema (current)")
 
     # Launch login window
     root = tk.Tk()
+    profile.mark("tk root")
     app = LoginWindow(root)
+    profile.mark("login window built")
+    if profile.enabled:
+        root.update()  # map and draw now so the report covers time to a visible window
+        profile.mark("first window drawn")
+        profile.report()
     root.mainloop()
 
 if __name__ == "__main__":
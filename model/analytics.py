@@ -0,0 +1,134 @@
+# model/analytics.py
+# OOP Concept: Class, Encapsulation, Vectorized Computation (NumPy)
+
+import numpy as np
+from StudentAttendanceTracker.model.database import Database
+
+PRESENT, ABSENT, UNMARKED = 1, 0, -1
+
+
+class ClassAnalytics:
+    """Attendance of one class as a dense students x dates matrix.
+
+    Each cell is PRESENT, ABSENT or UNMARKED. Every metric is computed with
+    whole-array NumPy operations, so a 2,000 x 200 class takes milliseconds.
+    Rows follow ``student_ids`` and columns follow ``dates``, both sorted.
+    """
+
+    def __init__(self, student_ids, names, roll_numbers, dates, matrix):
+        """Initialize from already-built arrays (see load())."""
+        self.student_ids = student_ids
+        self.names = names
+        self.roll_numbers = roll_numbers
+        self.dates = dates
+        self.matrix = matrix
+
+    @classmethod
+    def load(cls, class_name, instructor_username=None, start_date=None, end_date=None, db=None):
+        """Read one class's roster and attendance and build the matrix."""
+        db = db or Database.shared()
+        student_filter, params = "students.class_name = ?", [class_name]
+        if instructor_username:
+            student_filter += " AND students.instructor_username = ?"
+            params.append(instructor_username)
+
+        with db.reader() as cursor:
+            cursor.execute(f"SELECT id, name, roll_number FROM students WHERE {student_filter} ORDER BY id",
+                           tuple(params))
+            roster = cursor.fetchall()
+
+            query = f'''
+                SELECT attendance.student_id, attendance.date, attendance.status = 'Present'
+                FROM attendance
+                JOIN students ON attendance.student_id = students.id
+                WHERE {student_filter}
+            '''
+            if start_date and end_date:
+                query += " AND attendance.date BETWEEN ? AND ?"
+                params.extend([start_date, end_date])
+            cursor.execute(query, tuple(params))
+            marks = cursor.fetchall()
+
+        student_ids = np.array([row[0] for row in roster], dtype=np.int64)
+        names = [row[1] for row in roster]
+        roll_numbers = [row[2] for row in roster]
+
+        if marks:
+            mark_students, mark_dates, mark_present = zip(*marks)
+            mark_students = np.array(mark_students, dtype=np.int64)
+            mark_present = np.array(mark_present, dtype=bool)
+            dates, columns = np.unique(np.array(mark_dates), return_inverse=True)
+        else:
+            mark_students = np.empty(0, dtype=np.int64)
+            mark_present = np.empty(0, dtype=bool)
+            dates, columns = np.empty(0, dtype=str), np.empty(0, dtype=np.int64)
+
+        matrix = np.full((len(student_ids), len(dates)), UNMARKED, dtype=np.int8)
+        rows = np.searchsorted(student_ids, mark_students)
+        matrix[rows, columns] = np.where(mark_present, PRESENT, ABSENT)
+        return cls(student_ids, names, roll_numbers, dates, matrix)
+
+    def _counts(self, axis):
+        present = (self.matrix == PRESENT).sum(axis=axis)
+        marked = (self.matrix != UNMARKED).sum(axis=axis)
+        return present, marked
+
+    @staticmethod
+    def _rate(present, marked):
+        """Percentage present per entry; NaN where nothing was marked."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(marked > 0, 100.0 * present / marked, np.nan)
+
+    def student_percentages(self):
+        """Attendance percentage per student (NaN for students never marked)."""
+        return self._rate(*self._counts(axis=1))
+
+    def daily_rates(self):
+        """Class attendance percentage per date."""
+        return self._rate(*self._counts(axis=0))
+
+    def overall_rate(self):
+        """Attendance percentage over every marked cell."""
+        present, marked = self._counts(axis=None)
+        return float(self._rate(present, marked))
+
+    def absence_streaks(self):
+        """Return (current, longest) runs of consecutive absences per student.
+
+        Runs are counted over class dates; a present or unmarked date ends a run.
+        """
+        if self.matrix.shape[1] == 0:
+            zeros = np.zeros(len(self.student_ids), dtype=np.int64)
+            return zeros, zeros
+        absent = (self.matrix == ABSENT).astype(np.int64)
+        running = np.cumsum(absent, axis=1)
+        # The running total at the last non-absent date, carried forward, is where each run starts
+        run_start = np.maximum.accumulate(np.where(absent == 0, running, 0), axis=1)
+        run_length = running - run_start
+        return run_length[:, -1], run_length.max(axis=1)
+
+    def rolling_rates(self, days):
+        """Class attendance percentage over the trailing `days` calendar days ending at each date."""
+        present, marked = self._counts(axis=0)
+        if len(self.dates) == 0:
+            return np.empty(0)
+        day_numbers = self.dates.astype("datetime64[D]").astype(np.int64)
+        present_total = np.concatenate(([0], np.cumsum(present)))
+        marked_total = np.concatenate(([0], np.cumsum(marked)))
+        window_start = np.searchsorted(day_numbers, day_numbers - days + 1)
+        window_end = np.arange(1, len(day_numbers) + 1)
+        return self._rate(present_total[window_end] - present_total[window_start],
+                          marked_total[window_end] - marked_total[window_start])
+
+    def student_rows(self):
+        """Per-student (roll, name, percentage, current streak, longest streak), lowest attendance first."""
+        percentages = self.student_percentages()
+        current, longest = self.absence_streaks()
+        order = np.argsort(np.nan_to_num(percentages, nan=101.0), kind="stable")
+        return [(self.roll_numbers[i], self.names[i], percentages[i], int(current[i]), int(longest[i]))
+                for i in order]
+
+    def daily_rows(self):
+        """Per-date (date, rate, 7-day rate, 30-day rate), newest first."""
+        rates, week, month = self.daily_rates(), self.rolling_rates(7), self.rolling_rates(30)
+        return [(str(self.dates[i]), rates[i], week[i], month[i]) for i in range(len(self.dates) - 1, -1, -1)]
@@ -0,0 +1,79 @@
+# model/attendance.py
+# OOP Concept: Class, Encapsulation, Attendance Data Access
+
+from StudentAttendanceTracker.model.database import Database
+
+# Insert a mark, or overwrite the existing one for the same student and day.
+# Unchanged marks are left alone so re-saving a class writes nothing new.
+UPSERT_ATTENDANCE = '''
+    INSERT INTO attendance (student_id, date, status) VALUES (?, ?, ?)
+    ON CONFLICT(student_id, date) DO UPDATE SET status = excluded.status
+    WHERE attendance.status != excluded.status
+'''
+
+VALID_STATUSES = ("Present", "Absent")
+
+# Keeps "IN (?, ?, ...)" lookups well under SQLite's bound-parameter limit.
+LOOKUP_CHUNK_SIZE = 500
+
+
+class Attendance:
+    """Writes attendance marks, keeping one row per student per day."""
+
+    def __init__(self, db=None):
+        """Initialize with a Database (the shared one by default)."""
+        self.db = db or Database.shared()
+
+    def mark(self, student_id, date, status):
+        """Record a student's status for a date, replacing any earlier mark that day."""
+        with self.db.writer() as cursor:
+            cursor.execute(UPSERT_ATTENDANCE, (student_id, date, status))
+
+    def save_roster(self, date, statuses):
+        """Write a whole roster's marks for one date in a single transaction.
+
+        Args:
+            date (str): Attendance date as YYYY-MM-DD.
+            statuses (iterable): (student_id, status) pairs.
+
+        Returns:
+            list: (student_id, outcome) per input row, in input order, where outcome
+            is "inserted", "updated", "unchanged", "invalid" or "duplicate".
+        """
+        statuses = list(statuses)
+        outcomes = [None] * len(statuses)
+        latest = {}
+        for index, (student_id, status) in enumerate(statuses):
+            if status not in VALID_STATUSES:
+                outcomes[index] = (student_id, "invalid")
+                continue
+            if student_id in latest:
+                earlier = latest[student_id]
+                outcomes[earlier] = (student_id, "duplicate")
+            latest[student_id] = index
+
+        with self.db.writer() as cursor:
+            existing = {}
+            student_ids = list(latest)
+            for start in range(0, len(student_ids), LOOKUP_CHUNK_SIZE):
+                chunk = student_ids[start:start + LOOKUP_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(f"SELECT student_id, status FROM attendance "
+                               f"WHERE date=? AND student_id IN ({placeholders})", (date, *chunk))
+                existing.update(cursor.fetchall())
+
+            rows = []
+            for student_id, index in latest.items():
+                status = statuses[index][1]
+                if student_id not in existing:
+                    outcomes[index] = (student_id, "inserted")
+                elif existing[student_id] != status:
+                    outcomes[index] = (student_id, "updated")
+                else:
+                    outcomes[index] = (student_id, "unchanged")
+                    continue
+                rows.append((student_id, date, status))
+
+            cursor.executemany(UPSERT_ATTENDANCE, rows)
+
+        return outcomes
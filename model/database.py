@@ -1,90 +1,236 @@
 # model/database.py
 # OOP Concept: Class, Object, Encapsulation, Database Management
 
+import functools
+import logging
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
+from StudentAttendanceTracker.model.events import EventBus
+from StudentAttendanceTracker.model.instrumentation import QueryLog, TimedCursor
+from StudentAttendanceTracker.model.migrations import Migrator
+from StudentAttendanceTracker.model.write_coordinator import WriteCoordinator
+
+logger = logging.getLogger(__name__)
 
 class Database:
-    """Handles database connection and queries."""
+    """Handles the shared SQLite connections and queries.
+
+    One instance exists per database file. It owns a single long-lived writer
+    connection and a small pool of reader connections that views borrow
+    through ``reader()`` and ``writer()`` instead of opening their own.
+    Every statement run through those cursors is timed into ``query_log``.
+    Writes announce what they changed with publish(); ``events`` delivers
+    each announcement once its transaction has committed.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    READER_POOL_SIZE = 4
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-16000",
+    )
 
     def __init__(self, db_name="attendance.db"):
         """Initialize with database name."""
         self.db_name = db_name
         self.connection = None
+        self._write_lock = threading.RLock()
+        self._write_depth = 0  # nesting of writer() blocks; only touched while holding _write_lock
+        self._write_owner = None  # thread ident inside the outermost writer() block
+        self._coordinator = None
+        self._coordinator_lock = threading.Lock()
+        self._readers = queue.LifoQueue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+        self.events = EventBus()
+        self._pending_events = []  # published inside the open transaction; only touched while holding _write_lock
+        self.query_log = QueryLog()
+        self._cursor_factory = functools.partial(TimedCursor, log=self.query_log)
+
+    @classmethod
+    def shared(cls, db_name="attendance.db"):
+        """Return the process-wide Database for db_name, creating it on first use."""
+        with cls._instances_lock:
+            db = cls._instances.get(db_name)
+            if db is None:
+                db = cls(db_name)
+                cls._instances[db_name] = db
+            return db
+
+    def _open(self):
+        """Open and configure a new SQLite connection."""
+        connection = sqlite3.connect(self.db_name, check_same_thread=False)
+        for pragma in self.PRAGMAS:
+            connection.execute(pragma)
+        connection.set_trace_callback(self.query_log.trace)
+        return connection
 
     def connect(self):
-        """Connect to the SQLite database."""
+        """Open the long-lived writer connection if it is not already open."""
+        with self._write_lock:
+            if self.connection is not None:
+                return
+            try:
+                self.connection = self._open()
+                logger.info("✅ Database connection successful.")
+            except sqlite3.Error as e:
+                logger.error("❌ Database connection failed: %s", e)
+
+    @contextmanager
+    def reader(self):
+        """Borrow a pooled read connection and yield a cursor on it."""
+        connection = self._acquire_reader()
+        cursor = connection.cursor(self._cursor_factory)
         try:
-            self.connection = sqlite3.connect(self.db_name)
-            print("✅ Database connection successful.")
-        except sqlite3.Error as e:
-            print(f"❌ Database connection failed: {e}")
+            yield cursor
+        finally:
+            cursor.close()
+            if connection.in_transaction:
+                connection.rollback()
+            self._readers.put(connection)
 
-    def create_tables(self):
-        """Create all necessary tables."""
+    @contextmanager
+    def writer(self):
+        """Yield a cursor on the writer connection inside one transaction.
+
+        Commits when the block exits normally and rolls back on any exception.
+        A writer() block opened inside another one on the same thread becomes a
+        savepoint: its failure undoes only its own changes, and nothing is
+        committed until the outermost block exits. That lets a caller
+        group-commit many independent writes in one transaction.
+        """
+        self.connect()
+        committed = []
+        with self._write_lock:
+            depth = self._write_depth
+            self._write_depth += 1
+            self._write_owner = threading.get_ident()
+            first_event = len(self._pending_events)
+            cursor = self.connection.cursor(self._cursor_factory)
+            try:
+                if depth:
+                    if not self.connection.in_transaction:
+                        cursor.execute("BEGIN")  # so releasing the savepoint does not commit
+                    cursor.execute(f"SAVEPOINT writer_{depth}")
+                yield cursor
+                if depth:
+                    cursor.execute(f"RELEASE writer_{depth}")
+                else:
+                    self.connection.commit()
+                    committed, self._pending_events = self._pending_events, []
+            except BaseException:
+                del self._pending_events[first_event:]  # the changes they describe were undone
+                if depth:
+                    cursor.execute(f"ROLLBACK TO writer_{depth}")
+                    cursor.execute(f"RELEASE writer_{depth}")
+                else:
+                    self.connection.rollback()
+                raise
+            finally:
+                cursor.close()
+                self._write_depth -= 1
+                if not self._write_depth:
+                    self._write_owner = None
+        for event in committed:  # outside the lock, so handlers may read or write freely
+            self.events.publish(event)
+
+    def publish(self, event):
+        """Announce a change on ``events``: now, or when the enclosing writer() block commits.
+
+        Inside a writer() block the event waits for the outermost commit and is
+        dropped if its own block (savepoint) or the transaction is rolled back,
+        so subscribers only ever hear about changes that are really stored.
+        """
+        if self.in_writer():
+            self._pending_events.append(event)
+        else:
+            self.events.publish(event)
+
+    def external_version(self):
+        """Return a number that changes whenever another process commits to the file.
+
+        This process's own commits do not change it (they are announced on
+        ``events`` instead). Returns None, meaning "unknown, assume unchanged",
+        while another thread holds the writer, rather than waiting for it.
+        """
+        if not self._write_lock.acquire(blocking=False):
+            return None
         try:
-            cursor = self.connection.cursor()
-
-            # Students Table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS students (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    roll_number TEXT UNIQUE NOT NULL,
-                    email TEXT,
-                    class_name TEXT,
-                    photo BLOB,
-                    instructor_username TEXT
-                )
-            ''')
-
-            # Users Table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    username TEXT UNIQUE NOT NULL,
-                    password TEXT NOT NULL,
-                    role TEXT NOT NULL
-                )
-            ''')
-
-            # Attendance Table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS attendance (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    student_id INTEGER NOT NULL,
-                    date TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    FOREIGN KEY(student_id) REFERENCES students(id)
-                )
-            ''')
-
-            # Instructors Table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS instructors (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    instructor_id TEXT UNIQUE NOT NULL,
-                    email TEXT,
-                    department TEXT
-                )
-            ''')
-
-            # Classes Table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS classes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    class_name TEXT UNIQUE NOT NULL
-                )
-            ''')
-
-            self.connection.commit()
-            print("✅ All tables created successfully.")
-        except sqlite3.Error as e:
-            print(f"❌ Error creating tables: {e}")
+            self.connect()  # re-enters the lock just taken, so this cannot wait either
+            if self.connection is None:
+                return None
+            return self.connection.execute("PRAGMA data_version").fetchone()[0]
+        finally:
+            self._write_lock.release()
 
-    def close(self):
-        """Close the database connection."""
-        if self.connection:
-            self.connection.close()
-            print("✅ Database connection closed.")
+    def in_writer(self):
+        """True if the calling thread is inside a writer() block."""
+        return self._write_owner == threading.get_ident()
+
+    @property
+    def coordinator(self):
+        """The WriteCoordinator that controllers send their writes through (created on first use)."""
+        with self._coordinator_lock:
+            if self._coordinator is None:
+                self._coordinator = WriteCoordinator(self)
+            return self._coordinator
+
+    def _acquire_reader(self):
+        """Take an idle reader from the pool, opening one while under the limit."""
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._reader_lock:
+            if self._reader_count < self.READER_POOL_SIZE:
+                connection = self._open()  # counted only once open, so a failure does not shrink the pool
+                self._reader_count += 1
+                return connection
+        return self._readers.get()
 
+    def migrate(self):
+        """Bring the schema up to date, skipping all DDL when it is already current.
+
+        Returns:
+            list: Migration versions applied by this call.
+        """
+        self.connect()
+        with self._write_lock:
+            migrator = Migrator(self.connection)
+            if migrator.is_current():
+                return []
+            try:
+                return migrator.migrate()
+            except sqlite3.Error as e:
+                logger.error("❌ Error migrating schema: %s", e)
+                return []
+
+    def create_tables(self):
+        """Create all necessary tables (kept for callers that predate migrate())."""
+        self.migrate()
+
+    def close(self):
+        """Close the writer and every pooled reader connection."""
+        with self._coordinator_lock:
+            coordinator, self._coordinator = self._coordinator, None  # the next write starts a fresh one
+        if coordinator:
+            coordinator.close()  # commit whatever is still queued first
+        with self._write_lock:
+            if self.connection:
+                self.connection.close()
+                self.connection = None
+                logger.info("✅ Database connection closed.")
+        with self._reader_lock:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+            self._reader_count = 0
@@ -0,0 +1,79 @@
+# model/events.py
+# OOP Concept: Inheritance (event types), Encapsulation, Publish/Subscribe (Observer)
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class DataChanged:
+    """A committed change to one kind of record; subscribe to a subclass to hear only that kind.
+
+    Attributes:
+        action (str): The controller method that made the change, e.g. "add" or "save_roster".
+        instructor_username (str): Whose records changed, or None if unknown or several.
+        class_names (tuple): Classes the change touched, empty if unknown.
+    """
+
+    def __init__(self, action, instructor_username=None, class_names=()):
+        self.action = action
+        self.instructor_username = instructor_username
+        self.class_names = tuple(class_names)
+
+    def __repr__(self):
+        return (f"{type(self).__name__}({self.action!r}, instructor_username={self.instructor_username!r}, "
+                f"class_names={self.class_names!r})")
+
+
+class StudentsChanged(DataChanged):
+    """Students were added, edited, deleted or imported."""
+
+
+class ClassesChanged(DataChanged):
+    """The class list changed (class_names holds the old and new names of a rename)."""
+
+
+class InstructorsChanged(DataChanged):
+    """Instructor records changed (including their department / assigned class)."""
+
+
+class AttendanceChanged(DataChanged):
+    """Attendance marks were saved."""
+
+
+class EventBus:
+    """Delivers DataChanged events to whoever subscribed to their type.
+
+    Handlers run on the publishing thread, which for controller writes is the
+    database writer thread right after the commit, so they must be quick and
+    must not touch Tk (see BackgroundWorker.listen). A handler that raises is
+    logged and skipped; it never fails the write that published the event.
+    """
+
+    def __init__(self):
+        self._handlers = {}  # event type -> [handler]
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_type, handler):
+        """Call handler(event) for every published event_type (or subclass); returns an unsubscribe function."""
+        with self._lock:
+            self._handlers.setdefault(event_type, []).append(handler)
+
+        def unsubscribe():
+            with self._lock:
+                handlers = self._handlers.get(event_type, [])
+                if handler in handlers:
+                    handlers.remove(handler)
+        return unsubscribe
+
+    def publish(self, event):
+        """Call the handlers of event's type and of each of its base types."""
+        with self._lock:
+            handlers = [handler for event_type in type(event).__mro__
+                        for handler in self._handlers.get(event_type, ())]
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception as e:
+                logger.error("❌ Handler for %r failed: %s", event, e)
@@ -0,0 +1,76 @@
+# model/export.py
+# OOP Concept: Class, Encapsulation, Streaming File Output
+
+import csv
+import gzip
+import os
+import threading
+
+
+class ExportCancelled(Exception):
+    """Raised when an export is cancelled before it finishes."""
+
+
+class CsvExporter:
+    """Streams an AttendanceReport to a CSV file (gzip-compressed for .gz paths).
+
+    Rows are written chunk by chunk from the database cursor, so memory use is
+    constant. Output goes to a temporary ".part" file that only replaces the
+    target once the export completes; a cancelled or failed export leaves
+    nothing behind. ``rows_written`` and ``total_rows`` may be read from
+    another thread to show progress.
+    """
+
+    CHUNK_SIZE = 5000
+
+    def __init__(self, report, file_path, compress=None, progress=None):
+        """Initialize the exporter.
+
+        Args:
+            report (AttendanceReport): Filter whose rows are exported.
+            file_path (str): Destination path.
+            compress (bool): Gzip the output; defaults to True for paths ending in ".gz".
+            progress (callable): Optional progress(rows_written, total_rows) called after each chunk.
+        """
+        self.report = report
+        self.file_path = file_path
+        self.compress = file_path.endswith(".gz") if compress is None else compress
+        self.progress = progress
+        self.rows_written = 0
+        self.total_rows = None
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Ask a running export to stop after the current chunk."""
+        self._cancel_event.set()
+
+    def _open(self, path):
+        if self.compress:
+            return gzip.open(path, mode="wt", newline="", encoding="utf-8")
+        return open(path, mode="w", newline="", encoding="utf-8")
+
+    def export(self):
+        """Write the report and return the number of data rows written.
+
+        Raises:
+            ExportCancelled: If cancel() was called before the export finished.
+        """
+        self.total_rows = self.report.count()
+        temp_path = self.file_path + ".part"
+        try:
+            with self._open(temp_path) as file:
+                writer = csv.writer(file)
+                writer.writerow(self.report.COLUMNS)
+                for rows in self.report.iter_chunks(self.CHUNK_SIZE):
+                    if self._cancel_event.is_set():
+                        raise ExportCancelled("Export cancelled.")
+                    writer.writerows(rows)
+                    self.rows_written += len(rows)
+                    if self.progress:
+                        self.progress(self.rows_written, self.total_rows)
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return self.rows_written
@@ -0,0 +1,202 @@
+# model/instrumentation.py
+# OOP Concept: Class, Inheritance (sqlite3.Cursor), Encapsulation, Ring Buffers
+
+import collections
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+APP_PACKAGE = "StudentAttendanceTracker."
+# Frames in these modules are plumbing, never the "caller" of a query
+PLUMBING_MODULES = ("StudentAttendanceTracker.model.database", "StudentAttendanceTracker.model.instrumentation",
+                    "contextlib")
+# Statements that have no useful query plan
+NO_PLAN_PREFIXES = ("PRAGMA", "BEGIN", "COMMIT", "ROLLBACK", "ANALYZE", "CREATE", "DROP", "ALTER", "VACUUM")
+
+
+def find_caller():
+    """Name the code that issued the current query, e.g. "AdminDashboard.load_students".
+
+    Prefers the nearest view or controller frame, so a query run by a model
+    on behalf of a dashboard is attributed to the dashboard method; otherwise
+    the nearest frame outside the database plumbing.
+    """
+    frame = sys._getframe(2)
+    fallback = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith(PLUMBING_MODULES):
+            name = getattr(frame.f_code, "co_qualname", frame.f_code.co_name).replace(".<locals>", "")
+            if module.startswith((APP_PACKAGE + "view.", APP_PACKAGE + "controller.")):
+                return name
+            if fallback is None:
+                fallback = f"{module.rsplit('.', 1)[-1]}.{name}"
+        frame = frame.f_back
+    return fallback or "?"
+
+
+class QueryRecord:
+    """One timed statement: SQL, duration, caller and, when slow, its query plan."""
+
+    __slots__ = ("sql", "caller", "thread", "started_at", "elapsed_ms", "rows", "batch", "statements", "plan",
+                 "_params")
+
+    def __init__(self, sql, caller, params, batch=None):
+        self.sql = " ".join(sql.split())
+        self.caller = caller
+        self.thread = threading.current_thread().name
+        self.started_at = time.time()
+        self.elapsed_ms = 0.0
+        self.rows = 0  # rows fetched, or rows changed by INSERT/UPDATE/DELETE
+        self.batch = batch  # parameter sets for executemany, None for execute
+        self.statements = 0  # statement starts SQLite traced, including each trigger program run
+        self.plan = None
+        self._params = params
+
+
+class QueryLog:
+    """Thread-safe ring buffers of recent and slow statements plus per-caller totals.
+
+    A statement is slow when execute plus fetch time reaches SLOW_QUERY_MS
+    (SAT_SLOW_QUERY_MS environment variable, default 50). Slow statements
+    also keep their EXPLAIN QUERY PLAN output. Parameters are only held
+    until the plan is taken and are never stored, since some are password
+    hashes.
+    """
+
+    SLOW_QUERY_MS = float(os.environ.get("SAT_SLOW_QUERY_MS", "50"))
+    RECENT_SIZE = 300
+    SLOW_SIZE = 100
+
+    def __init__(self):
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.recent = collections.deque(maxlen=self.RECENT_SIZE)
+        self.slow = collections.deque(maxlen=self.SLOW_SIZE)
+        self._callers = {}  # caller -> [count, total_ms, max_ms]
+        self.total_queries = 0
+
+    @property
+    def active(self):
+        """The record of the statement running on this thread, if any."""
+        return getattr(self._local, "record", None)
+
+    @active.setter
+    def active(self, record):
+        self._local.record = record
+
+    def trace(self, statement):
+        """sqlite3 trace callback: count statement starts, so trigger work shows up per query.
+
+        The text is ignored because it is expanded with the bound parameters.
+        """
+        record = self.active
+        if record is not None:
+            record.statements += 1
+
+    def finish(self, record, connection):
+        """File a completed record, taking its query plan first if it was slow."""
+        params, record._params = record._params, None
+        slow = record.elapsed_ms >= self.SLOW_QUERY_MS
+        if slow and record.batch is None and not record.sql.upper().startswith(NO_PLAN_PREFIXES):
+            try:
+                plan = connection.execute("EXPLAIN QUERY PLAN " + record.sql, params).fetchall()
+                record.plan = [row[-1] for row in plan]
+            except sqlite3.Error as e:
+                record.plan = [f"(no plan: {e})"]
+        with self._lock:
+            self.total_queries += 1
+            self.recent.append(record)
+            if slow:
+                self.slow.append(record)
+            totals = self._callers.setdefault(record.caller, [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += record.elapsed_ms
+            totals[2] = max(totals[2], record.elapsed_ms)
+
+    def snapshot(self):
+        """Return (recent, slow, callers) copies, newest first; callers sorted by total time."""
+        with self._lock:
+            recent = list(reversed(self.recent))
+            slow = list(reversed(self.slow))
+            callers = sorted(((caller, count, total, worst) for caller, (count, total, worst) in self._callers.items()),
+                             key=lambda row: row[2], reverse=True)
+        return recent, slow, callers
+
+    def clear(self):
+        """Forget every recorded statement."""
+        with self._lock:
+            self.recent.clear()
+            self.slow.clear()
+            self._callers.clear()
+            self.total_queries = 0
+
+
+class TimedCursor(sqlite3.Cursor):
+    """Cursor that times execute and fetch calls into a QueryLog.
+
+    A statement's record stays open while its rows are fetched and is filed
+    when the next statement starts or the cursor closes.
+    """
+
+    def __init__(self, connection, log):
+        super().__init__(connection)
+        self._log = log
+        self._record = None
+
+    def _begin(self, sql, params, batch=None):
+        self._end()
+        if self._log.enabled:
+            self._record = QueryRecord(sql, find_caller(), params, batch)
+
+    def _end(self):
+        record, self._record = self._record, None
+        if record is not None:
+            if record.batch is not None or self.rowcount > 0:
+                record.rows = max(record.rows, self.rowcount)
+            self._log.finish(record, self.connection)
+
+    def _timed(self, record, call, *args):
+        if record is None:
+            return call(*args)
+        self._log.active = record
+        started = time.perf_counter()
+        try:
+            return call(*args)
+        finally:
+            record.elapsed_ms += (time.perf_counter() - started) * 1000
+            self._log.active = None
+
+    def execute(self, sql, parameters=()):
+        self._begin(sql, parameters)
+        return self._timed(self._record, super().execute, sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        seq_of_parameters = list(seq_of_parameters)
+        self._begin(sql, None, batch=len(seq_of_parameters))
+        return self._timed(self._record, super().executemany, sql, seq_of_parameters)
+
+    def fetchone(self):
+        row = self._timed(self._record, super().fetchone)
+        if row is not None and self._record is not None:
+            self._record.rows += 1
+        return row
+
+    def fetchmany(self, size=None):
+        rows = self._timed(self._record, super().fetchmany, size if size is not None else self.arraysize)
+        if self._record is not None:
+            self._record.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._timed(self._record, super().fetchall)
+        if self._record is not None:
+            self._record.rows += len(rows)
+        return rows
+
+    def close(self):
+        self._end()
+        super().close()
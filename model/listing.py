@@ -0,0 +1,62 @@
+# model/listing.py
+# OOP Concept: Class, Encapsulation, Query Building
+
+from StudentAttendanceTracker.model.database import Database
+
+
+class TableListing:
+    """A sortable listing of one table, read a page at a time.
+
+    Rows are (id, value, ...) with one value per column. Pages use keyset
+    pagination on (sort expression, id), and every sortable expression has an
+    index (see migration 6) that the page predicate seeks into, so fetching
+    any page in any order costs the same no matter how far down the table it is.
+    """
+
+    def __init__(self, table, columns, sortable, db=None):
+        """Initialize the listing.
+
+        Args:
+            table (str): Table name (trusted; never user input).
+            columns (tuple): (key, SQL expression) per displayed column.
+            sortable (tuple): Keys of the columns that can be sorted on.
+        """
+        self.db = db or Database.shared()
+        self.table = table
+        self.keys = [key for key, _ in columns]
+        self.expressions = dict(columns)
+        self.sortable = tuple(sortable)
+
+    def page(self, after=None, limit=200, sort=None, descending=False):
+        """Fetch up to limit rows that sort after the row `after` (None for the first page).
+
+        Args:
+            sort (str): Key of the column to order by (the first sortable column by default).
+            descending (bool): Largest values first.
+
+        Raises:
+            ValueError: If sort is not a sortable column.
+        """
+        query, params = self.query(after, limit, sort, descending)
+        with self.db.reader() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+    def query(self, after=None, limit=200, sort=None, descending=False):
+        """Return the (SQL, parameters) that page() runs for these arguments."""
+        sort = sort or self.sortable[0]
+        if sort not in self.sortable:
+            raise ValueError(f"Cannot sort {self.table} by {sort!r}")
+        expression = self.expressions[sort]
+        direction, comparison = ("DESC", "<") if descending else ("ASC", ">")
+
+        query = f"SELECT id, {', '.join(self.expressions[key] for key in self.keys)} FROM {self.table}"
+        params = []
+        if after is not None:
+            # Not the row value (expression, id) > (?, ?), which SQLite answers with a full index scan
+            query += f" WHERE {expression} {comparison}= ? AND ({expression} {comparison} ? OR id {comparison} ?)"
+            value = after[1 + self.keys.index(sort)]
+            params.extend([value, value, after[0]])
+        query += f" ORDER BY {expression} {direction}, id {direction} LIMIT ?"
+        params.append(limit)
+        return query, tuple(params)
@@ -0,0 +1,59 @@
+# model/lookup_cache.py
+# OOP Concept: Class, Encapsulation, Caching (invalidated by change events)
+
+import threading
+from StudentAttendanceTracker.model.database import Database
+
+
+class LookupCache:
+    """Remembers the results of small, often repeated lookups such as class lists.
+
+    Entries are keyed by tuples whose first item names the lookup, e.g.
+    ("class_names", "alice"). The owner subscribes to the change events that
+    affect each lookup and calls invalidate() for just the keys they touch,
+    so e.g. saving attendance leaves every cached class list in place.
+    Commits made by other processes are not announced in this one; they are
+    spotted through Database.external_version() and clear the whole cache.
+    """
+
+    def __init__(self, db=None):
+        """Initialize an empty cache over db (the shared Database by default)."""
+        self.db = db or Database.shared()
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._version = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, load):
+        """Return the cached value for key, calling load() to fill it on a miss."""
+        version = self.db.external_version()
+        with self._lock:
+            if version is not None and version != self._version:
+                self._version = version
+                self._entries.clear()
+                self._generation += 1
+            if key in self._entries:
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            generation = self._generation
+
+        value = load()
+        with self._lock:
+            if generation == self._generation:  # an invalidation during load() makes value stale
+                self._entries[key] = value
+        return value
+
+    def invalidate(self, lookup=None, *args):
+        """Drop cached entries: all of them, every key of one lookup, or the one key (lookup, *args)."""
+        with self._lock:
+            self._generation += 1
+            if lookup is None:
+                self._entries.clear()
+            elif args:
+                self._entries.pop((lookup, *args), None)
+            else:
+                for key in [key for key in self._entries if key[0] == lookup]:
+                    del self._entries[key]
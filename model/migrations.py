@@ -0,0 +1,336 @@
+# model/migrations.py
+# OOP Concept: Encapsulation, Ordered Schema Versions
+
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+
+def create_student_search(connection):
+    """Create the FTS5 index over students and the triggers that keep it in sync.
+
+    SQLite builds without FTS5 skip this step; student search then falls back
+    to LIKE prefix matching.
+    """
+    try:
+        connection.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS students_fts USING fts5(
+                name, roll_number, email,
+                content='students', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )
+        ''')
+    except sqlite3.OperationalError as e:
+        logger.warning("⚠️ Full-text search unavailable, using LIKE search instead: %s", e)
+        return
+
+    connection.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_students_fts_insert AFTER INSERT ON students
+        BEGIN
+            INSERT INTO students_fts (rowid, name, roll_number, email)
+            VALUES (NEW.id, NEW.name, NEW.roll_number, NEW.email);
+        END
+    ''')
+    connection.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_students_fts_delete AFTER DELETE ON students
+        BEGIN
+            INSERT INTO students_fts (students_fts, rowid, name, roll_number, email)
+            VALUES ('delete', OLD.id, OLD.name, OLD.roll_number, OLD.email);
+        END
+    ''')
+    connection.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_students_fts_update AFTER UPDATE OF name, roll_number, email ON students
+        BEGIN
+            INSERT INTO students_fts (students_fts, rowid, name, roll_number, email)
+            VALUES ('delete', OLD.id, OLD.name, OLD.roll_number, OLD.email);
+            INSERT INTO students_fts (rowid, name, roll_number, email)
+            VALUES (NEW.id, NEW.name, NEW.roll_number, NEW.email);
+        END
+    ''')
+    connection.execute("INSERT INTO students_fts (students_fts) VALUES ('rebuild')")
+
+
+# Each migration is (version, description, statements). Versions are applied in
+# order and recorded in PRAGMA user_version, so an existing attendance.db is
+# upgraded in place and a current one is left untouched. A statement may also
+# be a callable taking the connection, for steps that need logic.
+MIGRATIONS = [
+    (1, "Create base tables", [
+        '''
+        CREATE TABLE IF NOT EXISTS students (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            roll_number TEXT UNIQUE NOT NULL,
+            email TEXT,
+            class_name TEXT,
+            photo BLOB,
+            instructor_username TEXT
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password TEXT NOT NULL,
+            role TEXT NOT NULL
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS attendance (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            status TEXT NOT NULL,
+            FOREIGN KEY(student_id) REFERENCES students(id)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS instructors (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            instructor_id TEXT UNIQUE NOT NULL,
+            email TEXT,
+            department TEXT
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS classes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            class_name TEXT UNIQUE NOT NULL
+        )
+        ''',
+    ]),
+    (2, "Index the report and roster lookups", [
+        "CREATE INDEX IF NOT EXISTS idx_attendance_student_date ON attendance(student_id, date)",
+        "CREATE INDEX IF NOT EXISTS idx_attendance_date ON attendance(date)",
+        "CREATE INDEX IF NOT EXISTS idx_students_instructor_class ON students(instructor_username, class_name)",
+        "CREATE INDEX IF NOT EXISTS idx_students_class ON students(class_name)",
+        "ANALYZE",
+    ]),
+    (3, "One attendance row per student per day", [
+        # Keep the most recent mark for each (student, date) before enforcing uniqueness.
+        '''
+        DELETE FROM attendance
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM attendance GROUP BY student_id, date
+        )
+        ''',
+        "DROP INDEX IF EXISTS idx_attendance_student_date",
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_attendance_student_date ON attendance(student_id, date)",
+    ]),
+    (4, "Pre-aggregated attendance summaries kept current by triggers", [
+        '''
+        CREATE TABLE IF NOT EXISTS table_counts (
+            name TEXT PRIMARY KEY,
+            row_count INTEGER NOT NULL
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS attendance_daily_summary (
+            instructor_username TEXT NOT NULL,
+            class_name TEXT NOT NULL,
+            date TEXT NOT NULL,
+            present INTEGER NOT NULL DEFAULT 0,
+            absent INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (instructor_username, class_name, date)
+        ) WITHOUT ROWID
+        ''',
+        "CREATE INDEX IF NOT EXISTS idx_daily_summary_class_date ON attendance_daily_summary(class_name, date)",
+        '''
+        CREATE TABLE IF NOT EXISTS student_attendance_summary (
+            student_id INTEGER PRIMARY KEY,
+            present INTEGER NOT NULL DEFAULT 0,
+            absent INTEGER NOT NULL DEFAULT 0
+        )
+        ''',
+
+        # Backfill from existing data
+        '''
+        INSERT OR REPLACE INTO table_counts (name, row_count)
+        VALUES ('students', (SELECT COUNT(*) FROM students)),
+               ('instructors', (SELECT COUNT(*) FROM instructors)),
+               ('classes', (SELECT COUNT(*) FROM classes)),
+               ('attendance', (SELECT COUNT(*) FROM attendance))
+        ''',
+        '''
+        INSERT OR REPLACE INTO attendance_daily_summary (instructor_username, class_name, date, present, absent)
+        SELECT COALESCE(students.instructor_username, ''), COALESCE(students.class_name, ''), attendance.date,
+               SUM(attendance.status = 'Present'), SUM(attendance.status = 'Absent')
+        FROM attendance
+        JOIN students ON attendance.student_id = students.id
+        GROUP BY 1, 2, 3
+        ''',
+        '''
+        INSERT OR REPLACE INTO student_attendance_summary (student_id, present, absent)
+        SELECT student_id, SUM(status = 'Present'), SUM(status = 'Absent')
+        FROM attendance
+        GROUP BY student_id
+        ''',
+
+        # Row counts for the overview cards
+        *[f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_count_insert AFTER INSERT ON {table}
+        BEGIN
+            UPDATE table_counts SET row_count = row_count + 1 WHERE name = '{table}';
+        END
+        ''' for table in ("students", "instructors", "classes", "attendance")],
+        *[f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_count_delete AFTER DELETE ON {table}
+        BEGIN
+            UPDATE table_counts SET row_count = row_count - 1 WHERE name = '{table}';
+        END
+        ''' for table in ("students", "instructors", "classes", "attendance")],
+
+        # Attendance writes adjust the per-day and per-student totals
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_attendance_summary_insert AFTER INSERT ON attendance
+        BEGIN
+            INSERT INTO attendance_daily_summary (instructor_username, class_name, date, present, absent)
+            SELECT COALESCE(instructor_username, ''), COALESCE(class_name, ''), NEW.date,
+                   NEW.status = 'Present', NEW.status = 'Absent'
+            FROM students WHERE id = NEW.student_id
+            ON CONFLICT (instructor_username, class_name, date) DO UPDATE SET
+                present = present + excluded.present, absent = absent + excluded.absent;
+            INSERT INTO student_attendance_summary (student_id, present, absent)
+            VALUES (NEW.student_id, NEW.status = 'Present', NEW.status = 'Absent')
+            ON CONFLICT (student_id) DO UPDATE SET
+                present = present + excluded.present, absent = absent + excluded.absent;
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_attendance_summary_delete AFTER DELETE ON attendance
+        BEGIN
+            UPDATE attendance_daily_summary
+            SET present = present - (OLD.status = 'Present'), absent = absent - (OLD.status = 'Absent')
+            WHERE (instructor_username, class_name) = (
+                SELECT COALESCE(instructor_username, ''), COALESCE(class_name, '')
+                FROM students WHERE id = OLD.student_id)
+              AND date = OLD.date;
+            UPDATE student_attendance_summary
+            SET present = present - (OLD.status = 'Present'), absent = absent - (OLD.status = 'Absent')
+            WHERE student_id = OLD.student_id;
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_attendance_summary_update AFTER UPDATE OF student_id, date, status ON attendance
+        BEGIN
+            UPDATE attendance_daily_summary
+            SET present = present - (OLD.status = 'Present'), absent = absent - (OLD.status = 'Absent')
+            WHERE (instructor_username, class_name) = (
+                SELECT COALESCE(instructor_username, ''), COALESCE(class_name, '')
+                FROM students WHERE id = OLD.student_id)
+              AND date = OLD.date;
+            UPDATE student_attendance_summary
+            SET present = present - (OLD.status = 'Present'), absent = absent - (OLD.status = 'Absent')
+            WHERE student_id = OLD.student_id;
+            INSERT INTO attendance_daily_summary (instructor_username, class_name, date, present, absent)
+            SELECT COALESCE(instructor_username, ''), COALESCE(class_name, ''), NEW.date,
+                   NEW.status = 'Present', NEW.status = 'Absent'
+            FROM students WHERE id = NEW.student_id
+            ON CONFLICT (instructor_username, class_name, date) DO UPDATE SET
+                present = present + excluded.present, absent = absent + excluded.absent;
+            INSERT INTO student_attendance_summary (student_id, present, absent)
+            VALUES (NEW.student_id, NEW.status = 'Present', NEW.status = 'Absent')
+            ON CONFLICT (student_id) DO UPDATE SET
+                present = present + excluded.present, absent = absent + excluded.absent;
+        END
+        ''',
+
+        # Moving a student to another class or instructor moves their history with them,
+        # matching the report queries, which join on the student's current class.
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_students_summary_move AFTER UPDATE OF class_name, instructor_username ON students
+        WHEN COALESCE(OLD.class_name, '') != COALESCE(NEW.class_name, '')
+          OR COALESCE(OLD.instructor_username, '') != COALESCE(NEW.instructor_username, '')
+        BEGIN
+            UPDATE attendance_daily_summary
+            SET present = present - (SELECT COUNT(*) FROM attendance WHERE student_id = OLD.id
+                                     AND date = attendance_daily_summary.date AND status = 'Present'),
+                absent = absent - (SELECT COUNT(*) FROM attendance WHERE student_id = OLD.id
+                                   AND date = attendance_daily_summary.date AND status = 'Absent')
+            WHERE instructor_username = COALESCE(OLD.instructor_username, '')
+              AND class_name = COALESCE(OLD.class_name, '')
+              AND date IN (SELECT date FROM attendance WHERE student_id = OLD.id);
+            INSERT INTO attendance_daily_summary (instructor_username, class_name, date, present, absent)
+            SELECT COALESCE(NEW.instructor_username, ''), COALESCE(NEW.class_name, ''), date,
+                   status = 'Present', status = 'Absent'
+            FROM attendance WHERE student_id = NEW.id
+            ON CONFLICT (instructor_username, class_name, date) DO UPDATE SET
+                present = present + excluded.present, absent = absent + excluded.absent;
+        END
+        ''',
+        # Deleted students drop out of the reports, so they drop out of the summaries too.
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_students_summary_delete AFTER DELETE ON students
+        BEGIN
+            UPDATE attendance_daily_summary
+            SET present = present - (SELECT COUNT(*) FROM attendance WHERE student_id = OLD.id
+                                     AND date = attendance_daily_summary.date AND status = 'Present'),
+                absent = absent - (SELECT COUNT(*) FROM attendance WHERE student_id = OLD.id
+                                   AND date = attendance_daily_summary.date AND status = 'Absent')
+            WHERE instructor_username = COALESCE(OLD.instructor_username, '')
+              AND class_name = COALESCE(OLD.class_name, '')
+              AND date IN (SELECT date FROM attendance WHERE student_id = OLD.id);
+            DELETE FROM student_attendance_summary WHERE student_id = OLD.id;
+        END
+        ''',
+    ]),
+    (5, "Full-text search over student name, roll number and email", [
+        create_student_search,
+    ]),
+    (6, "Index the sortable columns of the View All tables", [
+        # Nullable columns sort by IFNULL(column, ''), so their index is on that expression
+        "CREATE INDEX IF NOT EXISTS idx_students_name ON students(name)",
+        "CREATE INDEX IF NOT EXISTS idx_students_class_sort ON students(IFNULL(class_name, ''))",
+        "CREATE INDEX IF NOT EXISTS idx_instructors_name ON instructors(name)",
+        "CREATE INDEX IF NOT EXISTS idx_instructors_department_sort ON instructors(IFNULL(department, ''))",
+        "ANALYZE",
+    ]),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+class Migrator:
+    """Applies pending schema migrations to one SQLite connection."""
+
+    def __init__(self, connection):
+        """Initialize with an open sqlite3 connection."""
+        self.connection = connection
+
+    def current_version(self):
+        """Return the schema version stored in the database file."""
+        return self.connection.execute("PRAGMA user_version").fetchone()[0]
+
+    def is_current(self):
+        """Return True when no migration is pending."""
+        return self.current_version() >= SCHEMA_VERSION
+
+    def migrate(self):
+        """Apply every pending migration, each in its own transaction.
+
+        Returns:
+            list: Versions that were applied (empty when already current).
+        """
+        applied = []
+        version = self.current_version()
+        for target, description, statements in MIGRATIONS:
+            if target <= version:
+                continue
+            try:
+                self.connection.execute("BEGIN IMMEDIATE")
+                for statement in statements:
+                    if callable(statement):
+                        statement(self.connection)
+                    else:
+                        self.connection.execute(statement)
+                self.connection.execute(f"PRAGMA user_version = {int(target)}")
+                self.connection.execute("COMMIT")
+            except sqlite3.Error:
+                if self.connection.in_transaction:
+                    self.connection.execute("ROLLBACK")
+                raise
+            logger.info("✅ Applied migration %s: %s", target, description)
+            applied.append(target)
+        return applied
@@ -0,0 +1,93 @@
+# model/reports.py
+# OOP Concept: Class, Encapsulation, Query Building
+
+from StudentAttendanceTracker.model.database import Database
+
+
+class AttendanceReport:
+    """A filtered, newest-first listing of attendance joined to students.
+
+    Rows are read a page at a time with keyset pagination on
+    (attendance.date, attendance.id), so fetching any page costs the same
+    no matter how far into the history it is.
+    """
+
+    COLUMNS = ("Date", "Student Name", "Roll Number", "Status")
+
+    def __init__(self, db=None, instructor_username=None, class_name=None, start_date=None, end_date=None):
+        """Initialize with optional instructor, class and inclusive date range filters."""
+        self.db = db or Database.shared()
+        self.instructor_username = instructor_username
+        self.class_name = class_name
+        self.start_date = start_date
+        self.end_date = end_date
+
+    def _filters(self):
+        """Return the WHERE clauses and parameters for the active filters."""
+        clauses, params = [], []
+        if self.instructor_username:
+            clauses.append("students.instructor_username = ?")
+            params.append(self.instructor_username)
+        if self.class_name:
+            clauses.append("students.class_name = ?")
+            params.append(self.class_name)
+        if self.start_date and self.end_date:
+            clauses.append("attendance.date BETWEEN ? AND ?")
+            params.extend([self.start_date, self.end_date])
+        return clauses, params
+
+    def _select(self, columns, clauses):
+        """Build the report SELECT for the given columns and WHERE clauses."""
+        query = f'''
+            SELECT {columns}
+            FROM attendance
+            JOIN students ON attendance.student_id = students.id
+        '''
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        return query
+
+    def page(self, after=None, limit=200):
+        """Fetch up to limit rows that sort after the row `after` (None for the first page).
+
+        Returns:
+            list: (attendance_id, date, name, roll_number, status) tuples.
+        """
+        clauses, params = self._filters()
+        if after is not None:
+            clauses.append("(attendance.date, attendance.id) < (?, ?)")
+            params.extend([after[1], after[0]])
+
+        query = self._select("attendance.id, attendance.date, students.name, students.roll_number, "
+                             "attendance.status", clauses)
+        query += " ORDER BY attendance.date DESC, attendance.id DESC LIMIT ?"
+        params.append(limit)
+
+        with self.db.reader() as cursor:
+            cursor.execute(query, tuple(params))
+            return cursor.fetchall()
+
+    def count(self):
+        """Return the number of rows matching the filters."""
+        clauses, params = self._filters()
+        with self.db.reader() as cursor:
+            cursor.execute(self._select("COUNT(*)", clauses), tuple(params))
+            return cursor.fetchone()[0]
+
+    def iter_chunks(self, chunk_size=2000):
+        """Yield every matching row as (date, name, roll_number, status), chunk_size rows at a time.
+
+        Rows stream straight from one cursor, so memory stays flat however
+        large the report is. The reader connection is held until iteration ends.
+        """
+        clauses, params = self._filters()
+        query = self._select("attendance.date, students.name, students.roll_number, attendance.status", clauses)
+        query += " ORDER BY attendance.date DESC, attendance.id DESC"
+
+        with self.db.reader() as cursor:
+            cursor.execute(query, tuple(params))
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
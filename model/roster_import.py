@@ -0,0 +1,187 @@
+# model/roster_import.py
+# OOP Concept: Class, Encapsulation, Streaming Validation and Batch Inserts
+
+import csv
+import io
+import json
+import time
+from StudentAttendanceTracker.model.database import Database
+from StudentAttendanceTracker.model.events import StudentsChanged
+from StudentAttendanceTracker.model.write_coordinator import coordinated
+
+# Accepted header spellings mapped to students table columns.
+FIELD_ALIASES = {
+    "name": "name",
+    "student_name": "name",
+    "roll_number": "roll_number",
+    "roll_no": "roll_number",
+    "roll": "roll_number",
+    "email": "email",
+    "class_name": "class_name",
+    "class": "class_name",
+    "instructor_username": "instructor_username",
+    "instructor": "instructor_username",
+}
+
+REQUIRED_FIELDS = ("name", "roll_number", "class_name")
+
+
+class ImportResult:
+    """Outcome of one roster import."""
+
+    def __init__(self):
+        self.inserted = 0
+        self.skipped = 0  # valid rows whose roll number appeared in the database mid-import
+        self.rejected = []  # (line_number, reason)
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self):
+        """Accepted rows processed per second."""
+        return (self.inserted + self.skipped) / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self):
+        """Return the counts and rejections as plain JSON-friendly values."""
+        return {"inserted": self.inserted, "skipped": self.skipped, "rejected": self.rejected, "elapsed": self.elapsed}
+
+    @classmethod
+    def from_dict(cls, values):
+        """Rebuild a result from as_dict() output."""
+        result = cls()
+        result.inserted = values["inserted"]
+        result.skipped = values["skipped"]
+        result.rejected = [tuple(rejection) for rejection in values["rejected"]]
+        result.elapsed = values["elapsed"]
+        return result
+
+    def summary(self):
+        """Return a short human-readable report."""
+        return (f"Imported {self.inserted} students in {self.elapsed:.2f}s "
+                f"({self.rows_per_second:.0f} rows/s). Rejected: {len(self.rejected)}"
+                + (f", already present: {self.skipped}" if self.skipped else ""))
+
+
+class RosterImporter:
+    """Imports student rosters from CSV or JSON Lines files (or their contents).
+
+    Rows are validated in a single streaming pass. Duplicate roll numbers,
+    whether inside the file or already in the database, are caught with an
+    in-memory set before any insert runs. Accepted rows are inserted with
+    executemany, BATCH_SIZE rows per write, through the Database's
+    WriteCoordinator like every other write.
+    """
+
+    BATCH_SIZE = 5000
+
+    def __init__(self, db=None, instructor_username=None):
+        """Initialize the importer.
+
+        Args:
+            instructor_username (str): Owner for every imported student. When None,
+                each row must carry its own instructor_username column.
+        """
+        self.db = db or Database.shared()
+        self.instructor_username = instructor_username
+
+    def import_file(self, file_path):
+        """Import a .csv or .jsonl roster file and return an ImportResult."""
+        with open(file_path, newline="", encoding="utf-8-sig") as file:
+            return self.import_rows(self._read(file, file_path))
+
+    def import_text(self, text, file_name):
+        """Import roster contents already in memory; file_name's extension picks CSV or JSON Lines."""
+        return self.import_rows(self._read(io.StringIO(text.lstrip("\ufeff"), newline=""), file_name))
+
+    def import_rows(self, rows):
+        """Validate and insert (line_number, row_dict) pairs from any source."""
+        result = ImportResult()
+        started = time.perf_counter()
+
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT roll_number FROM students")
+            seen_rolls = {row[0] for row in cursor.fetchall()}
+
+        batch = []
+        for line_number, raw in rows:
+            record, reason = self._validate(raw, seen_rolls)
+            if reason:
+                result.rejected.append((line_number, reason))
+                continue
+            seen_rolls.add(record[1])
+            batch.append(record)
+            if len(batch) >= self.BATCH_SIZE:
+                self._insert(batch, result)
+                batch = []
+        if batch:
+            self._insert(batch, result)
+
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def _validate(self, raw, seen_rolls):
+        """Return (record, None) for a valid row or (None, reason) otherwise."""
+        if isinstance(raw, str):
+            return None, raw  # parse error reported by the reader
+        row = {}
+        for key, value in raw.items():
+            field = FIELD_ALIASES.get(str(key).strip().lower().replace(" ", "_"))
+            if field:
+                row[field] = str(value).strip() if value is not None else ""
+
+        for field in REQUIRED_FIELDS:
+            if not row.get(field):
+                return None, f"missing {field}"
+        email = row.get("email", "")
+        if email and "@" not in email:
+            return None, f"invalid email '{email}'"
+        instructor = self.instructor_username or row.get("instructor_username")
+        if not instructor:
+            return None, "missing instructor_username"
+        if row["roll_number"] in seen_rolls:
+            return None, f"duplicate roll number '{row['roll_number']}'"
+
+        return (row["name"], row["roll_number"], email, row["class_name"], instructor), None
+
+    def _insert(self, batch, result):
+        inserted = self._write_batch(batch)
+        result.inserted += inserted
+        result.skipped += len(batch) - inserted
+
+    @coordinated
+    def _write_batch(self, batch):
+        """Insert one batch on the writer thread; returns how many rows were new."""
+        with self.db.writer() as cursor:
+            cursor.executemany(
+                "INSERT OR IGNORE INTO students (name, roll_number, email, class_name, instructor_username) "
+                "VALUES (?, ?, ?, ?, ?)", batch)
+            inserted = cursor.rowcount
+            if inserted:
+                self.db.publish(StudentsChanged("import_file", self.instructor_username))
+            return inserted
+
+    @classmethod
+    def _read(cls, file, file_name):
+        if file_name.lower().endswith((".jsonl", ".ndjson")):
+            return cls._read_jsonl(file)
+        return cls._read_csv(file)
+
+    @staticmethod
+    def _read_csv(file):
+        reader = csv.DictReader(file)
+        for row in reader:
+            yield reader.line_num, row
+
+    @staticmethod
+    def _read_jsonl(file):
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, f"invalid JSON ({e.msg})"
+                continue
+            if not isinstance(row, dict):
+                yield line_number, "expected a JSON object"
+                continue
+            yield line_number, row
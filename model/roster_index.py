@@ -0,0 +1,89 @@
+# model/roster_index.py
+# OOP Concept: Class, Encapsulation, In-Memory Index (sorted arrays + bisect)
+
+from bisect import bisect_left
+from StudentAttendanceTracker.model.database import Database
+
+
+class RosterIndex:
+    """In-memory prefix index over one instructor's students.
+
+    Every student is reachable by a prefix of their roll number, their full
+    name, or any later word of their name ("smi" finds "John Smith"). Keys are
+    kept in one sorted list, so a lookup is two binary searches instead of a
+    query. Lookups never query: build() runs off the Tk thread, and until it
+    finishes they answer from the previous snapshot (the one invalidate()
+    marked stale) or find nothing. Each build replaces one immutable
+    snapshot, so lookups need no locking.
+    """
+
+    EMPTY = ([], [], [], {})
+
+    def __init__(self, instructor_username, db=None, load=None):
+        """Initialize the index for one instructor (not built until needed).
+
+        Args:
+            instructor_username (str): Whose students are indexed.
+            db (Database): Read the roster from here (the shared one by default).
+            load (callable): Optional load() returning the (id, name, roll_number, class_name)
+                rows instead, e.g. from a remote API.
+        """
+        self.db = db or Database.shared()
+        self.instructor_username = instructor_username
+        self.load = load or self._read_roster
+        self._snapshot = None  # (keys, positions, students, by_roll)
+        self._generation = 0
+
+    def build(self):
+        """Load the roster, rebuild the sorted key arrays and return the new snapshot."""
+        generation = self._generation
+        students = self.load()
+
+        entries = []
+        for position, (_, name, roll_number, _) in enumerate(students):
+            entries.append((roll_number.lower(), position))
+            words = name.lower().split()
+            for start in range(len(words)):
+                entries.append((" ".join(words[start:]), position))
+        entries.sort()
+
+        snapshot = ([key for key, _ in entries], [position for _, position in entries], students,
+                    {student[2]: student for student in students})
+        if generation == self._generation:  # an edit during the build makes this snapshot stale
+            self._snapshot = snapshot
+        return snapshot
+
+    def _read_roster(self):
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT id, name, roll_number, class_name FROM students WHERE instructor_username=?",
+                           (self.instructor_username,))
+            return cursor.fetchall()
+
+    def invalidate(self):
+        """Mark the index stale after students were added, edited or deleted; build() replaces it."""
+        self._generation += 1
+
+    def _current(self):
+        return self._snapshot or self.EMPTY
+
+    def lookup(self, prefix, limit=10):
+        """Return up to `limit` (id, name, roll_number, class_name) matching `prefix`, in key order."""
+        prefix = " ".join(prefix.lower().split())
+        if not prefix:
+            return []
+        keys, positions, students, _ = self._current()
+        start = bisect_left(keys, prefix)
+        end = bisect_left(keys, prefix + "\uffff", start)
+        matches, seen = [], set()
+        for index in range(start, end):
+            position = positions[index]
+            if position not in seen:
+                seen.add(position)
+                matches.append(students[position])
+                if len(matches) == limit:
+                    break
+        return matches
+
+    def by_roll(self, roll_number):
+        """Return the student with this roll number, or None."""
+        return self._current()[3].get(roll_number)
@@ -0,0 +1,84 @@
+# model/student_search.py
+# OOP Concept: Class, Encapsulation, Full-Text Index Queries
+
+import re
+import sqlite3
+from StudentAttendanceTracker.model.database import Database
+
+RESULT_LIMIT = 200
+
+
+class StudentSearch:
+    """Prefix search over student name, roll number and email.
+
+    Uses the ``students_fts`` FTS5 index (migration 5), ranked by bm25, so a
+    lookup stays fast however many students there are. On SQLite builds
+    without FTS5 it falls back to LIKE prefix matching.
+    """
+
+    def __init__(self, db=None):
+        """Initialize with a Database (the shared one by default)."""
+        self.db = db or Database.shared()
+        self._has_fts = None
+
+    @staticmethod
+    def match_expression(text):
+        """Turn free text into an FTS5 query: every word must match as a prefix.
+
+        Each word is quoted so punctuation in roll numbers or emails
+        ("CS-21", "a.b@x") is searched as text rather than parsed as syntax.
+        """
+        words = [word.replace('"', '""') for word in text.split()]
+        return " ".join(f'"{word}"*' for word in words)
+
+    def has_index(self):
+        """Return True when the students_fts table exists."""
+        if self._has_fts is None:
+            with self.db.reader() as cursor:
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'students_fts'")
+                self._has_fts = cursor.fetchone() is not None
+        return self._has_fts
+
+    def search(self, text, class_name=None, limit=RESULT_LIMIT):
+        """Return (name, roll_number, class_name) rows matching `text`, best match first."""
+        if not re.search(r"\w", text):
+            return []
+        if self.has_index():
+            try:
+                return self._search_fts(text, class_name, limit)
+            except sqlite3.OperationalError:
+                pass  # a query FTS5 cannot parse; LIKE still gives a sensible answer
+        return self._search_like(text, class_name, limit)
+
+    def _search_fts(self, text, class_name, limit):
+        query = '''
+            SELECT students.name, students.roll_number, students.class_name
+            FROM students_fts
+            JOIN students ON students.id = students_fts.rowid
+            WHERE students_fts MATCH ?
+        '''
+        params = [self.match_expression(text)]
+        if class_name:
+            query += " AND students.class_name = ?"
+            params.append(class_name)
+        query += " ORDER BY students_fts.rank LIMIT ?"
+        params.append(limit)
+        with self.db.reader() as cursor:
+            cursor.execute(query, tuple(params))
+            return cursor.fetchall()
+
+    def _search_like(self, text, class_name, limit):
+        clauses, params = [], []
+        for word in text.split():
+            pattern = word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            clauses.append("(name LIKE ? ESCAPE '\\' OR roll_number LIKE ? ESCAPE '\\' OR email LIKE ? ESCAPE '\\')")
+            params.extend([pattern, pattern, pattern])
+        if class_name:
+            clauses.append("class_name = ?")
+            params.append(class_name)
+        query = ("SELECT name, roll_number, class_name FROM students WHERE " + " AND ".join(clauses)
+                 + " ORDER BY name LIMIT ?")
+        params.append(limit)
+        with self.db.reader() as cursor:
+            cursor.execute(query, tuple(params))
+            return cursor.fetchall()
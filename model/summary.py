@@ -0,0 +1,60 @@
+# model/summary.py
+# OOP Concept: Class, Encapsulation, Pre-aggregated Reads
+
+from StudentAttendanceTracker.model.database import Database
+
+
+class AttendanceSummary:
+    """Reads the trigger-maintained summary tables instead of scanning attendance.
+
+    ``table_counts`` holds row counts for the overview cards,
+    ``attendance_daily_summary`` holds present/absent totals per instructor,
+    class and day, and ``student_attendance_summary`` holds per-student totals.
+    """
+
+    def __init__(self, db=None):
+        """Initialize with a Database (the shared one by default)."""
+        self.db = db or Database.shared()
+
+    def table_counts(self):
+        """Return {table_name: row_count} for students, instructors, classes and attendance."""
+        with self.db.reader() as cursor:
+            cursor.execute("SELECT name, row_count FROM table_counts")
+            return dict(cursor.fetchall())
+
+    def instructor_counts(self, instructor_username):
+        """Return (students, attendance_records, classes) for one instructor."""
+        with self.db.reader() as cursor:
+            cursor.execute('''
+                SELECT COUNT(*), COUNT(DISTINCT students.class_name),
+                       COALESCE(SUM(summary.present + summary.absent), 0)
+                FROM students
+                LEFT JOIN student_attendance_summary AS summary ON summary.student_id = students.id
+                WHERE students.instructor_username = ?
+            ''', (instructor_username,))
+            students, classes, attendance = cursor.fetchone()
+        return students, attendance, classes
+
+    def totals(self, instructor_username=None, class_name=None, start_date=None, end_date=None):
+        """Return (present, absent) totals for the given filters."""
+        clauses, params = [], []
+        if instructor_username:
+            clauses.append("instructor_username = ?")
+            params.append(instructor_username)
+        if class_name:
+            clauses.append("class_name = ?")
+            params.append(class_name)
+        if start_date and end_date:
+            clauses.append("date BETWEEN ? AND ?")
+            params.extend([start_date, end_date])
+
+        query = "SELECT COALESCE(SUM(present), 0), COALESCE(SUM(absent), 0) FROM attendance_daily_summary"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        with self.db.reader() as cursor:
+            cursor.execute(query, tuple(params))
+            return cursor.fetchone()
+
+    def totals_for(self, report):
+        """Return (present, absent) totals matching an AttendanceReport's filters."""
+        return self.totals(report.instructor_username, report.class_name, report.start_date, report.end_date)
@@ -0,0 +1,233 @@
+# model/write_coordinator.py
+# OOP Concept: Class, Encapsulation, Producer/Consumer Queue, Decorator
+
+import collections
+import functools
+import logging
+import queue
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def is_busy(error):
+    """True for SQLITE_BUSY / SQLITE_LOCKED errors, i.e. another connection holds the lock."""
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    code = getattr(error, "sqlite_errorcode", None)
+    if code is not None:
+        return code & 0xFF in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+    message = str(error)
+    return "locked" in message or "busy" in message
+
+
+def coordinated(method):
+    """Run a controller method on its Database's writer thread (see WriteCoordinator)."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return self.db.coordinator.run(method, self, *args, **kwargs)
+    wrapper.coordinated_method = method
+    return wrapper
+
+
+_caller_pool = None
+_caller_pool_lock = threading.Lock()
+
+
+def submit_write(write, *args, **kwargs):
+    """Start a write without waiting for it and return a Future of its committed result.
+
+    For UI callers, which must not block while a busy database is retried.
+    A @coordinated method is queued straight onto its writer thread; any other
+    callable (e.g. a method that hashes first, or an API-backed controller)
+    runs on a small pool thread instead.
+    """
+    method = getattr(write, "coordinated_method", None)
+    owner = getattr(write, "__self__", None)
+    if method is not None and owner is not None:
+        return owner.db.coordinator.submit(method, owner, *args, **kwargs)
+    global _caller_pool
+    with _caller_pool_lock:
+        if _caller_pool is None:
+            _caller_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="write-caller")
+    return _caller_pool.submit(write, *args, **kwargs)
+
+
+class WriteCoordinator:
+    """Funnels a Database's writes through one thread and group-commits them.
+
+    submit() queues a call and returns a Future. The writer thread takes
+    everything waiting in the queue (up to GROUP_LIMIT calls), opens one
+    BEGIN IMMEDIATE transaction and runs each call in its own savepoint (a
+    nested Database.writer() block), so a failing call undoes only itself.
+    If another process holds the lock beyond busy_timeout, the whole group
+    is retried with jittered exponential backoff up to MAX_RETRIES times;
+    a call that alone fails with a busy error is retried the same way.
+    """
+
+    GROUP_LIMIT = 500
+    MAX_RETRIES = 5
+    BACKOFF_SECONDS = 0.05
+    MAX_BACKOFF_SECONDS = 1.0
+    LATENCY_SAMPLES = 1000
+
+    def __init__(self, db):
+        """Initialize for one Database; the writer thread starts on first use."""
+        self.db = db
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self.groups = 0
+        self.writes = 0
+        self.largest_group = 0
+        self.retries = 0
+        self.failed_groups = 0
+        self._commit_ms = collections.deque(maxlen=self.LATENCY_SAMPLES)
+        self._wait_ms = collections.deque(maxlen=self.LATENCY_SAMPLES)
+
+    def _ensure_thread(self):
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run_loop, name="db-writer", daemon=True)
+                self._thread.start()
+
+    def submit(self, func, *args, **kwargs):
+        """Queue func(*args, **kwargs) for the writer thread and return a Future of its result."""
+        future = Future()
+        self._ensure_thread()
+        self._queue.put((functools.partial(func, *args, **kwargs), future, time.perf_counter()))
+        return future
+
+    def run(self, func, *args, **kwargs):
+        """Run func on the writer thread and wait for its committed result.
+
+        Calls made from the writer thread itself, or from a thread already
+        inside a writer() block, run directly to avoid waiting on themselves.
+        This blocks for as long as a busy database is retried; the Tk thread
+        uses submit_write() instead.
+        """
+        if threading.current_thread() is self._thread or self.db.in_writer():
+            return func(*args, **kwargs)
+        return self.submit(func, *args, **kwargs).result()
+
+    def close(self):
+        """Commit everything queued so far and stop the writer thread."""
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join()
+        self._thread = None
+
+    def metrics(self):
+        """Return queue depth, group sizes, retries and commit/wait latency percentiles (ms)."""
+        def percentiles(samples):
+            ordered = sorted(samples)
+            if not ordered:
+                return {"p50": 0.0, "p99": 0.0, "max": 0.0}
+            return {"p50": round(ordered[len(ordered) // 2], 3),
+                    "p99": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3),
+                    "max": round(ordered[-1], 3)}
+
+        return {
+            "queue_depth": self._queue.qsize(),
+            "groups": self.groups,
+            "writes": self.writes,
+            "largest_group": self.largest_group,
+            "average_group": round(self.writes / self.groups, 2) if self.groups else 0,
+            "retries": self.retries,
+            "failed_groups": self.failed_groups,
+            "commit_ms": percentiles(list(self._commit_ms)),
+            "wait_ms": percentiles(list(self._wait_ms)),
+        }
+
+    # ---------------- Writer thread ----------------
+
+    def _run_loop(self):
+        stopping = False
+        while not stopping:
+            job = self._queue.get()
+            if job is None:
+                break
+            batch = [job]
+            while len(batch) < self.GROUP_LIMIT:
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    stopping = True
+                    break
+                batch.append(job)
+            self._commit([job for job in batch if job[1].set_running_or_notify_cancel()])
+
+    def _commit(self, batch):
+        """Run one group in a single transaction, retrying while the database is busy.
+
+        A busy error that fails the whole group retries the group. One raised
+        inside a single call's savepoint retries only the calls that hit it,
+        in a later transaction once the rest of the group has committed.
+        """
+        if not batch:
+            return
+        delay = self.BACKOFF_SECONDS
+        for attempt in range(self.MAX_RETRIES + 1):
+            last_attempt = attempt == self.MAX_RETRIES
+            started = time.perf_counter()
+            try:
+                outcomes = self._run_group(batch)
+            except Exception as e:
+                if is_busy(e) and not last_attempt:
+                    self.retries += 1
+                    logger.warning("⚠️ Database busy, retrying %d writes in %.0f ms", len(batch), delay * 1000)
+                    delay = self._back_off(delay)
+                    continue
+                self.failed_groups += 1
+                logger.error("❌ Group of %d writes failed: %s", len(batch), e)
+                outcomes = [(False, e)] * len(batch)
+
+            finished = time.perf_counter()
+            self._commit_ms.append((finished - started) * 1000)
+            self.groups += 1
+            self.largest_group = max(self.largest_group, len(batch))
+            retry = []
+            for job, (ok, value) in zip(batch, outcomes):
+                if not ok and is_busy(value) and not last_attempt:
+                    retry.append(job)
+                else:
+                    self._settle(job, ok, value, finished)
+            if not retry:
+                return
+            self.retries += 1
+            logger.warning("⚠️ %d writes hit a busy database, retrying them in %.0f ms", len(retry), delay * 1000)
+            delay = self._back_off(delay)
+            batch = retry
+
+    def _run_group(self, batch):
+        """Run every call of batch in its own savepoint of one transaction; returns (ok, value) per call."""
+        outcomes = []
+        with self.db.writer() as cursor:
+            cursor.execute("BEGIN IMMEDIATE")  # take the write lock now, not at the first write
+            for call, _, _ in batch:
+                try:
+                    with self.db.writer():  # a savepoint: a failing call undoes all of its own work, and only that
+                        outcomes.append((True, call()))
+                except Exception as e:
+                    outcomes.append((False, e))
+        return outcomes
+
+    def _back_off(self, delay):
+        time.sleep(delay * random.uniform(0.5, 1.5))
+        return min(delay * 2, self.MAX_BACKOFF_SECONDS)
+
+    def _settle(self, job, ok, value, finished):
+        _, future, queued_at = job
+        self.writes += 1
+        self._wait_ms.append((finished - queued_at) * 1000)
+        if ok:
+            future.set_result(value)
+        else:
+            future.set_exception(value)
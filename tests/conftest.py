@@ -0,0 +1,14 @@
+# tests/conftest.py
+# Shared fixtures: a migrated Database in a temporary file.
+
+import pytest
+from StudentAttendanceTracker.model.database import Database
+
+
+@pytest.fixture
+def db(tmp_path):
+    """A fresh, fully migrated Database, closed (writer thread included) after the test."""
+    database = Database(str(tmp_path / "attendance.db"))
+    database.migrate()
+    yield database
+    database.close()
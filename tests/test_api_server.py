@@ -0,0 +1,116 @@
+# tests/test_api_server.py
+# The JSON API: routing, request validation and error statuses.
+
+import asyncio
+import http.client
+import json
+import sqlite3
+import threading
+from urllib.parse import urlsplit
+import pytest
+from StudentAttendanceTracker.api.client import ApiClient, ApiError
+from StudentAttendanceTracker.api.server import ApiServer, is_loopback
+
+
+@pytest.fixture
+def serve(db):
+    """Start ApiServer(db, **options) on a free port; returns its URL."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    servers = []
+
+    def start(**options):
+        server = ApiServer(db, port=0, **options)
+        loop.run_until_complete(server.start())
+        servers.append(server)
+        if not thread.is_alive():
+            thread.start()
+        return f"http://127.0.0.1:{server.port}"
+
+    yield start
+    for server in servers:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result(10)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(10)
+
+
+def bad_request(client, *args):
+    with pytest.raises(ApiError, match="^BadRequest"):
+        client.call("reports", *args)
+
+
+def test_report_routes_reject_bad_arguments(serve):
+    client = ApiClient(serve())
+    assert client.call("reports", "count", {"class_name": "Math"}) == 0
+    assert client.call("reports", "page", {}, None, 5) == []
+
+    bad_request(client, "count", {"clas_name": "Math"})
+    bad_request(client, "count", ["Math"])
+    bad_request(client, "totals", "Math")
+    bad_request(client, "page", {}, None, 0)
+    bad_request(client, "page", {}, None, "10")
+    bad_request(client, "page", {}, None, True)
+    bad_request(client, "page", {}, 5, 10)
+    bad_request(client, "page", {"start_date": "2025-01-01", "limit": 5})
+
+
+
+def post(url, path, body, headers=None):
+    connection = http.client.HTTPConnection("127.0.0.1", urlsplit(url).port, timeout=10)
+    try:
+        connection.request("POST", path, body, headers or {})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())["type"]
+    finally:
+        connection.close()
+
+
+def test_constraint_failures_are_409(serve):
+    client = ApiClient(serve())
+    client.call("classes", "add", "Math")
+    with pytest.raises(sqlite3.IntegrityError):
+        client.call("classes", "add", "Math")
+    assert post(client.url, "/api/classes/add", json.dumps({"args": ["Math"]})) == (409, "IntegrityError")
+    assert client.call("classes", "list_classes") == ["Math"]
+
+
+@pytest.mark.parametrize("path, body, expected", [
+    ("/api/classes/add", "{not json", (400, "BadRequest")),
+    ("/api/classes/add", json.dumps({"args": []}), (400, "BadRequest")),
+    ("/api/classes/add", json.dumps({"args": ["Math"], "kwargs": {"colour": "red"}}), (400, "BadRequest")),
+    ("/api/classes/add", json.dumps(["Math"]), (400, "BadRequest")),
+    ("/api/classes/drop_table", "{}", (404, "NotFound")),
+    ("/api/students/import_file", json.dumps({"args": ["/etc/passwd"]}), (404, "NotFound")),
+])
+def test_bad_requests(serve, path, body, expected):
+    assert post(serve(), path, body) == expected
+
+
+def test_token(serve):
+    url = serve(token="s3cret")
+    assert post(url, "/api/classes/list_classes", "{}") == (401, "Unauthorized")
+    assert post(url, "/api/classes/list_classes", "{}", {"Authorization": "Bearer wrong"}) == (401, "Unauthorized")
+    with pytest.raises(ApiError, match="^Unauthorized"):
+        ApiClient(url).call("classes", "list_classes")
+    assert ApiClient(url, token="s3cret").call("classes", "list_classes") == []
+
+
+def test_token_required_beyond_loopback(db):
+    with pytest.raises(ValueError):
+        ApiServer(db, host="0.0.0.0")
+    assert is_loopback("127.0.0.2") and is_loopback("::1") and is_loopback("localhost")
+    assert not is_loopback("0.0.0.0") and not is_loopback("192.168.1.10")
+
+
+def test_version_changes_with_every_write(serve, db):
+    client = ApiClient(serve())
+    before = client.version()
+    client.call("classes", "add", "Math")
+    after_api_write = client.version()
+    assert after_api_write != before
+
+    other = sqlite3.connect(db.db_name)
+    other.execute("INSERT INTO classes (class_name) VALUES ('Art')")
+    other.commit()
+    other.close()
+    assert client.version() != after_api_write
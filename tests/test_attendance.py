@@ -0,0 +1,69 @@
+# tests/test_attendance.py
+# Attendance.save_roster outcomes and the trigger-maintained summaries.
+
+import pytest
+from StudentAttendanceTracker.controller.student_controller import StudentController
+from StudentAttendanceTracker.model.attendance import Attendance
+
+
+@pytest.fixture
+def students(db):
+    controller = StudentController(db)
+    for roll_number in ("R1", "R2", "R3"):
+        controller.add(f"Student {roll_number}", roll_number, "", "Math", "jdoe")
+    yield controller
+    controller.close()
+
+
+def student_id(db, roll_number):
+    with db.reader() as cursor:
+        cursor.execute("SELECT id FROM students WHERE roll_number=?", (roll_number,))
+        return cursor.fetchone()[0]
+
+
+def statuses(db, date):
+    with db.reader() as cursor:
+        cursor.execute("SELECT student_id, status FROM attendance WHERE date=?", (date,))
+        return dict(cursor.fetchall())
+
+
+def test_save_roster_reports_each_outcome(db, students):
+    first, second, third = (student_id(db, roll) for roll in ("R1", "R2", "R3"))
+    attendance = Attendance(db)
+    assert attendance.save_roster("2025-03-14", [(first, "Present"), (second, "Present")]) == [
+        (first, "inserted"), (second, "inserted")]
+
+    outcomes = attendance.save_roster("2025-03-14", [
+        (first, "Present"), (second, "Absent"), (third, "Late"), (third, "Present"), (third, "Absent")])
+
+    assert outcomes == [(first, "unchanged"), (second, "updated"), (third, "invalid"), (third, "duplicate"),
+                        (third, "inserted")]
+    assert statuses(db, "2025-03-14") == {first: "Present", second: "Absent", third: "Absent"}
+
+
+def test_save_roster_with_nothing_valid_writes_nothing(db, students):
+    first = student_id(db, "R1")
+    assert Attendance(db).save_roster("2025-03-14", [(first, "Late")]) == [(first, "invalid")]
+    assert statuses(db, "2025-03-14") == {}
+
+
+def daily_summary(db):
+    with db.reader() as cursor:
+        cursor.execute("SELECT class_name, date, present, absent FROM attendance_daily_summary "
+                       "WHERE present OR absent ORDER BY class_name, date")
+        return cursor.fetchall()
+
+
+def test_summaries_follow_a_student_to_another_class(db, students):
+    first, second = student_id(db, "R1"), student_id(db, "R2")
+    attendance = Attendance(db)
+    attendance.save_roster("2025-03-13", [(first, "Present"), (second, "Absent")])
+    attendance.save_roster("2025-03-14", [(first, "Absent"), (second, "Present")])
+
+    assert students.update("R1", "Student R1", "", "Science") == 1
+
+    assert daily_summary(db) == [("Math", "2025-03-13", 0, 1), ("Math", "2025-03-14", 1, 0),
+                                 ("Science", "2025-03-13", 1, 0), ("Science", "2025-03-14", 0, 1)]
+    with db.reader() as cursor:
+        cursor.execute("SELECT present, absent FROM student_attendance_summary WHERE student_id=?", (first,))
+        assert cursor.fetchone() == (1, 1)
@@ -0,0 +1,84 @@
+# tests/test_database.py
+# Database connection handling: the writer lock, external versions and the reader pool.
+
+import sqlite3
+import threading
+import time
+import pytest
+from StudentAttendanceTracker.model.write_coordinator import coordinated
+
+
+def test_external_version_does_not_wait_for_the_writer(db):
+    db.connect()
+    entered, release = threading.Event(), threading.Event()
+
+    def hold_writer():
+        with db.writer():
+            entered.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=hold_writer)
+    thread.start()
+    entered.wait(5)
+    try:
+        started = time.perf_counter()
+        assert db.external_version() is None
+        assert time.perf_counter() - started < 0.5
+    finally:
+        release.set()
+        thread.join()
+    assert db.external_version() is not None
+
+
+def test_external_version_changes_only_for_other_connections(db):
+    before = db.external_version()
+    with db.writer() as cursor:
+        cursor.execute("INSERT INTO classes (class_name) VALUES ('Math')")
+    assert db.external_version() == before
+
+    other = sqlite3.connect(db.db_name)
+    other.execute("INSERT INTO classes (class_name) VALUES ('Art')")
+    other.commit()
+    other.close()
+    assert db.external_version() != before
+
+
+def test_failed_reader_opens_do_not_shrink_the_pool(db, monkeypatch):
+    def locked():
+        raise sqlite3.OperationalError("unable to open database file")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(db, "_open", locked)
+        for _ in range(db.READER_POOL_SIZE + 1):
+            with pytest.raises(sqlite3.OperationalError):
+                with db.reader():
+                    pass
+
+    done = threading.Event()
+
+    def read():
+        with db.reader() as cursor:
+            cursor.execute("SELECT 1")
+        done.set()
+
+    threading.Thread(target=read, daemon=True).start()
+    assert done.wait(5)
+
+
+def test_writes_after_close_start_a_new_coordinator(db):
+    first = db.coordinator
+    db.close()
+    assert db.coordinator is not first
+
+    class Classes:
+        def __init__(self, db):
+            self.db = db
+
+        @coordinated
+        def add(self, class_name):
+            with self.db.writer() as cursor:
+                cursor.execute("INSERT INTO classes (class_name) VALUES (?)", (class_name,))
+
+    Classes(db).add("Math")
+    with db.reader() as cursor:
+        assert cursor.execute("SELECT class_name FROM classes").fetchall() == [("Math",)]
@@ -0,0 +1,73 @@
+# tests/test_export.py
+# CsvExporter: plain and gzip output, progress, cancellation and cleanup.
+
+import csv
+import gzip
+import pytest
+from StudentAttendanceTracker.model.attendance import Attendance
+from StudentAttendanceTracker.model.export import CsvExporter, ExportCancelled
+from StudentAttendanceTracker.model.reports import AttendanceReport
+
+
+@pytest.fixture
+def report(db):
+    with db.writer() as cursor:
+        cursor.executemany("INSERT INTO students (name, roll_number, class_name, instructor_username) "
+                           "VALUES (?, ?, 'Math', 'jdoe')", [(f"Student {i}", f"R{i}") for i in range(5)])
+    attendance = Attendance(db)
+    for day in range(1, 5):
+        attendance.save_roster(f"2025-03-0{day}", [(i, "Present" if i % 2 else "Absent") for i in range(1, 6)])
+    return AttendanceReport(db, class_name="Math")
+
+
+@pytest.fixture
+def out(tmp_path):
+    """An empty directory for the exports (the database lives in tmp_path itself)."""
+    directory = tmp_path / "exports"
+    directory.mkdir()
+    return directory
+
+
+def read(path, opener=open):
+    with opener(path, "rt", newline="", encoding="utf-8") as file:
+        return list(csv.reader(file))
+
+
+@pytest.mark.parametrize("name, opener", [("report.csv", open), ("report.csv.gz", gzip.open)])
+def test_export_writes_every_row(report, out, name, opener):
+    path = out / name
+    progress = []
+    exporter = CsvExporter(report, str(path), progress=lambda written, total: progress.append((written, total)))
+    exporter.CHUNK_SIZE = 6
+
+    assert exporter.export() == 20
+
+    rows = read(path, opener)
+    assert rows[0] == list(AttendanceReport.COLUMNS)
+    assert len(rows) == 21 and rows[1][0] == "2025-03-04" and rows[-1][0] == "2025-03-01"
+    assert progress == [(6, 20), (12, 20), (18, 20), (20, 20)]
+    assert not (out / (name + ".part")).exists()
+
+
+def test_cancelled_export_leaves_nothing_behind(report, out):
+    path = out / "report.csv"
+    path.write_text("previous export\n")
+    exporter = CsvExporter(report, str(path), progress=lambda written, total: exporter.cancel())
+    exporter.CHUNK_SIZE = 5
+
+    with pytest.raises(ExportCancelled):
+        exporter.export()
+
+    assert exporter.rows_written == 5
+    assert path.read_text() == "previous export\n"
+    assert list(out.iterdir()) == [path]
+
+
+def test_failed_export_removes_its_part_file(report, out):
+    def fail(written, total):
+        raise OSError("disk full")
+
+    exporter = CsvExporter(report, str(out / "report.csv.gz"), progress=fail)
+    with pytest.raises(OSError):
+        exporter.export()
+    assert list(out.iterdir()) == []
@@ -0,0 +1,61 @@
+# tests/test_listing.py
+# TableListing keyset pages: complete, in order, and always an index seek.
+
+import pytest
+from StudentAttendanceTracker.controller.class_controller import ClassController
+from StudentAttendanceTracker.controller.instructor_controller import InstructorController
+from StudentAttendanceTracker.controller.student_controller import StudentController
+
+
+@pytest.fixture
+def listings(db):
+    with db.writer() as cursor:
+        cursor.executemany("INSERT INTO students (name, roll_number, email, class_name, instructor_username) "
+                           "VALUES (?, ?, ?, ?, 'jdoe')",
+                           [(f"Student {i % 7}", f"R{i:03}", None, None if i % 5 == 0 else f"Class {i % 4}")
+                            for i in range(60)])
+        cursor.executemany("INSERT INTO instructors (instructor_id, name, email, department) VALUES (?, ?, ?, ?)",
+                           [(f"I{i:02}", f"Instructor {i % 3}", None, None if i % 4 == 0 else f"Dept {i % 2}")
+                            for i in range(20)])
+        cursor.executemany("INSERT INTO classes (class_name) VALUES (?)", [(f"Class {i}",) for i in range(20)])
+    controllers = [StudentController(db), InstructorController(db), ClassController(db)]
+    yield [controller.listing for controller in controllers]
+    for controller in controllers:
+        if hasattr(controller, "close"):
+            controller.close()
+
+
+def sort_cases(listings):
+    return [(listing, sort, descending) for listing in listings for sort in listing.sortable
+            for descending in (False, True)]
+
+
+def test_pages_walk_every_row_in_order(listings):
+    for listing, sort, descending in sort_cases(listings):
+        everything = listing.page(limit=1000, sort=sort, descending=descending)
+        walked, after = [], None
+        while True:
+            rows = listing.page(after, limit=7, sort=sort, descending=descending)
+            if not rows:
+                break
+            walked.extend(rows)
+            after = rows[-1]
+        assert walked == everything, (listing.table, sort, descending)
+        column = 1 + listing.keys.index(sort)
+        keys = [(row[column], row[0]) for row in walked]
+        assert keys == sorted(keys, reverse=descending)
+
+
+def test_later_pages_seek_the_sort_index(db, listings):
+    for listing, sort, descending in sort_cases(listings):
+        after = listing.page(limit=3, sort=sort, descending=descending)[-1]
+        query, params = listing.query(after, 3, sort, descending)
+        with db.reader() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {query}", params)
+            plan = [row[3] for row in cursor.fetchall()]
+        assert len(plan) == 1 and plan[0].startswith(f"SEARCH {listing.table} USING "), (sort, descending, plan)
+
+
+def test_unknown_sort_column(listings):
+    with pytest.raises(ValueError):
+        listings[0].page(sort="email")
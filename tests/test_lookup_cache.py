@@ -0,0 +1,62 @@
+# tests/test_lookup_cache.py
+# LookupCache hits, targeted invalidation and other-process changes.
+
+import sqlite3
+from StudentAttendanceTracker.model.lookup_cache import LookupCache
+
+
+class Loader:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.calls
+
+
+def test_hits_and_misses(db):
+    cache, load = LookupCache(db), Loader()
+    assert cache.get(("classes",), load) == 1
+    assert cache.get(("classes",), load) == 1
+    assert (cache.hits, cache.misses, load.calls) == (1, 1, 1)
+
+
+def test_invalidate_one_key_one_lookup_or_everything(db):
+    cache = LookupCache(db)
+    loaders = {key: Loader() for key in [("names", "jdoe"), ("names", "asmith"), ("classes",)]}
+
+    def fill():
+        return {key: cache.get(key, load) for key, load in loaders.items()}
+
+    fill()
+    cache.invalidate("names", "jdoe")
+    assert fill() == {("names", "jdoe"): 2, ("names", "asmith"): 1, ("classes",): 1}
+    cache.invalidate("names")
+    assert fill() == {("names", "jdoe"): 3, ("names", "asmith"): 2, ("classes",): 1}
+    cache.invalidate()
+    assert fill() == {("names", "jdoe"): 4, ("names", "asmith"): 3, ("classes",): 2}
+
+
+def test_commit_from_another_process_clears_the_cache(db):
+    cache, load = LookupCache(db), Loader()
+    cache.get(("classes",), load)
+    with db.writer() as cursor:  # this process's own writes are announced as events instead
+        cursor.execute("INSERT INTO classes (class_name) VALUES ('Math')")
+    assert cache.get(("classes",), load) == 1
+
+    other = sqlite3.connect(db.db_name)
+    other.execute("INSERT INTO classes (class_name) VALUES ('Art')")
+    other.commit()
+    other.close()
+    assert cache.get(("classes",), load) == 2
+
+
+def test_value_loaded_across_an_invalidation_is_not_kept(db):
+    cache = LookupCache(db)
+
+    def load_during_write():
+        cache.invalidate("classes")
+        return "stale"
+
+    assert cache.get(("classes",), load_during_write) == "stale"
+    assert cache.get(("classes",), lambda: "fresh") == "fresh"
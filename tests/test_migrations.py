@@ -0,0 +1,51 @@
+# tests/test_migrations.py
+# Upgrading a pre-migration (version 0) database file to the current schema.
+
+import sqlite3
+from StudentAttendanceTracker.model.database import Database
+from StudentAttendanceTracker.model.migrations import MIGRATIONS, SCHEMA_VERSION
+
+
+def baseline(path):
+    """Create the tables the app made before migrations existed, with duplicate marks in them."""
+    connection = sqlite3.connect(path)
+    for statement in MIGRATIONS[0][2]:  # the original CREATE TABLE statements
+        connection.execute(statement)
+    connection.executemany("INSERT INTO students (name, roll_number, class_name, instructor_username) "
+                           "VALUES (?, ?, ?, 'jdoe')", [("Ann", "R1", "Math"), ("Ben", "R2", None)])
+    connection.executemany("INSERT INTO attendance (student_id, date, status) VALUES (?, ?, ?)", [
+        (1, "2025-03-13", "Absent"), (1, "2025-03-13", "Present"),  # re-marked: the later row wins
+        (2, "2025-03-13", "Present"), (1, "2025-03-14", "Absent"),
+        (2, "2025-03-14", "Present"), (2, "2025-03-14", "Absent")])
+    connection.execute("INSERT INTO classes (class_name) VALUES ('Math')")
+    connection.commit()
+    assert connection.execute("PRAGMA user_version").fetchone()[0] == 0
+    connection.close()
+
+
+def test_baseline_database_is_upgraded_in_place(tmp_path):
+    path = str(tmp_path / "old.db")
+    baseline(path)
+    db = Database(path)
+    try:
+        assert db.migrate() == [version for version, _, _ in MIGRATIONS]
+        assert db.migrate() == []
+        with db.reader() as cursor:
+            assert cursor.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+            cursor.execute("SELECT student_id, date, status FROM attendance ORDER BY student_id, date")
+            assert cursor.fetchall() == [(1, "2025-03-13", "Present"), (1, "2025-03-14", "Absent"),
+                                         (2, "2025-03-13", "Present"), (2, "2025-03-14", "Absent")]
+            cursor.execute("SELECT name, row_count FROM table_counts ORDER BY name")
+            assert cursor.fetchall() == [("attendance", 4), ("classes", 1), ("instructors", 0), ("students", 2)]
+            cursor.execute("SELECT class_name, date, present, absent FROM attendance_daily_summary "
+                           "ORDER BY class_name, date")
+            assert cursor.fetchall() == [("", "2025-03-13", 1, 0), ("", "2025-03-14", 0, 1),
+                                         ("Math", "2025-03-13", 1, 0), ("Math", "2025-03-14", 0, 1)]
+            cursor.execute("SELECT student_id, present, absent FROM student_attendance_summary ORDER BY 1")
+            assert cursor.fetchall() == [(1, 1, 1), (2, 1, 1)]
+        with db.writer() as cursor:
+            cursor.execute("INSERT INTO attendance (student_id, date, status) VALUES (1, '2025-03-14', 'Present')"
+                           " ON CONFLICT(student_id, date) DO NOTHING")
+            assert cursor.rowcount == 0  # the unique index from migration 3 is in place
+    finally:
+        db.close()
@@ -0,0 +1,72 @@
+# tests/test_roster_import.py
+# RosterImporter: validation, duplicate handling and both file formats.
+
+import json
+import pytest
+from StudentAttendanceTracker.model.events import StudentsChanged
+from StudentAttendanceTracker.model.roster_import import RosterImporter
+
+
+def students(db):
+    with db.reader() as cursor:
+        cursor.execute("SELECT name, roll_number, email, class_name, instructor_username FROM students ORDER BY id")
+        return cursor.fetchall()
+
+
+@pytest.fixture
+def importer(db):
+    with db.writer() as cursor:
+        cursor.execute("INSERT INTO students (name, roll_number, class_name, instructor_username) "
+                       "VALUES ('Old', 'R0', 'Math', 'jdoe')")
+    return RosterImporter(db, instructor_username="jdoe")
+
+
+def test_csv_import_validates_each_row(db, importer, tmp_path):
+    path = tmp_path / "roster.csv"
+    path.write_text("Student Name,Roll No,Email,Class\n"
+                    "Ann,R1,ann@example.com,Math\n"
+                    ",R2,,Math\n"
+                    "Ben,R3,not-an-email,Math\n"
+                    "Cat,R0,,Math\n"
+                    "Dan,R4,,Science\n"
+                    "Eve,R4,,Science\n", encoding="utf-8-sig")
+    heard = []
+    db.events.subscribe(StudentsChanged, heard.append)
+
+    result = importer.import_file(str(path))
+
+    assert (result.inserted, result.skipped) == (2, 0)
+    assert result.rejected == [(3, "missing name"), (4, "invalid email 'not-an-email'"),
+                               (5, "duplicate roll number 'R0'"), (7, "duplicate roll number 'R4'")]
+    assert students(db)[1:] == [("Ann", "R1", "ann@example.com", "Math", "jdoe"), ("Dan", "R4", "", "Science", "jdoe")]
+    assert [event.action for event in heard] == ["import_file"]
+
+
+def test_jsonl_import_and_per_row_instructors(db, tmp_path):
+    path = tmp_path / "roster.jsonl"
+    path.write_text("\n".join([json.dumps({"name": "Ann", "roll": "R1", "class": "Math", "instructor": "asmith"}),
+                               "{not json",
+                               "[1, 2]",
+                               "",
+                               json.dumps({"name": "Ben", "roll": "R2", "class": "Math"})]))
+
+    result = RosterImporter(db).import_file(str(path))
+
+    assert result.inserted == 1
+    assert [line for line, _ in result.rejected] == [2, 3, 5]
+    assert result.rejected[1:] == [(3, "expected a JSON object"), (5, "missing instructor_username")]
+    assert students(db) == [("Ann", "R1", "", "Math", "asmith")]
+
+
+def test_import_text_matches_import_file(db, importer):
+    result = importer.import_text("﻿name,roll_number,class_name\nAnn,R1,Math\n", "roster.csv")
+    assert (result.inserted, result.rejected) == (1, [])
+    assert students(db)[-1] == ("Ann", "R1", "", "Math", "jdoe")
+
+
+def test_import_is_batched(db, importer, monkeypatch):
+    monkeypatch.setattr(RosterImporter, "BATCH_SIZE", 3)
+    rows = [(line, {"name": f"S{line}", "roll": f"B{line}", "class": "Math"}) for line in range(2, 10)]
+    result = importer.import_rows(rows)
+    assert result.inserted == 8
+    assert len(students(db)) == 9
@@ -0,0 +1,80 @@
+# tests/test_roster_index.py
+# RosterIndex prefix lookups and its never-blocking snapshots.
+
+from StudentAttendanceTracker.model.roster_index import RosterIndex
+
+ROSTER = [(1, "John Smith", "R10", "Math"), (2, "Jane Smithers", "R11", "Math"),
+          (3, "Ann Lee", "X20", "Art"), (4, "Mary Ann Jones", "R2", "Art")]
+
+
+class Roster:
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.loads = 0
+
+    def __call__(self):
+        self.loads += 1
+        return list(self.rows)
+
+
+def built(rows=ROSTER):
+    index = RosterIndex("jdoe", db=object(), load=Roster(rows))
+    index.build()
+    return index
+
+
+def ids(matches):
+    return [match[0] for match in matches]
+
+
+def test_prefixes_of_roll_numbers_and_name_words():
+    index = built()
+    assert ids(index.lookup("r1")) == [1, 2]
+    assert ids(index.lookup("smith")) == [1, 2]
+    assert ids(index.lookup("  ANN ")) == [4, 3]  # key order: "ann jones" before "ann lee"
+    assert ids(index.lookup("ann j")) == [4]
+    assert ids(index.lookup("mary ann jones")) == [4]
+    assert index.lookup("zz") == [] and index.lookup("  ") == []
+
+
+def test_limit_and_one_result_per_student():
+    index = built([(1, "Ann Ann", "A1", "Art"), (2, "Ann B", "A2", "Art")])
+    assert ids(index.lookup("a")) == [1, 2]
+    assert ids(index.lookup("a", limit=1)) == [1]
+
+
+def test_by_roll():
+    index = built()
+    assert index.by_roll("X20") == ROSTER[2]
+    assert index.by_roll("x20") is None
+
+
+def test_lookups_never_load_the_roster():
+    roster = Roster(ROSTER)
+    index = RosterIndex("jdoe", db=object(), load=roster)
+    assert index.lookup("john") == [] and index.by_roll("R10") is None
+    assert roster.loads == 0
+
+    index.build()
+    roster.rows.append((5, "Johnny Cash", "R30", "Music"))
+    index.invalidate()
+    assert ids(index.lookup("john")) == [1]  # the previous snapshot until the next build
+    assert roster.loads == 1
+
+    index.build()
+    assert ids(index.lookup("john")) == [1, 5]
+
+
+def test_build_started_before_an_edit_does_not_replace_the_snapshot():
+    roster = Roster(ROSTER)
+    index = RosterIndex("jdoe", db=object(), load=roster)
+    index.build()
+
+    def load_then_edit():
+        rows = list(ROSTER[:1])
+        index.invalidate()  # a student write lands while this build is reading
+        return rows
+
+    index.load = load_then_edit
+    index.build()
+    assert ids(index.lookup("r")) == [1, 2, 4]
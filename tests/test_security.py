@@ -0,0 +1,25 @@
+# tests/test_security.py
+# Password hashing cost from SAT_BCRYPT_ROUNDS.
+
+import logging
+import pytest
+from StudentAttendanceTracker.utils.security import DEFAULT_ROUNDS, configured_rounds
+
+
+@pytest.mark.parametrize("value, rounds", [("4", 4), (" 10 ", 10), ("31", 31), ("", DEFAULT_ROUNDS)])
+def test_valid_or_empty_values(value, rounds):
+    assert configured_rounds(value) == rounds
+
+
+@pytest.mark.parametrize("value", ["fast", "3", "32", "40", "-1", "12.5"])
+def test_invalid_values_fall_back_with_a_warning(value, caplog):
+    with caplog.at_level(logging.WARNING):
+        assert configured_rounds(value) == DEFAULT_ROUNDS
+    assert "SAT_BCRYPT_ROUNDS" in caplog.text
+
+
+def test_reads_the_environment(monkeypatch):
+    monkeypatch.setenv("SAT_BCRYPT_ROUNDS", "5")
+    assert configured_rounds() == 5
+    monkeypatch.delenv("SAT_BCRYPT_ROUNDS")
+    assert configured_rounds() == DEFAULT_ROUNDS
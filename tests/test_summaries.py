@@ -0,0 +1,76 @@
+# tests/test_summaries.py
+# The trigger-maintained summary tables always equal a fresh aggregate of attendance.
+
+import pytest
+from StudentAttendanceTracker.model.attendance import Attendance
+
+
+def recomputed(cursor):
+    cursor.execute("SELECT COALESCE(students.instructor_username, ''), COALESCE(students.class_name, ''), "
+                   "attendance.date, SUM(attendance.status = 'Present'), SUM(attendance.status = 'Absent') "
+                   "FROM attendance JOIN students ON attendance.student_id = students.id GROUP BY 1, 2, 3")
+    daily = sorted(cursor.fetchall())
+    cursor.execute("SELECT attendance.student_id, SUM(status = 'Present'), SUM(status = 'Absent') "
+                   "FROM attendance JOIN students ON attendance.student_id = students.id GROUP BY 1")
+    per_student = sorted(cursor.fetchall())
+    cursor.execute("SELECT (SELECT COUNT(*) FROM students), (SELECT COUNT(*) FROM attendance)")
+    return daily, per_student, cursor.fetchone()
+
+
+def stored(cursor):
+    cursor.execute("SELECT instructor_username, class_name, date, present, absent FROM attendance_daily_summary "
+                   "WHERE present OR absent")
+    daily = sorted(cursor.fetchall())
+    cursor.execute("SELECT student_id, present, absent FROM student_attendance_summary WHERE present OR absent")
+    per_student = sorted(cursor.fetchall())
+    cursor.execute("SELECT (SELECT row_count FROM table_counts WHERE name = 'students'), "
+                   "(SELECT row_count FROM table_counts WHERE name = 'attendance')")
+    return daily, per_student, cursor.fetchone()
+
+
+@pytest.fixture
+def marked(db):
+    with db.writer() as cursor:
+        cursor.executemany("INSERT INTO students (name, roll_number, class_name, instructor_username) "
+                           "VALUES (?, ?, ?, ?)", [("Ann", "R1", "Math", "jdoe"), ("Ben", "R2", "Math", "jdoe"),
+                                                  ("Cat", "R3", None, "asmith")])
+    attendance = Attendance(db)
+    for date in ("2025-03-12", "2025-03-13", "2025-03-14"):
+        attendance.save_roster(date, [(1, "Present"), (2, "Absent"), (3, "Present")])
+    return db
+
+
+def check(db):
+    with db.reader() as cursor:
+        assert stored(cursor) == recomputed(cursor)
+
+
+@pytest.mark.parametrize("statement", [
+    "INSERT INTO attendance (student_id, date, status) VALUES (2, '2025-03-15', 'Present')",
+    "UPDATE attendance SET status = 'Absent' WHERE student_id = 1 AND date = '2025-03-13'",
+    "UPDATE attendance SET date = '2025-03-20' WHERE student_id = 3 AND date = '2025-03-12'",
+    "UPDATE attendance SET student_id = 3, date = '2025-03-16' WHERE student_id = 2 AND date = '2025-03-14'",
+    "DELETE FROM attendance WHERE date = '2025-03-12'",
+    "UPDATE students SET class_name = 'Science' WHERE id = 1",
+    "UPDATE students SET class_name = NULL, instructor_username = 'asmith' WHERE id = 2",
+    "UPDATE students SET class_name = 'Math', instructor_username = 'jdoe' WHERE id = 3",
+    "UPDATE students SET name = 'Anne' WHERE id = 1",
+    "DELETE FROM students WHERE id = 2",
+])
+def test_summaries_stay_consistent(marked, statement):
+    check(marked)
+    with marked.writer() as cursor:
+        cursor.execute(statement)
+    check(marked)
+
+
+def test_summaries_survive_a_sequence_of_changes(marked):
+    attendance = Attendance(marked)
+    with marked.writer() as cursor:
+        cursor.execute("UPDATE students SET class_name = 'Science' WHERE id = 1")
+    attendance.save_roster("2025-03-13", [(1, "Absent"), (2, "Present")])
+    with marked.writer() as cursor:
+        cursor.execute("UPDATE students SET class_name = 'Math' WHERE id = 1")
+        cursor.execute("DELETE FROM attendance WHERE student_id = 3 AND date = '2025-03-14'")
+    attendance.save_roster("2025-03-15", [(1, "Present"), (3, "Absent")])
+    check(marked)
@@ -0,0 +1,50 @@
+# tests/test_virtual_tree.py
+# stable_items: which rows a Treeview refresh can leave where they are.
+
+import random
+from StudentAttendanceTracker.view.virtual_tree import stable_items
+
+
+def positions(ids):
+    return {item: index for index, item in enumerate(ids)}
+
+
+def test_unchanged_order_keeps_everything():
+    ids = ["a", "b", "c", "d"]
+    assert stable_items(positions(ids), ids) == set(ids)
+
+
+def test_empty_and_all_new():
+    assert stable_items({}, []) == set()
+    assert stable_items(positions(["a", "b"]), ["x", "y"]) == set()
+
+
+def test_moved_item_is_the_only_one_not_kept():
+    old = ["a", "b", "c", "d", "e"]
+    assert stable_items(positions(old), ["a", "c", "d", "e", "b"]) == {"a", "c", "d", "e"}
+
+
+def test_insertions_and_removals_leave_the_rest_in_place():
+    old = ["a", "b", "c", "d"]
+    assert stable_items(positions(old), ["x", "a", "c", "y", "d"]) == {"a", "c", "d"}
+
+
+def test_result_is_a_longest_run_in_old_order():
+    rng = random.Random(7)
+    for _ in range(200):
+        old = rng.sample(range(30), rng.randint(0, 20))
+        new = rng.sample(range(30), rng.randint(0, 20))
+        stable = stable_items(positions(old), new)
+        kept = [item for item in new if item in stable]
+        assert all(item in old for item in kept)
+        assert kept == sorted(kept, key=old.index)
+        assert len(kept) == longest_increasing([old.index(item) for item in new if item in old])
+
+
+def longest_increasing(values):
+    best = [1] * len(values)
+    for i in range(len(values)):
+        for j in range(i):
+            if values[j] < values[i]:
+                best[i] = max(best[i], best[j] + 1)
+    return max(best, default=0)
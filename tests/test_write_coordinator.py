@@ -0,0 +1,112 @@
+# tests/test_write_coordinator.py
+# WriteCoordinator group commits and its retries on a busy database.
+
+import sqlite3
+import pytest
+from StudentAttendanceTracker.model.write_coordinator import WriteCoordinator, coordinated, is_busy, submit_write
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(WriteCoordinator, "BACKOFF_SECONDS", 0)
+
+
+def busy():
+    return sqlite3.OperationalError("database is locked")
+
+
+class Classes:
+    def __init__(self, db, failures=0):
+        self.db = db
+        self.failures = failures
+        self.attempts = 0
+
+    @coordinated
+    def add(self, class_name):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise busy()
+        with self.db.writer() as cursor:
+            cursor.execute("INSERT INTO classes (class_name) VALUES (?)", (class_name,))
+        return class_name
+
+
+def class_names(db):
+    with db.reader() as cursor:
+        cursor.execute("SELECT class_name FROM classes ORDER BY class_name")
+        return [row[0] for row in cursor.fetchall()]
+
+
+def test_is_busy():
+    assert is_busy(busy())
+    assert not is_busy(sqlite3.OperationalError("no such table: classes"))
+    assert not is_busy(sqlite3.IntegrityError("UNIQUE constraint failed"))
+
+
+def test_busy_call_is_retried_without_failing_the_rest_of_its_group(db):
+    flaky, steady = Classes(db, failures=2), Classes(db)
+    futures = [submit_write(flaky.add, "Art"), submit_write(steady.add, "Math")]
+
+    assert [future.result(timeout=10) for future in futures] == ["Art", "Math"]
+    assert flaky.attempts == 3
+    assert db.coordinator.metrics()["retries"] == 2
+    assert class_names(db) == ["Art", "Math"]
+
+
+def test_busy_call_fails_after_max_retries(db):
+    flaky = Classes(db, failures=WriteCoordinator.MAX_RETRIES + 1)
+    with pytest.raises(sqlite3.OperationalError):
+        flaky.add("Art")
+    assert flaky.attempts == WriteCoordinator.MAX_RETRIES + 1
+    assert class_names(db) == []
+
+
+def test_other_errors_are_not_retried(db):
+    classes = Classes(db)
+    classes.add("Math")
+    with pytest.raises(sqlite3.IntegrityError):
+        classes.add("Math")
+    assert classes.attempts == 2
+    assert db.coordinator.metrics()["retries"] == 0
+
+
+def test_busy_group_is_retried(db, monkeypatch):
+    coordinator = db.coordinator
+    run_group = coordinator._run_group
+    calls = []
+
+    def locked_once(batch):
+        calls.append(len(batch))
+        if len(calls) == 1:
+            raise busy()
+        return run_group(batch)
+
+    monkeypatch.setattr(coordinator, "_run_group", locked_once)
+
+    assert Classes(db).add("Math") == "Math"
+    assert calls == [1, 1]
+    assert coordinator.metrics()["failed_groups"] == 0
+    assert class_names(db) == ["Math"]
+
+
+class TwoStep:
+    def __init__(self, db):
+        self.db = db
+
+    @coordinated
+    def add_pair(self, first, second):
+        with self.db.writer() as cursor:
+            cursor.execute("INSERT INTO classes (class_name) VALUES (?)", (first,))
+        with self.db.writer() as cursor:
+            cursor.execute("INSERT INTO classes (class_name) VALUES (?)", (second,))
+
+
+def test_failed_call_undoes_all_of_its_own_work_and_nothing_else(db):
+    classes, pairs = Classes(db), TwoStep(db)
+    classes.add("Math")
+    futures = [submit_write(pairs.add_pair, "Art", "Math"), submit_write(classes.add, "Music")]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        futures[0].result(timeout=10)
+    assert futures[1].result(timeout=10) == "Music"
+    assert class_names(db) == ["Math", "Music"]
@@ -1,15 +1,57 @@
 # utils/security.py
 # OOP Concept: Encapsulation (hiding password logic inside methods)
 
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROUNDS = 12
+MIN_ROUNDS, MAX_ROUNDS = 4, 31  # what bcrypt.gensalt accepts
+
+
+def configured_rounds(value=None):
+    """Return the bcrypt cost from value (SAT_BCRYPT_ROUNDS by default), or DEFAULT_ROUNDS if unset or invalid."""
+    value = os.environ.get("SAT_BCRYPT_ROUNDS") if value is None else value
+    if value is None or not str(value).strip():
+        return DEFAULT_ROUNDS
+    try:
+        rounds = int(value)
+    except ValueError:
+        rounds = None
+    if rounds is None or not MIN_ROUNDS <= rounds <= MAX_ROUNDS:
+        logger.warning("⚠️ SAT_BCRYPT_ROUNDS=%r is not a whole number from %d to %d; using %d",
+                       value, MIN_ROUNDS, MAX_ROUNDS, DEFAULT_ROUNDS)
+        return DEFAULT_ROUNDS
+    return rounds
+
+
 class Security:
-    """Handles password hashing and verification."""
+    """Handles password hashing and verification.
+
+    The bcrypt work factor is ROUNDS, set with the SAT_BCRYPT_ROUNDS environment
+    variable (4 to 31, default 12); each extra round doubles the time of a hash or a
+    check. Hashes made at another cost still verify, and needs_rehash() tells
+    the caller to re-hash them at the current cost after a successful login.
+
+    bcrypt releases the GIL, so the *_async methods run it on a small pool and
+    return a concurrent.futures.Future instead of blocking the caller.
+    """
+
+    ROUNDS = configured_rounds()
+    MAX_WORKERS = 2
+
+    _executor = None
+    _executor_lock = threading.Lock()
 
     @staticmethod
-    def hash_password(password):
-        """Hash a password."""
-        return bcrypt.hashpw(password.encode(), bcrypt.gensalt())
+    def hash_password(password, rounds=None):
+        """Hash a password at `rounds` (Security.ROUNDS by default)."""
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds or Security.ROUNDS))
 
     @staticmethod
     def verify_password(password, hashed_password):
@@ -17,3 +59,34 @@ class Security:
         if isinstance(hashed_password, str):
             hashed_password = hashed_password.encode()  # Convert str to bytes
         return bcrypt.checkpw(password.encode(), hashed_password)
+
+    @staticmethod
+    def hash_rounds(hashed_password):
+        """Return the work factor stored in a bcrypt hash ("$2b$12$..." -> 12), or None if unreadable."""
+        if isinstance(hashed_password, bytes):
+            hashed_password = hashed_password.decode()
+        parts = hashed_password.split("$")
+        return int(parts[2]) if len(parts) > 3 and parts[2].isdigit() else None
+
+    @staticmethod
+    def needs_rehash(hashed_password):
+        """Return True if the hash was made at a cost other than Security.ROUNDS."""
+        return Security.hash_rounds(hashed_password) != Security.ROUNDS
+
+    @classmethod
+    def submit(cls, func, *args):
+        """Run func(*args) on the shared hashing pool and return its Future."""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.MAX_WORKERS, thread_name_prefix="bcrypt")
+        return cls._executor.submit(func, *args)
+
+    @staticmethod
+    def hash_password_async(password, rounds=None):
+        """Future of hash_password(password, rounds)."""
+        return Security.submit(Security.hash_password, password, rounds)
+
+    @staticmethod
+    def verify_password_async(password, hashed_password):
+        """Future of verify_password(password, hashed_password)."""
+        return Security.submit(Security.verify_password, password, hashed_password)
@@ -0,0 +1,134 @@
+# utils/worker.py
+# OOP Concept: Class, Encapsulation, Concurrency (thread pool + Tk event loop)
+
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundWorker:
+    """Runs blocking work (SQL queries) off the Tk thread.
+
+    Jobs run on a small thread pool and their results are handed back through
+    a queue that the Tk thread drains with ``root.after``, so callbacks always
+    run on the Tk thread. Every job belongs to a channel (e.g. "reports");
+    submitting again on a channel, or cancelling it, makes any older result on
+    that channel stale, and stale results are dropped instead of delivered.
+    listen() hands events published on any thread to the Tk thread the same way.
+    Polling stops when no job is pending. Events come from writes this window
+    started, and those writes are pending jobs, so their events arrive while
+    polling is still running.
+    """
+
+    POLL_INTERVAL_MS = 25
+
+    def __init__(self, root, max_workers=2):
+        """Initialize with the Tk root whose event loop receives results."""
+        self.root = root
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-worker")
+        self._results = queue.Queue()
+        self._events = queue.Queue()
+        self._unsubscribers = []
+        self._generations = {}
+        self._pending = 0
+        self._polling = False
+
+    def submit(self, channel, func, on_done, on_error=None):
+        """Run func() in the pool and pass its result to on_done(result) on the Tk thread.
+
+        Args:
+            channel (str): Name grouping related jobs; newer jobs supersede older ones.
+            func (callable): Blocking work taking no arguments.
+            on_done (callable): Called with the result if it is still current.
+            on_error (callable): Called with the exception if func raised.
+        """
+        self.watch(channel, self._executor.submit(func), on_done, on_error)
+
+    def watch(self, channel, future, on_done, on_error=None):
+        """Deliver a Future started elsewhere (e.g. on the hashing pool) like a submitted job."""
+        generation = self._next_generation(channel)
+        self._pending += 1
+        future.add_done_callback(
+            lambda done: self._results.put((channel, generation, done, on_done, on_error)))
+        self._ensure_polling()
+
+    def listen(self, bus, event_type, handler):
+        """Call handler(event) on the Tk thread for each event_type published on an EventBus, from any thread."""
+        self._unsubscribers.append(bus.subscribe(event_type, lambda event: self._events.put((handler, event))))
+
+    def cancel(self, channel=None):
+        """Mark pending results of one channel (or of every channel) as stale."""
+        channels = [channel] if channel else list(self._generations)
+        for name in channels:
+            self._next_generation(name)
+
+    def is_current(self, channel, generation):
+        """Return True if generation is still the latest job on channel."""
+        return self._generations.get(channel, 0) == generation
+
+    def shutdown(self):
+        """Stop listening, drop pending results and stop the pool without waiting for running jobs."""
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _next_generation(self, channel):
+        generation = self._generations.get(channel, 0) + 1
+        self._generations[channel] = generation
+        return generation
+
+    def _ensure_polling(self):
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        """Deliver events and finished results on the Tk thread; keep polling while jobs are pending."""
+        try:
+            # A write publishes its event before its result is queued, so events are drained
+            # before the results (pages are usually stale before on_done runs) and again after
+            # them (to catch events published since the first drain)
+            self._deliver_events()
+            while True:
+                try:
+                    channel, generation, future, on_done, on_error = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                self._pending -= 1
+                if not self.is_current(channel, generation) or future.cancelled():
+                    continue
+                self._deliver(channel, future, on_done, on_error)
+            self._deliver_events()
+        finally:
+            if self._pending > 0:
+                self.root.after(self.POLL_INTERVAL_MS, self._poll)
+            else:
+                self._polling = False
+
+    def _deliver_events(self):
+        while True:
+            try:
+                handler, event = self._events.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                handler(event)
+            except Exception as e:
+                logger.error("❌ Handler for %r failed: %s", event, e)
+
+    @staticmethod
+    def _deliver(channel, future, on_done, on_error):
+        error = future.exception()
+        try:
+            if error is None:
+                on_done(future.result())
+            elif on_error:
+                on_error(error)
+            else:
+                logger.error("❌ Background job on '%s' failed: %s", channel, error)
+        except Exception as e:
+            logger.error("❌ Callback for '%s' failed: %s", channel, e)
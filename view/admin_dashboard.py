@@ -2,20 +2,52 @@
 # OOP Concept: Class, Encapsulation, Dynamic Modern Admin Panel
 
 import tkinter as tk
-import csv
 import tkinter.ttk as ttk
 from tkinter import messagebox
-from StudentAttendanceTracker.model.database import Database
+from StudentAttendanceTracker.controller.services import Services
+from StudentAttendanceTracker.model.events import (AttendanceChanged, ClassesChanged, InstructorsChanged,
+                                                   StudentsChanged)
+from StudentAttendanceTracker.model.export import ExportCancelled
+from StudentAttendanceTracker.model.reports import AttendanceReport
+from StudentAttendanceTracker.model.write_coordinator import submit_write
 from StudentAttendanceTracker.utils.security import Security
+from StudentAttendanceTracker.utils.worker import BackgroundWorker
+from StudentAttendanceTracker.view.virtual_tree import VirtualTreeview
+from StudentAttendanceTracker.view.data_grid import DataGrid
+from StudentAttendanceTracker.view.analytics_pane import AnalyticsPane
+from StudentAttendanceTracker.view.diagnostics_pane import DiagnosticsPane
+from StudentAttendanceTracker.view.pane_stack import PaneStack
 
 
 class AdminDashboard:
     """Full Admin Dashboard - Professional Modern Layout."""
 
+    SEARCH_DELAY_MS = 250
+
+    # Pages that show each kind of record, marked stale when a write announces a change to it
+    PAGES_SHOWING = {
+        InstructorsChanged: ("instructors", "all_instructors"),
+        StudentsChanged: ("students", "all_students", "reports", "analytics"),
+        ClassesChanged: ("classes", "all_classes", "instructors", "analytics"),
+        AttendanceChanged: ("reports", "analytics"),
+    }
+
     def __init__(self, root, username):
         """Initialize Admin Dashboard."""
         self.root = root
         self.username = username
+        services = self.services = Services.default()
+        # The query log and write metrics live in the process that owns the database file,
+        # so Diagnostics is only offered when that is this one (not through SAT_API_URL)
+        self.db = None if Services.api_url() else services.db
+        self.auth = services.auth
+        self.students = services.students
+        self.classes = services.classes
+        self.instructors = services.instructors
+        self.reports = services.reports
+        self.worker = BackgroundWorker(self.root)
+        self.search_after_id = None
+        self.active_report = None
         self.root.title("Admin Dashboard - Student Attendance Tracker")
 
         self.root.geometry("1150x700")
@@ -38,6 +70,12 @@ class AdminDashboard:
         # Sidebar Buttons
         self.add_sidebar_buttons()
 
+        # Pages are built on first visit and kept; see register_pages
+        self.pages = PaneStack(self.main_content, version=self.services.data_version)
+        self.register_pages()
+        for event_type, names in self.PAGES_SHOWING.items():
+            self.worker.listen(services.events, event_type, lambda event, names=names: self.invalidate_pages(*names))
+
         self.is_dark_mode = False
         self.apply_theme()
         self.show_dashboard_overview()
@@ -56,60 +94,133 @@ class AdminDashboard:
 
         self.dashboard_btn = tk.Button(self.sidebar, text="🎯 Dashboard", command=self.show_dashboard_overview,
                                        **button_settings)
-        self.dashboard_btn.pack(pady=10, padx=10)
+        self.dashboard_btn.pack(pady=6, padx=10)
 
         self.instructors_btn = tk.Button(self.sidebar, text="👩‍🏫 Manage Instructors", command=self.show_manage_instructors, **button_settings)
-        self.instructors_btn.pack(pady=10, padx=10)
+        self.instructors_btn.pack(pady=6, padx=10)
 
         self.students_btn = tk.Button(self.sidebar, text="🎓 Manage Students", command=self.show_manage_students, **button_settings)
-        self.students_btn.pack(pady=10, padx=10)
+        self.students_btn.pack(pady=6, padx=10)
 
         self.reports_btn = tk.Button(self.sidebar, text="📄 View Reports", command=self.show_view_reports, **button_settings)
-        self.reports_btn.pack(pady=10, padx=10)
+        self.reports_btn.pack(pady=6, padx=10)
+
+        self.analytics_btn = tk.Button(self.sidebar, text="📊 Analytics", command=self.show_analytics, **button_settings)
+        self.analytics_btn.pack(pady=6, padx=10)
 
         self.class_btn = tk.Button(self.sidebar, text="🏫 Manage Class", command=self.show_manage_class, **button_settings)
-        self.class_btn.pack(pady=10, padx=10)
+        self.class_btn.pack(pady=6, padx=10)
 
         self.profile_btn = tk.Button(self.sidebar, text="⚙️ Admin Profile", command=self.show_admin_profile, **button_settings)
-        self.profile_btn.pack(pady=10, padx=10)
+        self.profile_btn.pack(pady=6, padx=10)
+
+        if self.db:
+            self.diagnostics_btn = tk.Button(self.sidebar, text="🩺 Diagnostics", command=self.show_diagnostics,
+                                             **button_settings)
+            self.diagnostics_btn.pack(pady=6, padx=10)
 
         self.theme_btn = tk.Button(self.sidebar, text="🌗 Toggle Theme", command=self.toggle_theme, **button_settings)
-        self.theme_btn.pack(pady=10, padx=10)
+        self.theme_btn.pack(pady=6, padx=10)
 
         self.logout_btn = tk.Button(self.sidebar, text="🔒 Logout", command=self.logout,
                                     font=("Arial", 12, "bold"), width=22, height=2, bg="red", fg="white", bd=0)
-        self.logout_btn.pack(pady=20, padx=10)
+        self.logout_btn.pack(pady=12, padx=10)
+
+    def register_pages(self):
+        """Register every page with the PaneStack: how to build it once and how to reload its data."""
+        # The overview and diagnostics are cheap to reload, so they refresh on each visit; the rest
+        # only after a change event (see PAGES_SHOWING) or a write from another PC (see PaneStack)
+        self.pages.register("overview", self.build_dashboard_overview, self.refresh_dashboard_overview,
+                            always_refresh=True)
+        self.pages.register("instructors", self.build_manage_instructors, self.refresh_manage_instructors)
+        self.pages.register("all_instructors", self.build_all_instructors, lambda: self.all_instructors_grid.reload())
+        self.pages.register("students", self.build_manage_students, self.search_students)
+        self.pages.register("all_students", self.build_all_students, lambda: self.all_students_grid.reload())
+        self.pages.register("reports", self.build_view_reports, self.refresh_view_reports)
+        self.pages.register("analytics", self.build_analytics, lambda: self.analytics_pane.load_classes())
+        self.pages.register("classes", self.build_manage_class, self.load_classes)
+        self.pages.register("all_classes", self.build_all_classes, lambda: self.all_classes_grid.reload())
+        self.pages.register("profile", self.build_admin_profile)
+        if self.db:
+            self.pages.register("diagnostics", self.build_diagnostics, lambda: self.diagnostics_pane.refresh(),
+                                always_refresh=True)
+
+    def invalidate_pages(self, *names):
+        """Reload the named pages: the visible one now, the others when next shown."""
+        self.pages.invalidate(*names)
+
+    def show_background_error(self, error):
+        """Report a failed background query."""
+        messagebox.showerror("Error", f"Could not load data.\n{error}")
+
+    def save_in_background(self, channel, write, args, saved, failure):
+        """Start a write without blocking the Tk thread; saved(result) runs once it has committed.
+
+        Args:
+            failure (str): First line of the error box shown if the write fails.
+        """
+        self.worker.watch(channel, submit_write(write, *args), saved,
+                          lambda error: messagebox.showerror("Error", f"{failure}\n{error}"))
+
+    def build_data_grid(self, page, title, columns, fetch_page, sort_keys, sort, noun, back_text, back_command,
+                        column_width=200):
+        """Fill a View All page: title, row count, a sortable DataGrid and a back button; return the grid."""
+        tk.Label(page, text=title, font=("Arial", 20, "bold"), bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
+
+        status_label = tk.Label(page, text="", font=("Arial", 11), bg="#f0f0f0", fg="#2e2e2e")
+        status_label.pack()
+
+        def show_status(row_count, complete):
+            status_label.config(text=f"{row_count} {noun}" if complete
+                                else f"Showing {row_count} {noun} (scroll for more)")
+
+        table_frame = tk.Frame(page, bg="#f0f0f0")
+        table_frame.pack(expand=True, fill="both", padx=20)
+        grid = DataGrid(table_frame, columns, self.worker, f"grid_{noun}", fetch_page, sort_keys, sort=sort,
+                        column_width=column_width, on_status=show_status, on_error=self.show_background_error,
+                        bg="#f0f0f0")
+        grid.pack(expand=True, fill="both")
 
-    def clear_main_content(self):
-        """Clear the Main Content."""
-        for widget in self.main_content.winfo_children():
-            widget.destroy()
+        # Back Button
+        tk.Button(page, text=back_text, font=("Arial", 12, "bold"),
+                  width=30, bg="#dbe0e6", fg="#2e2e2e", command=back_command).pack(pady=20)
+        return grid
 
     # -------------------------- Pages --------------------------
 
     def show_dashboard_overview(self):
         """Show Admin Dashboard Overview with Stats."""
-        self.clear_main_content()
+        self.pages.show("overview")
 
-        tk.Label(self.main_content, text="Welcome to Dashboard 🎯", font=("Arial", 22, "bold"),
+    def build_dashboard_overview(self, page):
+        tk.Label(page, text="Welcome to Dashboard 🎯", font=("Arial", 22, "bold"),
                  bg="#f0f0f0", fg="#2e2e2e").pack(pady=30)
 
-        stats_frame = tk.Frame(self.main_content, bg="#f0f0f0")
-        stats_frame.pack(pady=10, padx=20)
-
-        # Fetch statistics
-        total_students = self.get_total_students()
-        total_instructors = self.get_total_instructors()
-        total_classes = self.get_total_classes()
-        total_attendance = self.get_total_attendance()
-
-        cards = [
-            ("🎓 Total Students", total_students),
-            ("👩‍🏫 Total Instructors", total_instructors),
-            ("🏫 Total Classes", total_classes),
-            ("📄 Attendance Records", total_attendance)
-        ]
-
+        self.stats_frame = tk.Frame(page, bg="#f0f0f0")
+        self.stats_frame.pack(pady=10, padx=20)
+
+        tk.Label(self.stats_frame, text="⏳ Loading statistics...", font=("Arial", 12),
+                 bg="#f0f0f0", fg="#2e2e2e").grid(row=0, column=0, pady=20)
+
+    def refresh_dashboard_overview(self):
+        """Reload the stat cards; the old cards stay up until the new counts arrive."""
+        # Fetch statistics off the Tk thread, from the trigger-maintained row counts
+        def fetch_stats():
+            counts = self.reports.overview_counts()
+            return [
+                ("🎓 Total Students", counts.get("students", 0)),
+                ("👩‍🏫 Total Instructors", counts.get("instructors", 0)),
+                ("🏫 Total Classes", counts.get("classes", 0)),
+                ("📄 Attendance Records", counts.get("attendance", 0))
+            ]
+
+        self.worker.submit("overview", fetch_stats, self.render_overview_cards, self.show_background_error)
+
+    def render_overview_cards(self, cards):
+        """Draw one stat card per (title, count)."""
+        stats_frame = self.stats_frame
+        for widget in stats_frame.winfo_children():
+            widget.destroy()
         for idx, (title, count) in enumerate(cards):
             card = tk.Frame(stats_frame, bg="#dbe0e6", width=200, height=150, bd=2, relief="ridge")
             card.grid(row=0, column=idx, padx=20)
@@ -117,50 +228,15 @@ class AdminDashboard:
             tk.Label(card, text=title, font=("Arial", 12, "bold"), bg="#dbe0e6", fg="#2e2e2e").pack(pady=10)
             tk.Label(card, text=str(count), font=("Arial", 24, "bold"), bg="#dbe0e6", fg="#2e2e2e").pack()
 
-    def get_total_students(self):
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute("SELECT COUNT(*) FROM students")
-        result = cursor.fetchone()[0]
-        db.close()
-        return result
-
-    def get_total_instructors(self):
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute("SELECT COUNT(*) FROM instructors")
-        result = cursor.fetchone()[0]
-        db.close()
-        return result
-
-    def get_total_classes(self):
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute("SELECT COUNT(*) FROM classes")
-        result = cursor.fetchone()[0]
-        db.close()
-        return result
-
-    def get_total_attendance(self):
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute("SELECT COUNT(*) FROM attendance")
-        result = cursor.fetchone()[0]
-        db.close()
-        return result
-
     def show_manage_instructors(self):
         """Manage Instructors Form and List."""
-        self.clear_main_content()
+        self.pages.show("instructors")
 
-        tk.Label(self.main_content, text="Manage Instructors 👩‍🏫", font=("Arial", 20, "bold"),
+    def build_manage_instructors(self, page):
+        tk.Label(page, text="Manage Instructors 👩‍🏫", font=("Arial", 20, "bold"),
                  bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
 
-        container = tk.Frame(self.main_content, bg="#f0f0f0")
+        container = tk.Frame(page, bg="#f0f0f0")
         container.pack(expand=True, fill="both", padx=20)
 
         # Left Form
@@ -217,71 +293,37 @@ class AdminDashboard:
 
         self.instructor_listbox.bind("<<ListboxSelect>>", self.load_instructor_to_form)
 
-        # Load data
+    def refresh_manage_instructors(self):
         self.load_departments_for_instructors()
         self.load_instructors()
 
     def load_departments_for_instructors(self):
         """Load available Departments from Class table into combobox."""
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-
-        cursor.execute("SELECT class_name FROM classes ORDER BY class_name ASC")
-        departments = [row[0] for row in cursor.fetchall()]
-        self.inst_dept_combobox["values"] = departments
+        def show_departments(classes):
+            self.inst_dept_combobox["values"] = classes
 
-        db.close()
+        self.worker.submit("departments", self.classes.list_classes, show_departments, self.show_background_error)
 
     def view_all_instructors(self):
         """Show All Instructors neatly with 4 columns inside main content."""
-        self.clear_main_content()
-
-        tk.Label(self.main_content, text="All Instructors 📋", font=("Arial", 20, "bold"),
-                 bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
-
-        table_frame = tk.Frame(self.main_content, bg="#f0f0f0")
-        table_frame.pack(expand=True, fill="both", padx=20)
+        self.pages.show("all_instructors")
 
-        # Column Headers
-        headers = ["Instructor ID", "Instructor Name", "Instructor Email", "Instructor Department"]
-        for idx, header in enumerate(headers):
-            tk.Label(table_frame, text=header, font=("Arial", 12, "bold"),
-                     bg="#dbe0e6", fg="#2e2e2e", width=20, relief="groove").grid(row=0, column=idx, padx=1, pady=1)
-
-        # Fetch Instructor Data
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-
-        cursor.execute("SELECT instructor_id, name, email, department FROM instructors")
-        instructors = cursor.fetchall()
-
-        # Display Rows
-        for row_idx, instructor in enumerate(instructors, start=1):
-            for col_idx, value in enumerate(instructor):
-                tk.Label(table_frame, text=value if value else "-", font=("Arial", 12),
-                         bg="white", fg="#2e2e2e", width=20, relief="ridge").grid(row=row_idx, column=col_idx, padx=1,
-                                                                                  pady=1)
-
-        db.close()
-
-        # Back Button
-        tk.Button(self.main_content, text="🔙 Back to Manage Instructors", font=("Arial", 12, "bold"),
-                  width=30, bg="#dbe0e6", fg="#2e2e2e", command=self.show_manage_instructors).pack(pady=20)
+    def build_all_instructors(self, page):
+        self.all_instructors_grid = self.build_data_grid(
+            page, "All Instructors 📋", ("Instructor ID", "Instructor Name", "Instructor Email", "Instructor Department"),
+            self.instructors.page, {"Instructor ID": "instructor_id", "Instructor Name": "name",
+                                    "Instructor Department": "department"}, "name", "instructors",
+            "🔙 Back to Manage Instructors", self.show_manage_instructors)
 
     def load_instructors(self):
         """Load instructors into listbox."""
-        self.instructor_listbox.delete(0, tk.END)
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
+        def show_instructors(instructors):
+            self.instructor_listbox.delete(0, tk.END)
+            for row in instructors:
+                self.instructor_listbox.insert(tk.END, f"{row[0]} ({row[1]})")
 
-        cursor.execute("SELECT name, instructor_id FROM instructors")
-        for row in cursor.fetchall():
-            self.instructor_listbox.insert(tk.END, f"{row[0]} ({row[1]})")
-
-        db.close()
+        self.worker.submit("instructors", self.instructors.list_instructors, show_instructors,
+                           self.show_background_error)
 
     def load_instructor_to_form(self, event):
         """Load selected instructor to form."""
@@ -291,20 +333,15 @@ class AdminDashboard:
             name_part, id_part = item.rsplit("(", 1)
             inst_id = id_part.replace(")", "").strip()
 
-            db = Database()
-            db.connect()
-            cursor = db.connection.cursor()
-
-            cursor.execute("SELECT name, instructor_id, email, department FROM instructors WHERE instructor_id = ?", (inst_id,))
-            instructor = cursor.fetchone()
-
-            if instructor:
-                self.inst_name_var.set(instructor[0])
-                self.inst_id_var.set(instructor[1])
-                self.inst_email_var.set(instructor[2])
-                self.inst_dept_var.set(instructor[3])
+            def fill_form(instructor):
+                if instructor:
+                    self.inst_name_var.set(instructor[0])
+                    self.inst_id_var.set(instructor[1])
+                    self.inst_email_var.set(instructor[2])
+                    self.inst_dept_var.set(instructor[3])
 
-            db.close()
+            self.worker.submit("instructor_form", lambda: self.instructors.get(inst_id), fill_form,
+                               self.show_background_error)
 
     def add_instructor(self):
         """Add Instructor and create login account."""
@@ -314,31 +351,17 @@ class AdminDashboard:
         dept = self.inst_dept_var.get().strip()
 
         if name and inst_id:
-            db = Database()
-            db.connect()
-            cursor = db.connection.cursor()
-
-            try:
-                # Insert into instructors table
-                cursor.execute("INSERT INTO instructors (name, instructor_id, email, department) VALUES (?, ?, ?, ?)",
-                               (name, inst_id, email, dept))
-
-                # Insert into users table: username = Instructor Name
-                hashed_password = Security.hash_password("12345").decode('utf-8')
-                cursor.execute("INSERT INTO users (username, password, role) VALUES (?, ?, ?)",
-                               (name, hashed_password, "Instructor"))
-
-                db.connection.commit()
-                self.load_instructors()
-
+            def created(_):
                 # Show Username + Default Password
                 messagebox.showinfo("Success",
-                                    f"Instructor and Login Account created successfully!\n\nUsername: {name}\nDefault Password: 12345")
+                                    f"Instructor and Login Account created successfully!\n\nUsername: {name}\nDefault Password: {self.instructors.DEFAULT_PASSWORD}")
 
-            except Exception as e:
+            def failed(e):
                 messagebox.showerror("Error", f"Error adding instructor.\n{e}")
 
-            db.close()
+            # Creating the login account hashes a password, so it runs on the hashing pool
+            job = Security.submit(self.instructors.create, name, inst_id, email, dept)
+            self.worker.watch("add_instructor", job, created, failed)
         else:
             messagebox.showwarning("Warning", "Please fill Name and ID.")
 
@@ -350,20 +373,9 @@ class AdminDashboard:
         dept = self.inst_dept_var.get()
 
         if name and inst_id:
-            db = Database()
-            db.connect()
-            cursor = db.connection.cursor()
-
-            try:
-                cursor.execute("UPDATE instructors SET name=?, email=?, department=? WHERE instructor_id=?",
-                               (name, email, dept, inst_id))
-                db.connection.commit()
-                self.load_instructors()
-                messagebox.showinfo("Success", "Instructor updated successfully!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Error updating instructor.\n{e}")
-
-            db.close()
+            self.save_in_background("edit_instructor", self.instructors.update, (inst_id, name, email, dept),
+                                    lambda _: messagebox.showinfo("Success", "Instructor updated successfully!"),
+                                    "Error updating instructor.")
         else:
             messagebox.showwarning("Warning", "Please select an instructor.")
 
@@ -373,35 +385,28 @@ class AdminDashboard:
 
         if inst_id:
             if messagebox.askyesno("Confirm", "Are you sure to delete this instructor?"):
-                db = Database()
-                db.connect()
-                cursor = db.connection.cursor()
-
-                try:
-                    cursor.execute("DELETE FROM instructors WHERE instructor_id=?", (inst_id,))
-                    db.connection.commit()
-                    self.load_instructors()
+                def deleted(_):
                     self.inst_name_var.set("")
                     self.inst_id_var.set("")
                     self.inst_email_var.set("")
                     self.inst_dept_var.set("")
                     messagebox.showinfo("Success", "Instructor deleted successfully!")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Error deleting instructor.\n{e}")
 
-                db.close()
+                self.save_in_background("delete_instructor", self.instructors.delete, (inst_id,), deleted,
+                                        "Error deleting instructor.")
 
     # ---------------- Others ----------------
 
     def show_manage_students(self):
         """Manage Students Form and List."""
-        self.clear_main_content()
+        self.pages.show("students")
 
-        tk.Label(self.main_content, text="Manage Students 🎓", font=("Arial", 20, "bold"),
+    def build_manage_students(self, page):
+        tk.Label(page, text="Manage Students 🎓", font=("Arial", 20, "bold"),
                  bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
 
         # After Title and before container:
-        filter_frame = tk.Frame(self.main_content, bg="#f0f0f0")
+        filter_frame = tk.Frame(page, bg="#f0f0f0")
         filter_frame.pack(pady=10)
 
         tk.Label(filter_frame, text="Select Class:", font=("Arial", 12),
@@ -415,7 +420,7 @@ class AdminDashboard:
         tk.Button(filter_frame, text="🔍 Filter", font=("Arial", 12),
                   bg="#dbe0e6", fg="#2e2e2e", command=self.filter_students_by_class).pack(side="left", padx=5)
 
-        container = tk.Frame(self.main_content, bg="#f0f0f0")
+        container = tk.Frame(page, bg="#f0f0f0")
         container.pack(expand=True, fill="both", padx=20)
 
         # Left Form Area
@@ -452,34 +457,59 @@ class AdminDashboard:
         tk.Label(list_frame, text="Student List 📚", font=("Arial", 14, "bold"),
                  bg="#f0f0f0", fg="#2e2e2e").pack(pady=10)
 
+        search_frame = tk.Frame(list_frame, bg="#f0f0f0")
+        search_frame.pack(fill="x", padx=10)
+        tk.Label(search_frame, text="🔎 Search:", font=("Arial", 12), bg="#f0f0f0", fg="#2e2e2e").pack(side="left")
+        self.student_search_var = tk.StringVar()
+        tk.Entry(search_frame, textvariable=self.student_search_var, font=("Arial", 12)).pack(
+            side="left", expand=True, fill="x", padx=5)
+        self.student_search_var.trace_add("write", self.schedule_student_search)
+
         self.student_listbox = tk.Listbox(list_frame, font=("Arial", 12), bg="white", fg="#2e2e2e", height=20, width=50)
         self.student_listbox.pack(padx=10, pady=10, expand=True, fill="both")
 
         self.student_listbox.bind("<<ListboxSelect>>", self.load_student_to_form)
 
-        self.load_students()
-
     def load_students(self, class_name=None):
         """Load all students into listbox. If class_name is provided, filter students."""
         self.student_listbox.delete(0, tk.END)
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-
-        if class_name:
-            cursor.execute("SELECT name, roll_number FROM students WHERE class_name=?", (class_name,))
-        else:
-            cursor.execute("SELECT name, roll_number FROM students")
 
-        for row in cursor.fetchall():
-            self.student_listbox.insert(tk.END, f"{row[0]} ({row[1]})")
+        def fetch_students():
+            # Also update Class list for Combobox
+            return self.students.list_students(class_name=class_name), self.students.class_names()
+
+        def show_students(result):
+            students, classes = result
+            self.student_listbox.delete(0, tk.END)
+            for row in students:
+                self.student_listbox.insert(tk.END, f"{row[0]} ({row[1]})")
+            self.class_filter_combobox["values"] = classes
+
+        self.worker.submit("students", fetch_students, show_students, self.show_background_error)
+
+    def schedule_student_search(self, *args):
+        """Debounce typing: search once the user pauses for SEARCH_DELAY_MS."""
+        if self.search_after_id:
+            self.root.after_cancel(self.search_after_id)
+        self.search_after_id = self.root.after(self.SEARCH_DELAY_MS, self.search_students)
+
+    def search_students(self):
+        """Show students whose name, roll number or email match the search box."""
+        self.search_after_id = None
+        text = self.student_search_var.get().strip()
+        class_name = self.class_filter_var.get() or None
+        if not text:
+            self.load_students(class_name=class_name)
+            return
 
-        # Also update Class list for Combobox
-        cursor.execute("SELECT DISTINCT class_name FROM students WHERE class_name IS NOT NULL")
-        classes = [row[0] for row in cursor.fetchall()]
-        self.class_filter_combobox["values"] = classes
+        def show_matches(students):
+            self.student_listbox.delete(0, tk.END)
+            for name, roll_number, _ in students:
+                self.student_listbox.insert(tk.END, f"{name} ({roll_number})")
 
-        db.close()
+        # Same channel as load_students, so only the latest keystroke's results are shown
+        self.worker.submit("students", lambda: self.students.search(text, class_name=class_name),
+                           show_matches, self.show_background_error)
 
     def load_student_to_form(self, event):
         """Load selected student to form fields."""
@@ -489,21 +519,15 @@ class AdminDashboard:
             name_part, roll_part = item.rsplit("(", 1)
             roll_number = roll_part.replace(")", "").strip()
 
-            db = Database()
-            db.connect()
-            cursor = db.connection.cursor()
-
-            cursor.execute("SELECT name, roll_number, email, class_name FROM students WHERE roll_number = ?",
-                           (roll_number,))
-            student = cursor.fetchone()
-
-            if student:
-                self.stud_name_var.set(student[0])
-                self.stud_roll_var.set(student[1])
-                self.stud_email_var.set(student[2])
-                self.stud_class_var.set(student[3])
+            def fill_form(student):
+                if student:
+                    self.stud_name_var.set(student[0])
+                    self.stud_roll_var.set(student[1])
+                    self.stud_email_var.set(student[2])
+                    self.stud_class_var.set(student[3])
 
-            db.close()
+            self.worker.submit("student_form", lambda: self.students.get(roll_number), fill_form,
+                               self.show_background_error)
 
     def edit_student(self):
         """Edit selected student."""
@@ -513,20 +537,9 @@ class AdminDashboard:
         class_name = self.stud_class_var.get()
 
         if name and roll:
-            db = Database()
-            db.connect()
-            cursor = db.connection.cursor()
-
-            try:
-                cursor.execute("UPDATE students SET name=?, email=?, class_name=? WHERE roll_number=?",
-                               (name, email, class_name, roll))
-                db.connection.commit()
-                self.load_students()
-                messagebox.showinfo("Success", "Student updated successfully!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Error updating student.\n{e}")
-
-            db.close()
+            self.save_in_background("edit_student", self.students.update, (roll, name, email, class_name),
+                                    lambda _: messagebox.showinfo("Success", "Student updated successfully!"),
+                                    "Error updating student.")
         else:
             messagebox.showwarning("Warning", "Please select a student.")
 
@@ -534,7 +547,7 @@ class AdminDashboard:
         """Filter students based on selected class."""
         selected_class = self.class_filter_var.get()
         if selected_class:
-            self.load_students(class_name=selected_class)
+            self.search_students()  # keeps any search text, narrowed to the class
         else:
             messagebox.showwarning("Warning", "Please select a class to filter.")
 
@@ -544,20 +557,12 @@ class AdminDashboard:
 
         if roll:
             if messagebox.askyesno("Confirm Delete", "Are you sure to delete this student?"):
-                db = Database()
-                db.connect()
-                cursor = db.connection.cursor()
-
-                try:
-                    cursor.execute("DELETE FROM students WHERE roll_number=?", (roll,))
-                    db.connection.commit()
-                    self.load_students()
+                def deleted(_):
                     self.clear_student_form()
                     messagebox.showinfo("Success", "Student deleted successfully!")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Error deleting student.\n{e}")
 
-                db.close()
+                self.save_in_background("delete_student", self.students.delete, (roll,), deleted,
+                                        "Error deleting student.")
 
     def clear_student_form(self):
         """Clear student form entries."""
@@ -568,47 +573,24 @@ class AdminDashboard:
 
     def view_all_students(self):
         """View all students in table format inside main content."""
-        self.clear_main_content()
-
-        tk.Label(self.main_content, text="All Students 📋", font=("Arial", 20, "bold"),
-                 bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
-
-        table_frame = tk.Frame(self.main_content, bg="#f0f0f0")
-        table_frame.pack(expand=True, fill="both", padx=20)
-
-        headers = ["Roll Number", "Student Name", "Email", "Class Name"]
-        for idx, header in enumerate(headers):
-            tk.Label(table_frame, text=header, font=("Arial", 12, "bold"),
-                     bg="#dbe0e6", fg="#2e2e2e", width=20, relief="groove").grid(row=0, column=idx, padx=1, pady=1)
-
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-
-        cursor.execute("SELECT roll_number, name, email, class_name FROM students")
-        students = cursor.fetchall()
-
-        for row_idx, student in enumerate(students, start=1):
-            for col_idx, value in enumerate(student):
-                tk.Label(table_frame, text=value if value else "-", font=("Arial", 12),
-                         bg="white", fg="#2e2e2e", width=20, relief="ridge").grid(row=row_idx, column=col_idx, padx=1,
-                                                                                  pady=1)
+        self.pages.show("all_students")
 
-        db.close()
-
-        # Back Button
-        tk.Button(self.main_content, text="🔙 Back to Manage Students", font=("Arial", 12, "bold"),
-                  width=30, bg="#dbe0e6", fg="#2e2e2e", command=self.show_manage_students).pack(pady=20)
+    def build_all_students(self, page):
+        self.all_students_grid = self.build_data_grid(
+            page, "All Students 📋", ("Roll Number", "Student Name", "Email", "Class Name"),
+            self.students.page, {"Roll Number": "roll_number", "Student Name": "name", "Class Name": "class_name"},
+            "roll_number", "students", "🔙 Back to Manage Students", self.show_manage_students)
 
     def show_view_reports(self):
         """Show Attendance Reports View."""
-        self.clear_main_content()
+        self.pages.show("reports")
 
-        tk.Label(self.main_content, text="Attendance Reports 📄", font=("Arial", 20, "bold"),
+    def build_view_reports(self, page):
+        tk.Label(page, text="Attendance Reports 📄", font=("Arial", 20, "bold"),
                  bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
 
         # Filter Area
-        filter_frame = tk.Frame(self.main_content, bg="#f0f0f0")
+        filter_frame = tk.Frame(page, bg="#f0f0f0")
         filter_frame.pack(pady=10)
 
         tk.Label(filter_frame, text="Select Class:", font=("Arial", 12), bg="#f0f0f0", fg="#2e2e2e").pack(side="left",
@@ -629,118 +611,163 @@ class AdminDashboard:
         tk.Button(filter_frame, text="📥 Export CSV", font=("Arial", 12),
                   bg="#dbe0e6", fg="#2e2e2e", command=self.export_attendance_to_csv).pack(side="left", padx=5)
 
+        self.report_status_label = tk.Label(page, text="", font=("Arial", 11),
+                                            bg="#f0f0f0", fg="#2e2e2e")
+        self.report_status_label.pack()
+        self.report_summary_label = tk.Label(page, text="", font=("Arial", 11, "bold"),
+                                             bg="#f0f0f0", fg="#2e2e2e")
+        self.report_summary_label.pack()
+
         # Table Area
-        table_frame = tk.Frame(self.main_content, bg="#f0f0f0")
+        table_frame = tk.Frame(page, bg="#f0f0f0")
         table_frame.pack(expand=True, fill="both", padx=20, pady=10)
 
-        columns = ("Date", "Student Name", "Roll Number", "Status")
+        columns = AttendanceReport.COLUMNS
 
-        self.attendance_tree = ttk.Treeview(table_frame, columns=columns, show="headings")
-        for col in columns:
-            self.attendance_tree.heading(col, text=col)
-            self.attendance_tree.column(col, anchor="center", width=200)
-
-        self.attendance_tree.pack(expand=True, fill="both")
+        self.report_table = VirtualTreeview(table_frame, columns, self.worker, "reports", column_width=200,
+                                            on_status=self.update_report_status,
+                                            on_error=self.show_background_error, bg="#f0f0f0")
+        self.report_table.pack(expand=True, fill="both")
+        self.attendance_tree = self.report_table.tree
 
+    def refresh_view_reports(self):
+        """Reload the class list and re-run the active report filter (all attendance at first)."""
         self.load_class_list_for_reports()
-        self.load_all_attendance()
+        self.show_report(self.active_report or self.reports.report())
 
     def export_attendance_to_csv(self):
-        """Export current attendance table to CSV."""
+        """Export every row of the active report filter to CSV (or gzipped CSV)."""
 
         from tkinter import filedialog
 
         file_path = filedialog.asksaveasfilename(defaultextension=".csv",
-                                                 filetypes=[("CSV files", "*.csv")],
+                                                 filetypes=[("CSV files", "*.csv"),
+                                                            ("Compressed CSV files", "*.csv.gz")],
                                                  title="Save Attendance Report")
         if not file_path:
             return  # User cancelled
 
-        try:
-            with open(file_path, mode='w', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                # Write header
-                writer.writerow(["Date", "Student Name", "Roll Number", "Status"])
+        report = self.active_report or self.reports.report()
+        exporter = self.reports.exporter(report, file_path)
 
-                # Write data
-                for row_id in self.attendance_tree.get_children():
-                    row = self.attendance_tree.item(row_id)['values']
-                    writer.writerow(row)
+        # Modal progress window; the export itself runs on the background worker
+        popup = tk.Toplevel(self.root)
+        popup.title("Exporting Attendance")
+        popup.geometry("400x150")
+        popup.config(bg="#f0f0f0")
+        popup.transient(self.root)
+        popup.grab_set()
+
+        progress_label = tk.Label(popup, text="⏳ Preparing export...", font=("Arial", 12),
+                                  bg="#f0f0f0", fg="#2e2e2e")
+        progress_label.pack(pady=15)
+        progress_bar = ttk.Progressbar(popup, length=320, mode="determinate")
+        progress_bar.pack(pady=5)
+        tk.Button(popup, text="✖ Cancel", font=("Arial", 12), bg="#dbe0e6", fg="#2e2e2e",
+                  command=exporter.cancel).pack(pady=10)
+        popup.protocol("WM_DELETE_WINDOW", exporter.cancel)
+
+        def show_progress():
+            if not popup.winfo_exists():
+                return
+            if exporter.total_rows:
+                progress_bar["value"] = 100 * exporter.rows_written / exporter.total_rows
+                progress_label.config(text=f"Exported {exporter.rows_written} of {exporter.total_rows} rows")
+            popup.after(100, show_progress)
+
+        def finished(rows_written):
+            popup.destroy()
+            messagebox.showinfo("Success", f"Attendance report exported successfully!\n"
+                                           f"{rows_written} rows saved at:\n{file_path}")
+
+        def failed(error):
+            popup.destroy()
+            if isinstance(error, ExportCancelled):
+                messagebox.showinfo("Cancelled", "Export cancelled. No file was written.")
+            else:
+                messagebox.showerror("Error", f"Failed to export CSV.\n{error}")
 
-            messagebox.showinfo("Success", f"Attendance report exported successfully!\nSaved at:\n{file_path}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to export CSV.\n{e}")
+        self.worker.submit("export", exporter.export, finished, failed)
+        show_progress()
 
     def load_class_list_for_reports(self):
         """Load all classes into filter dropdown."""
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-
-        cursor.execute("SELECT DISTINCT class_name FROM students WHERE class_name IS NOT NULL")
-        classes = [row[0] for row in cursor.fetchall()]
-        self.report_class_combobox["values"] = classes
+        def show_classes(classes):
+            self.report_class_combobox["values"] = classes
 
-        db.close()
+        self.worker.submit("report_classes", self.students.class_names, show_classes, self.show_background_error)
 
     def load_all_attendance(self):
         """Load all attendance records."""
-        self.attendance_tree.delete(*self.attendance_tree.get_children())
-
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-
-        query = '''
-            SELECT attendance.date, students.name, students.roll_number, attendance.status
-            FROM attendance
-            JOIN students ON attendance.student_id = students.id
-            ORDER BY attendance.date DESC
-        '''
-        cursor.execute(query)
-        records = cursor.fetchall()
-
-        for record in records:
-            self.attendance_tree.insert("", "end", values=record)
-
-        db.close()
+        self.show_report(self.reports.report())
 
     def filter_reports_by_class(self):
         """Filter attendance records by selected class."""
         selected_class = self.report_class_var.get()
 
         if selected_class:
-            self.attendance_tree.delete(*self.attendance_tree.get_children())
-
-            db = Database()
-            db.connect()
-            cursor = db.connection.cursor()
-
-            query = '''
-                SELECT attendance.date, students.name, students.roll_number, attendance.status
-                FROM attendance
-                JOIN students ON attendance.student_id = students.id
-                WHERE students.class_name = ?
-                ORDER BY attendance.date DESC
-            '''
-            cursor.execute(query, (selected_class,))
-            records = cursor.fetchall()
-
-            for record in records:
-                self.attendance_tree.insert("", "end", values=record)
-
-            db.close()
+            self.show_report(self.reports.report(class_name=selected_class))
         else:
             messagebox.showwarning("Warning", "Please select a class first.")
 
+    def show_report(self, report):
+        """Point the report table at a new filter; rows are fetched as the user scrolls."""
+        self.active_report = report
+        self.report_status_label.config(text="⏳ Loading attendance...")
+        self.report_table.load(report.page)
+        self.report_summary_label.config(text="")
+        self.worker.submit("report_summary", lambda: self.reports.totals(report),
+                           self.show_report_summary, self.show_background_error)
+
+    def show_report_summary(self, totals):
+        """Show present/absent totals for the active report filter."""
+        present, absent = totals
+        marked = present + absent
+        rate = f"{100 * present / marked:.1f}%" if marked else "-"
+        self.report_summary_label.config(text=f"✅ Present: {present}    ❌ Absent: {absent}    📈 Rate: {rate}")
+
+    def update_report_status(self, row_count, complete):
+        """Show how many report rows are loaded so far."""
+        if complete:
+            self.report_status_label.config(text=f"{row_count} records")
+        else:
+            self.report_status_label.config(text=f"Showing {row_count} records (scroll for more)")
+
+    def show_analytics(self):
+        """Show Class Analytics: attendance %, absence streaks and trends."""
+        self.pages.show("analytics")
+
+    def build_analytics(self, page):
+        tk.Label(page, text="Class Analytics 📊", font=("Arial", 20, "bold"),
+                 bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
+
+        self.analytics_pane = AnalyticsPane(page, self.worker, self.get_all_classes, self.reports.class_analytics)
+        self.analytics_pane.pack(expand=True, fill="both")
+
+    def show_diagnostics(self):
+        """Show timed SQL statements: slow queries, recent queries and time per view method."""
+        self.pages.show("diagnostics")
+
+    def build_diagnostics(self, page):
+        tk.Label(page, text="Diagnostics 🩺", font=("Arial", 20, "bold"),
+                 bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
+
+        self.diagnostics_pane = DiagnosticsPane(page, self.db.query_log, self.db.coordinator.metrics)
+        self.diagnostics_pane.pack(expand=True, fill="both")
+
+    def get_all_classes(self):
+        """Return every class name."""
+        return self.classes.list_classes()
+
     def show_manage_class(self):
         """Manage Classes (Add/Edit/Delete/View/Assign)."""
-        self.clear_main_content()
+        self.pages.show("classes")
 
-        tk.Label(self.main_content, text="Manage Classes 🏫", font=("Arial", 20, "bold"),
+    def build_manage_class(self, page):
+        tk.Label(page, text="Manage Classes 🏫", font=("Arial", 20, "bold"),
                  bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
 
-        container = tk.Frame(self.main_content, bg="#f0f0f0")
+        container = tk.Frame(page, bg="#f0f0f0")
         container.pack(expand=True, fill="both", padx=20)
 
         # Left Form
@@ -779,17 +806,13 @@ class AdminDashboard:
         self.class_listbox.pack(padx=10, pady=10, expand=True, fill="both")
         self.class_listbox.bind("<<ListboxSelect>>", self.load_class_to_form)
 
-        self.load_classes()
-
     def load_classes(self):
-        self.class_listbox.delete(0, tk.END)
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute("SELECT class_name FROM classes ORDER BY class_name ASC")
-        for row in cursor.fetchall():
-            self.class_listbox.insert(tk.END, row[0])
-        db.close()
+        def show_classes(classes):
+            self.class_listbox.delete(0, tk.END)
+            for class_name in classes:
+                self.class_listbox.insert(tk.END, class_name)
+
+        self.worker.submit("classes", self.classes.list_classes, show_classes, self.show_background_error)
 
     def load_class_to_form(self, event):
         selected = self.class_listbox.curselection()
@@ -800,17 +823,9 @@ class AdminDashboard:
     def add_class(self):
         class_name = self.class_name_var.get().strip()
         if class_name:
-            db = Database()
-            db.connect()
-            cursor = db.connection.cursor()
-            try:
-                cursor.execute("INSERT INTO classes (class_name) VALUES (?)", (class_name,))
-                db.connection.commit()
-                self.load_classes()
-                messagebox.showinfo("Success", "Class added successfully!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Error adding class.\n{e}")
-            db.close()
+            self.save_in_background("add_class", self.classes.add, (class_name,),
+                                    lambda _: messagebox.showinfo("Success", "Class added successfully!"),
+                                    "Error adding class.")
         else:
             messagebox.showwarning("Warning", "Please enter a class name.")
 
@@ -820,18 +835,9 @@ class AdminDashboard:
             old_class_name = self.class_listbox.get(selected[0])
             new_class_name = self.class_name_var.get().strip()
             if new_class_name:
-                db = Database()
-                db.connect()
-                cursor = db.connection.cursor()
-                try:
-                    cursor.execute("UPDATE classes SET class_name=? WHERE class_name=?",
-                                   (new_class_name, old_class_name))
-                    db.connection.commit()
-                    self.load_classes()
-                    messagebox.showinfo("Success", "Class name updated successfully!")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Error updating class.\n{e}")
-                db.close()
+                self.save_in_background("edit_class", self.classes.rename, (old_class_name, new_class_name),
+                                        lambda _: messagebox.showinfo("Success", "Class name updated successfully!"),
+                                        "Error updating class.")
             else:
                 messagebox.showwarning("Warning", "Please enter a new class name.")
 
@@ -842,52 +848,21 @@ class AdminDashboard:
             class_name = self.class_listbox.get(selected[0])
 
             if messagebox.askyesno("Confirm Delete", "Are you sure to delete this class?"):
-                db = Database()
-                db.connect()
-                cursor = db.connection.cursor()
-
-                try:
-                    cursor.execute("DELETE FROM classes WHERE class_name=?", (class_name,))
-                    db.connection.commit()
-                    self.load_classes()
+                def deleted(_):
                     self.class_name_var.set("")
                     messagebox.showinfo("Success", "Class deleted successfully!")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Error deleting class.\n{e}")
 
-                db.close()
+                self.save_in_background("delete_class", self.classes.delete, (class_name,), deleted,
+                                        "Error deleting class.")
 
     def view_all_classes(self):
         """View all classes in table format."""
-        self.clear_main_content()
-
-        tk.Label(self.main_content, text="All Classes 📋", font=("Arial", 20, "bold"),
-                 bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
-
-        table_frame = tk.Frame(self.main_content, bg="#f0f0f0")
-        table_frame.pack(expand=True, fill="both", padx=20)
+        self.pages.show("all_classes")
 
-        headers = ["Class Name"]
-        for idx, header in enumerate(headers):
-            tk.Label(table_frame, text=header, font=("Arial", 12, "bold"),
-                     bg="#dbe0e6", fg="#2e2e2e", width=30, relief="groove").grid(row=0, column=idx, padx=1, pady=1)
-
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-
-        cursor.execute("SELECT class_name FROM classes")
-        classes = cursor.fetchall()
-
-        for row_idx, class_row in enumerate(classes, start=1):
-            tk.Label(table_frame, text=class_row[0], font=("Arial", 12),
-                     bg="white", fg="#2e2e2e", width=30, relief="ridge").grid(row=row_idx, column=0, padx=1, pady=1)
-
-        db.close()
-
-        # Back Button
-        tk.Button(self.main_content, text="🔙 Back to Manage Classes", font=("Arial", 12, "bold"),
-                  width=30, bg="#dbe0e6", fg="#2e2e2e", command=self.show_manage_class).pack(pady=20)
+    def build_all_classes(self, page):
+        self.all_classes_grid = self.build_data_grid(
+            page, "All Classes 📋", ("Class Name",), self.classes.page, {"Class Name": "class_name"}, "class_name",
+            "classes", "🔙 Back to Manage Classes", self.show_manage_class, column_width=400)
 
     # Final Updated Assign Class using Dropdown of Instructors
     def assign_class_to_instructor(self):
@@ -917,40 +892,28 @@ class AdminDashboard:
         instructor_dropdown.pack(pady=10)
 
         # Load Instructors into Dropdown
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute("SELECT name FROM instructors")
-        instructors = [row[0] for row in cursor.fetchall()]
-        db.close()
+        def show_names(names):
+            if instructor_dropdown.winfo_exists():
+                instructor_dropdown["values"] = names
 
-        instructor_dropdown["values"] = instructors
+        self.worker.submit("instructor_names", self.instructors.names, show_names, self.show_background_error)
 
         # Confirm Button
         def confirm_assignment():
             instructor_name = instructor_var.get()
 
             if instructor_name:
-                db = Database()
-                db.connect()
-                cursor = db.connection.cursor()
-                try:
-                    cursor.execute("SELECT * FROM instructors WHERE name=?", (instructor_name,))
-                    instructor = cursor.fetchone()
-
-                    if instructor:
-                        cursor.execute("UPDATE instructors SET department=? WHERE name=?",
-                                       (selected_class_name, instructor_name))
-                        db.connection.commit()
+                def assigned(found):
+                    if found:
                         messagebox.showinfo("Success",
                                             f"Class '{selected_class_name}' assigned to '{instructor_name}'!")
-                        popup.destroy()
+                        if popup.winfo_exists():
+                            popup.destroy()
                     else:
                         messagebox.showerror("Error", "Instructor not found.")
 
-                except Exception as e:
-                    messagebox.showerror("Error", f"Error assigning class.\n{e}")
-                db.close()
+                self.save_in_background("assign_class", self.instructors.assign_class,
+                                        (instructor_name, selected_class_name), assigned, "Error assigning class.")
             else:
                 messagebox.showwarning("Warning", "Please select an Instructor.")
 
@@ -959,12 +922,13 @@ class AdminDashboard:
 
     def show_admin_profile(self):
         """Admin Profile Settings (Update Username, Change Password)."""
-        self.clear_main_content()
+        self.pages.show("profile")
 
-        tk.Label(self.main_content, text="Admin Profile ⚙️", font=("Arial", 20, "bold"),
+    def build_admin_profile(self, page):
+        tk.Label(page, text="Admin Profile ⚙️", font=("Arial", 20, "bold"),
                  bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
 
-        profile_frame = tk.Frame(self.main_content, bg="#f0f0f0")
+        profile_frame = tk.Frame(page, bg="#f0f0f0")
         profile_frame.pack(expand=True, fill="both", padx=20)
 
         # Username Section
@@ -976,10 +940,9 @@ class AdminDashboard:
                                                                                                                 column=0,
                                                                                                                 pady=5,
                                                                                                                 sticky="w")
-        tk.Label(username_frame, text=self.username, font=("Arial", 12, "bold"), bg="#dbe0e6", fg="#2e2e2e").grid(row=0,
-                                                                                                                  column=1,
-                                                                                                                  pady=5,
-                                                                                                                  sticky="w")
+        self.current_username_label = tk.Label(username_frame, text=self.username, font=("Arial", 12, "bold"),
+                                               bg="#dbe0e6", fg="#2e2e2e")
+        self.current_username_label.grid(row=0, column=1, pady=5, sticky="w")
 
         tk.Label(username_frame, text="New Username:", font=("Arial", 12), bg="#dbe0e6", fg="#2e2e2e").grid(row=1,
                                                                                                             column=0,
@@ -1032,20 +995,14 @@ class AdminDashboard:
         new_username = self.new_username_var.get().strip()
 
         if new_username:
-            db = Database()
-            db.connect()
-            cursor = db.connection.cursor()
-
-            try:
-                cursor.execute("UPDATE users SET username=? WHERE username=?", (new_username, self.username))
-                db.connection.commit()
+            def renamed(_):
                 self.username = new_username  # Update session username
+                self.current_username_label.config(text=new_username)
+                self.new_username_var.set("")
                 messagebox.showinfo("Success", "Username updated successfully!")
-                self.show_admin_profile()  # Reload screen
-            except Exception as e:
-                messagebox.showerror("Error", f"Error updating username.\n{e}")
 
-            db.close()
+            self.save_in_background("rename_user", self.auth.rename_user, (self.username, new_username), renamed,
+                                    "Error updating username.")
         else:
             messagebox.showwarning("Warning", "Please enter a new username.")
 
@@ -1056,36 +1013,26 @@ class AdminDashboard:
         new_pass = self.new_pass_var.get().strip()
         confirm_pass = self.confirm_pass_var.get().strip()
 
-        if old_pass and new_pass and confirm_pass:
-            db = Database()
-            db.connect()
-            cursor = db.connection.cursor()
-
-            cursor.execute("SELECT password FROM users WHERE username=?", (self.username,))
-            record = cursor.fetchone()
-
-            if record:
-                stored_password = record[0]
-                if Security.verify_password(old_pass, stored_password):
-                    if new_pass == confirm_pass:
-                        hashed_password = Security.hash_password(new_pass).decode('utf-8')
-                        cursor.execute("UPDATE users SET password=? WHERE username=?", (hashed_password, self.username))
-                        db.connection.commit()
-                        messagebox.showinfo("Success", "Password changed successfully!")
-                        self.old_pass_var.set("")
-                        self.new_pass_var.set("")
-                        self.confirm_pass_var.set("")
-                    else:
-                        messagebox.showwarning("Warning", "New passwords do not match.")
-                else:
-                    messagebox.showerror("Error", "Old password is incorrect.")
-            else:
-                messagebox.showerror("Error", "User record not found.")
-
-            db.close()
-        else:
+        if not (old_pass and new_pass and confirm_pass):
             messagebox.showwarning("Warning", "Please fill all password fields.")
+            return
+        if new_pass != confirm_pass:
+            messagebox.showwarning("Warning", "New passwords do not match.")
+            return
+
+        errors = {"not_found": "User record not found.", "wrong_password": "Old password is incorrect."}
+
+        def changed(outcome):
+            if outcome in errors:
+                messagebox.showerror("Error", errors[outcome])
+                return
+            messagebox.showinfo("Success", "Password changed successfully!")
+            self.old_pass_var.set("")
+            self.new_pass_var.set("")
+            self.confirm_pass_var.set("")
 
+        job = Security.submit(self.auth.change_password, self.username, old_pass, new_pass)
+        self.worker.watch("password", job, changed, self.show_background_error)
 
     def toggle_theme(self):
         """Toggle Dark/Light Theme."""
@@ -1120,6 +1067,8 @@ class AdminDashboard:
     def logout(self):
         """Logout and return to login screen."""
         if messagebox.askyesno("Confirm Logout", "Are you sure you want to logout?"):
+            self.worker.shutdown()
+            self.services.close()
             self.root.destroy()
 
             import tkinter as tk
@@ -0,0 +1,116 @@
+# view/analytics_pane.py
+# OOP Concept: Inheritance (tk.Frame), Encapsulation, Reusable GUI Component
+
+import tkinter as tk
+import tkinter.ttk as ttk
+from tkinter import messagebox
+
+
+def format_percent(value):
+    """Format a percentage, showing '-' for NaN (nothing marked)."""
+    return "-" if value != value else f"{value:.1f}%"
+
+
+class AnalyticsPane(tk.Frame):
+    """Class analytics view shared by the Admin and Instructor dashboards.
+
+    Shows per-student attendance percentage and absence streaks, and per-day
+    class rates with rolling 7/30-day trends, for one selected class.
+    """
+
+    def __init__(self, parent, worker, load_classes, load_analytics, instructor_username=None, **kwargs):
+        """Initialize the pane.
+
+        Args:
+            worker (BackgroundWorker): Runs the queries and computation off the Tk thread.
+            load_classes (callable): Returns the class names offered in the dropdown.
+            load_analytics (callable): ReportController.class_analytics or a remote equivalent.
+            instructor_username (str): Restrict analytics to this instructor's students.
+        """
+        super().__init__(parent, bg="#f0f0f0", **kwargs)
+        self.worker = worker
+        self.fetch_classes = load_classes
+        self.load_analytics = load_analytics
+        self.instructor_username = instructor_username
+
+        top_frame = tk.Frame(self, bg="#f0f0f0")
+        top_frame.pack(pady=10)
+
+        tk.Label(top_frame, text="Select Class:", font=("Arial", 12), bg="#f0f0f0", fg="#2e2e2e").pack(side="left",
+                                                                                                       padx=5)
+        self.class_var = tk.StringVar()
+        self.class_combobox = ttk.Combobox(top_frame, textvariable=self.class_var, font=("Arial", 12),
+                                           width=20, state="readonly")
+        self.class_combobox.pack(side="left", padx=5)
+        tk.Button(top_frame, text="📊 Analyze", font=("Arial", 12), bg="#dbe0e6", fg="#2e2e2e",
+                  command=self.analyze).pack(side="left", padx=5)
+
+        self.summary_label = tk.Label(self, text="", font=("Arial", 12, "bold"), bg="#f0f0f0", fg="#2e2e2e")
+        self.summary_label.pack(pady=5)
+
+        tables = tk.Frame(self, bg="#f0f0f0")
+        tables.pack(expand=True, fill="both", padx=10, pady=10)
+
+        student_columns = ("Roll Number", "Student Name", "Attendance %", "Current Absences", "Longest Absences")
+        self.student_tree = self._make_tree(tables, student_columns, 115)
+        day_columns = ("Date", "Class Rate", "7-Day", "30-Day")
+        self.daily_tree = self._make_tree(tables, day_columns, 85)
+
+        self.load_classes()
+
+    @staticmethod
+    def _make_tree(parent, columns, width):
+        frame = tk.Frame(parent, bg="#f0f0f0")
+        frame.pack(side="left", expand=True, fill="both", padx=5)
+        tree = ttk.Treeview(frame, columns=columns, show="headings")
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, anchor="center", width=width)
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        tree.pack(side="left", expand=True, fill="both")
+        return tree
+
+    def load_classes(self):
+        """(Re)load the class dropdown in the background."""
+        self.worker.submit("analytics_classes", self.fetch_classes, self._set_classes)
+
+    def _set_classes(self, classes):
+        self.class_combobox["values"] = classes
+
+    def analyze(self):
+        """Load the selected class's matrix in the background and show its metrics."""
+        class_name = self.class_var.get()
+        if not class_name:
+            messagebox.showwarning("Warning", "Please select a class first.")
+            return
+
+        instructor_username = self.instructor_username
+        self.summary_label.config(text="⏳ Analyzing...")
+        self.worker.submit("analytics", lambda: self.load_analytics(class_name, instructor_username),
+                           self._show_results, self._show_error)
+
+    def _show_results(self, result):
+        (students, dates, overall_rate), student_rows, daily_rows = result
+        week = daily_rows[0][2] if daily_rows else float("nan")
+        month = daily_rows[0][3] if daily_rows else float("nan")
+        self.summary_label.config(
+            text=f"🎓 {students} students    📅 {dates} days    📈 Overall: {format_percent(overall_rate)}"
+                 f"    Last 7 days: {format_percent(week)}    Last 30 days: {format_percent(month)}")
+
+        self.student_tree.delete(*self.student_tree.get_children())
+        for roll, name, percent, current, longest in student_rows:
+            self.student_tree.insert("", "end", values=(roll, name, format_percent(percent), current, longest))
+
+        self.daily_tree.delete(*self.daily_tree.get_children())
+        for date, rate, week_rate, month_rate in daily_rows:
+            self.daily_tree.insert("", "end", values=(date, format_percent(rate), format_percent(week_rate),
+                                                      format_percent(month_rate)))
+
+    def _show_error(self, error):
+        self.summary_label.config(text="")
+        if isinstance(error, ImportError):
+            messagebox.showerror("Error", "Analytics needs NumPy.\nInstall it with: pip install numpy")
+        else:
+            messagebox.showerror("Error", f"Error computing analytics.\n{error}")
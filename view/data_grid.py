@@ -0,0 +1,53 @@
+# view/data_grid.py
+# OOP Concept: Inheritance (VirtualTreeview), Encapsulation, Reusable GUI Component
+
+from StudentAttendanceTracker.view.virtual_tree import VirtualTreeview
+
+
+class DataGrid(VirtualTreeview):
+    """A VirtualTreeview whose sortable headings re-sort the rows in SQL.
+
+    Rows come from ``fetch_page(after, limit, sort, descending)``, e.g. a
+    controller's page() method. Clicking a sortable heading orders by that
+    column (clicking it again flips the direction) and reloads from the
+    first page, so the grid never holds more rows than the user scrolled to.
+    """
+
+    ARROWS = {False: " ▲", True: " ▼"}
+
+    def __init__(self, parent, columns, worker, channel, fetch_page, sort_keys, sort=None, descending=False,
+                 **kwargs):
+        """Initialize the grid.
+
+        Args:
+            columns (tuple): Column headings.
+            fetch_page (callable): fetch_page(after, limit, sort, descending) -> rows of (id, value, ...).
+            sort_keys (dict): Heading -> sort key passed to fetch_page, for the sortable columns.
+            sort (str): Initial sort key (fetch_page's default when None).
+        """
+        super().__init__(parent, columns, worker, channel, **kwargs)
+        self.columns = columns
+        self.fetch_sorted_page = fetch_page
+        self.sort_keys = sort_keys
+        self.sort = sort
+        self.descending = descending
+        for heading, key in sort_keys.items():
+            self.tree.heading(heading, command=lambda key=key: self.sort_by(key))
+        self._show_sort()
+
+    def sort_by(self, key):
+        """Order by a column, flipping the direction if it is already the sort column."""
+        self.descending = not self.descending if key == self.sort else False
+        self.sort = key
+        self._show_sort()
+        self.reload()
+
+    def reload(self):
+        """Reload from the first page in the current order."""
+        fetch_page, sort, descending = self.fetch_sorted_page, self.sort, self.descending
+        self.load(lambda after, limit: fetch_page(after, limit, sort, descending))
+
+    def _show_sort(self):
+        for heading in self.columns:
+            arrow = self.ARROWS[self.descending] if self.sort_keys.get(heading) == self.sort else ""
+            self.tree.heading(heading, text=heading + arrow)
@@ -0,0 +1,147 @@
+# view/diagnostics_pane.py
+# OOP Concept: Inheritance (tk.Frame), Encapsulation, Reusable GUI Component
+
+import time
+import tkinter as tk
+import tkinter.ttk as ttk
+
+
+class DiagnosticsPane(tk.Frame):
+    """Admin-only view of the Database query log.
+
+    Tabs list slow statements, the most recent statements and time spent per
+    calling view method. Selecting a statement shows its full SQL, how many
+    statement starts it caused (triggers included) and, for slow ones, its
+    EXPLAIN QUERY PLAN.
+    """
+
+    REFRESH_MS = 2000
+
+    def __init__(self, parent, query_log, write_metrics=None, **kwargs):
+        """Initialize the pane for one Database's QueryLog.
+
+        Args:
+            write_metrics (callable): Optional WriteCoordinator.metrics, shown as a second summary line.
+        """
+        super().__init__(parent, bg="#f0f0f0", **kwargs)
+        self.query_log = query_log
+        self.write_metrics = write_metrics
+        self.after_id = None
+        self.records = {}
+
+        top_frame = tk.Frame(self, bg="#f0f0f0")
+        top_frame.pack(fill="x", padx=10, pady=5)
+        self.summary_label = tk.Label(top_frame, text="", font=("Arial", 12, "bold"), bg="#f0f0f0", fg="#2e2e2e")
+        self.summary_label.pack(side="left")
+        tk.Button(top_frame, text="🧹 Clear", font=("Arial", 12), bg="#dbe0e6", fg="#2e2e2e",
+                  command=self.clear).pack(side="right", padx=5)
+        tk.Button(top_frame, text="🔄 Refresh", font=("Arial", 12), bg="#dbe0e6", fg="#2e2e2e",
+                  command=self.refresh).pack(side="right", padx=5)
+        self.auto_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(top_frame, text="Auto-refresh", variable=self.auto_var, font=("Arial", 11),
+                       bg="#f0f0f0", fg="#2e2e2e", command=self.schedule).pack(side="right", padx=5)
+        self.writes_label = tk.Label(self, text="", font=("Arial", 11), bg="#f0f0f0", fg="#2e2e2e")
+        if write_metrics:
+            self.writes_label.pack(anchor="w", padx=10)
+
+        notebook = ttk.Notebook(self)
+        notebook.pack(expand=True, fill="both", padx=10, pady=5)
+        query_columns = ("Time", "ms", "Rows", "Caller", "SQL")
+        query_widths = (70, 70, 60, 260, 420)
+        self.slow_tree = self._make_tree(notebook, "🐢 Slow Queries", query_columns, query_widths)
+        self.recent_tree = self._make_tree(notebook, "🕒 Recent Queries", query_columns, query_widths)
+        self.caller_tree = self._make_tree(notebook, "📍 By Caller", ("Caller", "Queries", "Total ms", "Avg ms", "Max ms"),
+                                           (360, 90, 110, 100, 100))
+
+        self.detail_text = tk.Text(self, height=8, font=("Courier", 10), bg="white", fg="#2e2e2e", wrap="word")
+        self.detail_text.pack(fill="x", padx=10, pady=(0, 10))
+        for tree in (self.slow_tree, self.recent_tree):
+            tree.bind("<<TreeviewSelect>>", self.show_detail)
+
+        self.bind("<Destroy>", self._on_destroy)
+        self.refresh()
+        self.schedule()
+
+    @staticmethod
+    def _make_tree(notebook, title, columns, widths):
+        frame = tk.Frame(notebook, bg="#f0f0f0")
+        notebook.add(frame, text=title)
+        tree = ttk.Treeview(frame, columns=columns, show="headings")
+        for col, width in zip(columns, widths):
+            tree.heading(col, text=col)
+            tree.column(col, width=width, anchor="w" if col in ("Caller", "SQL") else "center")
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        tree.pack(side="left", expand=True, fill="both")
+        return tree
+
+    def schedule(self):
+        """Refresh every REFRESH_MS while auto-refresh is ticked."""
+        if self.after_id:
+            self.after_cancel(self.after_id)
+            self.after_id = None
+        if self.auto_var.get():
+            self.after_id = self.after(self.REFRESH_MS, self._tick)
+
+    def _tick(self):
+        self.after_id = None
+        if self.winfo_ismapped():  # a hidden pane is refreshed when it is shown again
+            self.refresh()
+        self.schedule()
+
+    def _on_destroy(self, event):
+        if event.widget is self and self.after_id:
+            self.after_cancel(self.after_id)
+            self.after_id = None
+
+    def refresh(self):
+        """Reload all three tabs from the query log."""
+        recent, slow, callers = self.query_log.snapshot()
+        self.summary_label.config(
+            text=f"📈 {self.query_log.total_queries} queries    🐢 {len(slow)} slow "
+                 f"(≥ {self.query_log.SLOW_QUERY_MS:g} ms)")
+        if self.write_metrics:
+            writes = self.write_metrics()
+            commit = writes["commit_ms"]
+            self.writes_label.config(
+                text=f"✍️ Writes: {writes['writes']} in {writes['groups']} commits (avg {writes['average_group']:g}, "
+                     f"max {writes['largest_group']})    queued: {writes['queue_depth']}    "
+                     f"commit p50/p99: {commit['p50']:.1f}/{commit['p99']:.1f} ms    "
+                     f"busy retries: {writes['retries']}    failed: {writes['failed_groups']}")
+
+        self.records = {}
+        for tree, records in ((self.slow_tree, slow), (self.recent_tree, recent)):
+            tree.delete(*tree.get_children())
+            for record in records:
+                iid = tree.insert("", "end", values=(time.strftime("%H:%M:%S", time.localtime(record.started_at)),
+                                                     f"{record.elapsed_ms:.1f}", record.rows, record.caller,
+                                                     record.sql[:200]))
+                self.records[(tree, iid)] = record
+
+        self.caller_tree.delete(*self.caller_tree.get_children())
+        for caller, count, total, worst in callers:
+            self.caller_tree.insert("", "end", values=(caller, count, f"{total:.1f}", f"{total / count:.2f}",
+                                                       f"{worst:.1f}"))
+
+    def show_detail(self, event):
+        """Show the selected statement's SQL, statement count and query plan."""
+        tree = event.widget
+        selection = tree.selection()
+        record = self.records.get((tree, selection[0])) if selection else None
+        if record is None:
+            return
+        lines = [f"{record.caller}  [{record.thread}]  {record.elapsed_ms:.2f} ms  rows: {record.rows}"
+                 + (f"  batch: {record.batch}" if record.batch is not None else ""), "", record.sql]
+        if record.statements > 1:
+            lines += ["", f"SQLite statement starts (including trigger programs): {record.statements}"]
+        if record.plan:
+            lines += ["", "Query plan:"] + [f"  {step}" for step in record.plan]
+        self.detail_text.delete("1.0", tk.END)
+        self.detail_text.insert(tk.END, "\n".join(lines))
+
+    def clear(self):
+        """Empty the query log and the tables."""
+        self.query_log.clear()
+        self.detail_text.delete("1.0", tk.END)
+        self.refresh()
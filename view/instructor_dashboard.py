@@ -4,8 +4,16 @@
 import tkinter as tk
 import tkinter.ttk as ttk
 from tkinter import messagebox
-from StudentAttendanceTracker.model.database import Database
+from StudentAttendanceTracker.controller.services import Services
+from StudentAttendanceTracker.model.events import AttendanceChanged, ClassesChanged, StudentsChanged
+from StudentAttendanceTracker.model.roster_index import RosterIndex
+from StudentAttendanceTracker.model.write_coordinator import submit_write
 from StudentAttendanceTracker.utils.security import Security
+from StudentAttendanceTracker.utils.worker import BackgroundWorker
+from StudentAttendanceTracker.view.virtual_tree import VirtualTreeview
+from StudentAttendanceTracker.view.analytics_pane import AnalyticsPane
+from StudentAttendanceTracker.view.pane_stack import PaneStack
+from StudentAttendanceTracker.view.roster_grid import RosterGrid
 
 class InstructorDashboard:
     """Instructor Dashboard - Manage Students, Attendance, Reports."""
@@ -13,6 +21,15 @@ class InstructorDashboard:
     def __init__(self, root, username):
         self.root = root
         self.username = username
+        services = self.services = Services.default()
+        self.auth = services.auth
+        self.students = services.students
+        self.classes = services.classes
+        self.attendance = services.attendance
+        self.reports = services.reports
+        self.roster_index = RosterIndex(self.username, load=lambda: self.students.roster_entries(self.username))
+        self.worker = BackgroundWorker(self.root)
+        self.active_report = None
         self.root.title("Instructor Dashboard - Student Attendance Tracker")
         self.root.geometry("1150x700")
         self.root.resizable(False, False)
@@ -25,6 +42,12 @@ class InstructorDashboard:
         self.main_content.pack(expand=True, fill="both")
 
         self.add_sidebar_buttons()
+        self.pages = PaneStack(self.main_content, version=self.services.data_version)
+        self.register_pages()
+        self.worker.listen(services.events, StudentsChanged, self.students_changed)
+        self.worker.listen(services.events, ClassesChanged, lambda event: self.invalidate_pages("students"))
+        self.worker.listen(services.events, AttendanceChanged,
+                           lambda event: self.invalidate_pages("reports", "analytics"))
         self.is_dark_mode = False
         self.apply_theme()
         self.show_dashboard_overview()
@@ -43,6 +66,7 @@ class InstructorDashboard:
             ("🎓 Manage Students", self.show_manage_students),
             ("📝 Mark Attendance", self.show_mark_attendance),
             ("📄 View Reports", self.show_view_reports),
+            ("📊 Analytics", self.show_analytics),
             ("⚙️ Profile", self.show_profile)
         ]
 
@@ -52,81 +76,87 @@ class InstructorDashboard:
         tk.Button(self.sidebar, text="🔒 Logout", command=self.logout,
                   font=("Arial", 12, "bold"), width=22, height=2, bg="red", fg="white", bd=0).pack(pady=20, padx=10)
 
-    def clear_main_content(self):
-        for widget in self.main_content.winfo_children():
-            widget.destroy()
+    def register_pages(self):
+        """Register every page with the PaneStack: how to build it once and how to reload its data."""
+        self.pages.register("overview", self.build_dashboard_overview, self.refresh_dashboard_overview,
+                            always_refresh=True)
+        self.pages.register("students", self.build_manage_students, self.refresh_manage_students)
+        self.pages.register("attendance", self.build_mark_attendance, self.refresh_mark_attendance)
+        self.pages.register("reports", self.build_view_reports, self.refresh_view_reports)
+        self.pages.register("analytics", self.build_analytics, lambda: self.analytics_pane.load_classes())
+        self.pages.register("profile", self.build_profile)
+
+    def invalidate_pages(self, *names):
+        """Reload the named pages: the visible one now, the others when next shown."""
+        self.pages.invalidate(*names)
+
+    def students_changed(self, event):
+        """Drop everything derived from this instructor's roster after a student write."""
+        if event.instructor_username not in (None, self.username):
+            return
+        self.roster_index.invalidate()
+        self.invalidate_pages("students", "attendance", "reports", "analytics")
 
-    def show_dashboard_overview(self):
-        """Show Instructor Dashboard Overview with Stats."""
-        self.clear_main_content()
+    def show_background_error(self, error):
+        """Report a failed background query."""
+        messagebox.showerror("Error", f"Could not load data.\n{error}")
 
-        tk.Label(self.main_content, text=f"Welcome, {self.username} 👩‍🏫", font=("Arial", 22, "bold"),
-                 bg="#f0f0f0", fg="#2e2e2e").pack(pady=30)
+    def save_in_background(self, channel, write, args, saved, failure):
+        """Start a write without blocking the Tk thread; saved(result) runs once it has committed.
 
-        stats_frame = tk.Frame(self.main_content, bg="#f0f0f0")
-        stats_frame.pack(pady=10, padx=20)
+        Args:
+            failure (str): First line of the error box shown if the write fails.
+        """
+        self.worker.watch(channel, submit_write(write, *args), saved,
+                          lambda error: messagebox.showerror("Error", f"{failure}\n{error}"))
 
-        # Fetch stats
-        total_students = self.get_total_students()
-        total_attendance = self.get_total_attendance()
-        total_classes = self.get_total_classes()
+    def show_dashboard_overview(self):
+        """Show Instructor Dashboard Overview with Stats."""
+        self.pages.show("overview")
 
-        cards = [
-            ("🎓 Total Students", total_students),
-            ("📄 Attendance Records", total_attendance),
-            ("🏫 Classes Handled", total_classes)
-        ]
+    def build_dashboard_overview(self, page):
+        tk.Label(page, text=f"Welcome, {self.username} 👩‍🏫", font=("Arial", 22, "bold"),
+                 bg="#f0f0f0", fg="#2e2e2e").pack(pady=30)
 
+        self.stats_frame = tk.Frame(page, bg="#f0f0f0")
+        self.stats_frame.pack(pady=10, padx=20)
+
+        tk.Label(self.stats_frame, text="⏳ Loading statistics...", font=("Arial", 12),
+                 bg="#f0f0f0", fg="#2e2e2e").grid(row=0, column=0, pady=20)
+
+    def refresh_dashboard_overview(self):
+        """Reload the stat cards; the old cards stay up until the new counts arrive."""
+        # Fetch stats off the Tk thread, from the pre-aggregated summaries
+        def fetch_stats():
+            total_students, total_attendance, total_classes = self.reports.instructor_counts(self.username)
+            return [
+                ("🎓 Total Students", total_students),
+                ("📄 Attendance Records", total_attendance),
+                ("🏫 Classes Handled", total_classes)
+            ]
+
+        self.worker.submit("overview", fetch_stats, self.render_overview_cards, self.show_background_error)
+
+    def render_overview_cards(self, cards):
+        """Draw one stat card per (label, count)."""
+        stats_frame = self.stats_frame
+        for widget in stats_frame.winfo_children():
+            widget.destroy()
         for idx, (label, count) in enumerate(cards):
             card = tk.Frame(stats_frame, bg="#dbe0e6", width=250, height=150, bd=2, relief="ridge")
             card.grid(row=0, column=idx, padx=20, pady=20)
             tk.Label(card, text=label, font=("Arial", 12, "bold"), bg="#dbe0e6", fg="#2e2e2e").pack(pady=10)
             tk.Label(card, text=str(count), font=("Arial", 24, "bold"), bg="#dbe0e6", fg="#2e2e2e").pack()
 
-    def get_total_students(self):
-        """Get total students created by Instructor."""
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute("SELECT COUNT(*) FROM students WHERE instructor_username=?", (self.username,))
-        count = cursor.fetchone()[0]
-        db.close()
-        return count
-
-    def get_total_attendance(self):
-        """Get total attendance records for Instructor's students."""
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        query = '''
-            SELECT COUNT(*)
-            FROM attendance
-            WHERE student_id IN (
-                SELECT id FROM students WHERE instructor_username=?
-            )
-        '''
-        cursor.execute(query, (self.username,))
-        count = cursor.fetchone()[0]
-        db.close()
-        return count
-
-    def get_total_classes(self):
-        """Get total distinct classes Instructor is handling."""
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute("SELECT COUNT(DISTINCT class_name) FROM students WHERE instructor_username=?", (self.username,))
-        count = cursor.fetchone()[0]
-        db.close()
-        return count
-
     def show_manage_students(self):
         """Show Manage Students Page."""
-        self.clear_main_content()
-        tk.Label(self.main_content, text="Manage Your Students 🎓", font=("Arial", 20, "bold"),
+        self.pages.show("students")
+
+    def build_manage_students(self, page):
+        tk.Label(page, text="Manage Your Students 🎓", font=("Arial", 20, "bold"),
                  bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
 
-        form_frame = tk.Frame(self.main_content, bg="#f0f0f0")
+        form_frame = tk.Frame(page, bg="#f0f0f0")
         form_frame.pack(pady=10)
 
         self.stud_name_var = tk.StringVar()
@@ -141,10 +171,9 @@ class InstructorDashboard:
             tk.Label(form_frame, text=label, font=("Arial", 12), bg="#f0f0f0", fg="#2e2e2e").grid(row=idx, column=0,
                                                                                                   sticky="w", pady=5)
             if label == "Class":
-                self.class_combobox = ttk.Combobox(form_frame, textvariable=var, font=("Arial", 12), width=27,
-                                                   state="readonly")
-                self.class_combobox.grid(row=idx, column=1, pady=5)
-                self.load_classes_for_dropdown()
+                self.student_class_combobox = ttk.Combobox(form_frame, textvariable=var, font=("Arial", 12),
+                                                           width=27, state="readonly")
+                self.student_class_combobox.grid(row=idx, column=1, pady=5)
             else:
                 tk.Entry(form_frame, textvariable=var, font=("Arial", 12), width=30).grid(row=idx, column=1, pady=5)
 
@@ -157,35 +186,37 @@ class InstructorDashboard:
         tk.Button(form_frame, text="🗑️ Delete Student", font=("Arial", 12), command=self.delete_student).grid(row=5,
                                                                                                               column=2,
                                                                                                               pady=10)
+        self.import_button = tk.Button(form_frame, text="📥 Import Roster", font=("Arial", 12),
+                                       command=self.import_roster)
+        self.import_button.grid(row=5, column=3, padx=10, pady=10)
 
         # Listbox for Students
-        self.students_listbox = tk.Listbox(self.main_content, font=("Arial", 12), width=100)
+        self.students_listbox = tk.Listbox(page, font=("Arial", 12), width=100)
         self.students_listbox.pack(pady=20)
         self.students_listbox.bind("<<ListboxSelect>>", self.load_selected_student)
 
+    def refresh_manage_students(self):
+        self.load_classes_for_dropdown()
         self.load_students()
 
     def load_classes_for_dropdown(self):
         """Load all available Classes into Combobox."""
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute("SELECT class_name FROM classes ORDER BY class_name ASC")
-        classes = [row[0] for row in cursor.fetchall()]
-        self.class_combobox["values"] = classes
-        db.close()
+        def show_classes(classes):
+            self.student_class_combobox["values"] = classes
+
+        self.worker.submit("student_classes", self.classes.list_classes, show_classes, self.show_background_error)
 
     def load_students(self):
         """Load Instructor's Students into Listbox."""
         self.students_listbox.delete(0, tk.END)
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute("SELECT name, roll_number FROM students WHERE instructor_username=?", (self.username,))
-        students = cursor.fetchall()
-        for student in students:
-            self.students_listbox.insert(tk.END, f"{student[0]} ({student[1]})")
-        db.close()
+
+        def show_students(students):
+            self.students_listbox.delete(0, tk.END)
+            for student in students:
+                self.students_listbox.insert(tk.END, f"{student[0]} ({student[1]})")
+
+        self.worker.submit("students", lambda: self.students.list_students(instructor_username=self.username),
+                           show_students, self.show_background_error)
 
     def load_selected_student(self, event):
         """Load selected student data into form."""
@@ -205,16 +236,9 @@ class InstructorDashboard:
         class_name = self.stud_class_var.get().strip()
 
         if name and roll and class_name:
-            db = Database()
-            db.connect()
-            cursor = db.connection.cursor()
-            cursor.execute(
-                "INSERT INTO students (name, roll_number, email, class_name, instructor_username) VALUES (?, ?, ?, ?, ?)",
-                (name, roll, email, class_name, self.username))
-            db.connection.commit()
-            db.close()
-            self.load_students()
-            messagebox.showinfo("Success", "Student Added Successfully!")
+            self.save_in_background("add_student", self.students.add, (name, roll, email, class_name, self.username),
+                                    lambda _: messagebox.showinfo("Success", "Student Added Successfully!"),
+                                    "Error adding student.")
         else:
             messagebox.showwarning("Warning", "Please fill all fields.")
 
@@ -225,195 +249,281 @@ class InstructorDashboard:
         email = self.stud_email_var.get().strip()
         class_name = self.stud_class_var.get().strip()
 
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute(
-            "UPDATE students SET name=?, email=?, class_name=? WHERE roll_number=? AND instructor_username=?",
-            (name, email, class_name, roll, self.username))
-        db.connection.commit()
-        db.close()
-        self.load_students()
-        messagebox.showinfo("Success", "Student Updated Successfully!")
+        if not roll:
+            messagebox.showwarning("Warning", "Please select a student.")
+            return
+
+        def updated(count):
+            if count:
+                messagebox.showinfo("Success", "Student Updated Successfully!")
+            else:
+                messagebox.showerror("Error", "Student not found.")
+
+        self.save_in_background("edit_student", self.students.update,
+                                (roll, name, email, class_name, self.username), updated, "Error updating student.")
 
     def delete_student(self):
         """Delete Selected Student."""
         roll = self.stud_roll_var.get().strip()
 
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute("DELETE FROM students WHERE roll_number=? AND instructor_username=?", (roll, self.username))
-        db.connection.commit()
-        db.close()
-        self.load_students()
-        messagebox.showinfo("Success", "Student Deleted Successfully!")
+        if not roll:
+            messagebox.showwarning("Warning", "Please select a student.")
+            return
+
+        def deleted(count):
+            if count:
+                messagebox.showinfo("Success", "Student Deleted Successfully!")
+            else:
+                messagebox.showerror("Error", "Student not found.")
+
+        self.save_in_background("delete_student", self.students.delete, (roll, self.username), deleted,
+                                "Error deleting student.")
+
+    def import_roster(self):
+        """Import many students at once from a CSV or JSON Lines roster file."""
+        from tkinter import filedialog
+
+        file_path = filedialog.askopenfilename(title="Import Student Roster",
+                                               filetypes=[("Roster files", "*.csv *.jsonl"),
+                                                          ("CSV files", "*.csv"), ("JSON Lines", "*.jsonl")])
+        if not file_path:
+            return  # User cancelled
+
+        def finished(result):
+            self.import_button.config(state="normal", text="📥 Import Roster")
+            details = result.summary()
+            if result.rejected:
+                shown = "\n".join(f"Line {line}: {reason}" for line, reason in result.rejected[:10])
+                more = len(result.rejected) - 10
+                details += f"\n\nRejected rows:\n{shown}" + (f"\n...and {more} more" if more > 0 else "")
+            messagebox.showinfo("Import Complete", details)
+
+        def failed(error):
+            self.import_button.config(state="normal", text="📥 Import Roster")
+            messagebox.showerror("Error", f"Error importing roster.\n{error}")
+
+        self.import_button.config(state="disabled", text="⏳ Importing...")
+        self.worker.submit("import", lambda: self.students.import_file(file_path, self.username), finished, failed)
 
     def show_mark_attendance(self):
         """Show Mark Attendance Page by Class and Students List."""
-        self.clear_main_content()
-        tk.Label(self.main_content, text="Mark Attendance 📝", font=("Arial", 20, "bold"),
+        self.pages.show("attendance")
+
+    def build_mark_attendance(self, page):
+        tk.Label(page, text="Mark Attendance 📝", font=("Arial", 20, "bold"),
                  bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
 
-        top_frame = tk.Frame(self.main_content, bg="#f0f0f0")
+        top_frame = tk.Frame(page, bg="#f0f0f0")
         top_frame.pack(pady=10)
 
         # Class Dropdown
         tk.Label(top_frame, text="Select Class:", font=("Arial", 12), bg="#f0f0f0", fg="#2e2e2e").grid(row=0, column=0,
                                                                                                        padx=5)
         self.selected_class_var = tk.StringVar()
-        self.class_combobox = ttk.Combobox(top_frame, textvariable=self.selected_class_var, font=("Arial", 12),
-                                           width=30, state="readonly")
-        self.class_combobox.grid(row=0, column=1, padx=5)
-        self.load_classes_for_attendance()
+        self.attendance_class_combobox = ttk.Combobox(top_frame, textvariable=self.selected_class_var,
+                                                      font=("Arial", 12), width=30, state="readonly")
+        self.attendance_class_combobox.grid(row=0, column=1, padx=5)
 
         tk.Button(top_frame, text="🔍 Load Students", font=("Arial", 12),
                   command=self.load_students_for_selected_class).grid(row=0, column=2, padx=10)
 
+        # Quick Mark: type a name or roll number, pick a match, mark just that student
+        quick_frame = tk.Frame(page, bg="#f0f0f0")
+        quick_frame.pack(pady=5)
+
+        tk.Label(quick_frame, text="Quick Mark:", font=("Arial", 12), bg="#f0f0f0", fg="#2e2e2e").grid(row=0, column=0,
+                                                                                                      padx=5)
+        self.attendance_student_var = tk.StringVar()
+        self.quick_mark_entry = tk.Entry(quick_frame, textvariable=self.attendance_student_var, font=("Arial", 12),
+                                         width=30)
+        self.quick_mark_entry.grid(row=0, column=1, padx=5)
+        self.attendance_status_var = tk.StringVar(value="Present")
+        ttk.Combobox(quick_frame, textvariable=self.attendance_status_var, values=["Present", "Absent"],
+                     font=("Arial", 12), width=10, state="readonly").grid(row=0, column=2, padx=5)
+        tk.Button(quick_frame, text="✔ Mark", font=("Arial", 12),
+                  command=self.mark_attendance_now).grid(row=0, column=3, padx=5)
+
+        self.quick_mark_listbox = tk.Listbox(quick_frame, font=("Arial", 12), bg="white", fg="#2e2e2e", height=5,
+                                             width=30)
+        self.quick_mark_label = tk.Label(quick_frame, text="", font=("Arial", 11), bg="#f0f0f0", fg="#2e2e2e")
+        self.quick_mark_label.grid(row=2, column=0, columnspan=4)
+
+        self.attendance_student_var.trace_add("write", self.update_quick_mark_suggestions)
+        self.quick_mark_entry.bind("<Down>", self.focus_quick_mark_suggestions)
+        self.quick_mark_entry.bind("<Return>", lambda event: self.mark_attendance_now())
+        self.quick_mark_listbox.bind("<Return>", self.choose_quick_mark_suggestion)
+        self.quick_mark_listbox.bind("<Double-Button-1>", self.choose_quick_mark_suggestion)
+
+        # Bulk actions for the roster below (see RosterGrid for the keyboard shortcuts)
+        bulk_frame = tk.Frame(page, bg="#f0f0f0")
+        bulk_frame.pack(pady=5)
+        tk.Button(bulk_frame, text="✅ All Present", font=("Arial", 11),
+                  command=lambda: self.roster_grid.mark_all("Present")).pack(side="left", padx=5)
+        tk.Button(bulk_frame, text="❌ All Absent", font=("Arial", 11),
+                  command=lambda: self.roster_grid.mark_all("Absent")).pack(side="left", padx=5)
+        tk.Button(bulk_frame, text="🔁 Toggle Selected", font=("Arial", 11),
+                  command=lambda: self.roster_grid.toggle_selected()).pack(side="left", padx=5)
+        tk.Button(bulk_frame, text="🔀 Invert Selection", font=("Arial", 11),
+                  command=lambda: self.roster_grid.invert_selection()).pack(side="left", padx=5)
+        self.roster_count_label = tk.Label(bulk_frame, text="", font=("Arial", 11), bg="#f0f0f0", fg="#2e2e2e")
+        self.roster_count_label.pack(side="left", padx=10)
+        tk.Label(page, text="Space: toggle selected   P / A: mark selected Present / Absent   "
+                            "Ctrl+A: select all   Ctrl+I: invert selection",
+                 font=("Arial", 10), bg="#f0f0f0", fg="#2e2e2e").pack()
+
         # Students Table Area
-        self.student_attendance_frame = tk.Frame(self.main_content, bg="#f0f0f0")
-        self.student_attendance_frame.pack(pady=20, expand=True, fill="both")
+        self.roster_grid = RosterGrid(page, on_change=self.update_roster_counts, bg="#f0f0f0")
+        self.roster_grid.pack(pady=10, padx=20, expand=True, fill="both")
 
-        self.student_widgets = []  # to store (student_id, attendance_status_var)
+        self.save_button = tk.Button(page, text="✅ Save Attendance", font=("Arial", 14),
+                                     command=self.save_all_attendance)
+        self.save_button.pack(pady=10)
 
-        tk.Button(self.main_content, text="✅ Save Attendance", font=("Arial", 14),
-                  command=self.save_all_attendance).pack(pady=20)
+    def refresh_mark_attendance(self):
+        """Reload the class list and start again with an empty roster."""
+        self.load_classes_for_attendance()
+        self.worker.cancel("roster")
+        self.roster_grid.clear()
+        self.save_button.config(state="normal", text="✅ Save Attendance")
+
+        # Build the index off the Tk thread; Quick Mark answers from the old one (or not at all) meanwhile
+        self.worker.submit("roster_index", self.roster_index.build,
+                           lambda snapshot: self.update_quick_mark_suggestions(), self.show_background_error)
 
     def load_classes_for_attendance(self):
         """Load available classes into Class Combobox."""
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute("SELECT DISTINCT class_name FROM students WHERE instructor_username=?", (self.username,))
-        classes = [row[0] for row in cursor.fetchall()]
-        self.class_combobox["values"] = classes
-        db.close()
+        def show_classes(classes):
+            self.attendance_class_combobox["values"] = classes
+
+        self.worker.submit("attendance_classes", lambda: self.students.class_names(self.username), show_classes,
+                           self.show_background_error)
 
     def load_students_for_selected_class(self):
         """Load Students of Selected Class."""
-        # Clear previous
-        for widget in self.student_attendance_frame.winfo_children():
-            widget.destroy()
-
         selected_class = self.selected_class_var.get()
         if not selected_class:
             messagebox.showwarning("Warning", "Please select a class first.")
             return
 
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute("SELECT id, name, roll_number FROM students WHERE class_name=? AND instructor_username=?",
-                       (selected_class, self.username))
-        students = cursor.fetchall()
-        db.close()
+        def failed(error):
+            self.roster_count_label.config(text="")
+            self.show_background_error(error)
 
-        self.student_widgets = []
+        self.roster_grid.clear()
+        self.roster_count_label.config(text="⏳ Loading students...")
+        self.worker.submit("roster", lambda: self.students.class_roster(selected_class, self.username),
+                           self.roster_grid.load, failed)
 
-        # Table Headers
-        headers = ["Roll Number", "Student Name", "Attendance Status"]
-        for idx, header in enumerate(headers):
-            tk.Label(self.student_attendance_frame, text=header, font=("Arial", 12, "bold"),
-                     bg="#dbe0e6", fg="#2e2e2e", width=20, relief="ridge").grid(row=0, column=idx, padx=1, pady=1)
-
-        # Student Rows
-        for row_idx, (student_id, name, roll_no) in enumerate(students, start=1):
-            tk.Label(self.student_attendance_frame, text=roll_no, font=("Arial", 12),
-                     bg="white", fg="#2e2e2e", width=20, relief="ridge").grid(row=row_idx, column=0, padx=1, pady=1)
-
-            tk.Label(self.student_attendance_frame, text=name, font=("Arial", 12),
-                     bg="white", fg="#2e2e2e", width=20, relief="ridge").grid(row=row_idx, column=1, padx=1, pady=1)
-
-            attendance_var = tk.StringVar(value="Present")
-            status_combobox = ttk.Combobox(self.student_attendance_frame, textvariable=attendance_var,
-                                           font=("Arial", 12), width=18, state="readonly")
-            status_combobox["values"] = ["Present", "Absent"]
-            status_combobox.grid(row=row_idx, column=2, padx=1, pady=1)
-
-            self.student_widgets.append((student_id, attendance_var))
+    def update_roster_counts(self, present, absent):
+        """Show how the loaded roster is marked so far."""
+        self.roster_count_label.config(text=f"Present: {present}   Absent: {absent}" if present + absent else "")
 
     def save_all_attendance(self):
         """Save Attendance for All Students."""
-        if not self.student_widgets:
+        statuses = self.roster_grid.items()
+        if not statuses:
             messagebox.showwarning("Warning", "No students to save attendance for.")
             return
 
-        import datetime
-        today_date = datetime.date.today().strftime("%Y-%m-%d")
-
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-
-        for student_id, attendance_var in self.student_widgets:
-            status = attendance_var.get()
-            cursor.execute("INSERT INTO attendance (student_id, date, status) VALUES (?, ?, ?)",
-                           (student_id, today_date, status))
-
-        db.connection.commit()
-        db.close()
+        today_date = self.attendance.today()
+
+        def show_outcomes(outcomes):
+            counts = {}
+            for _, outcome in outcomes:
+                counts[outcome] = counts.get(outcome, 0) + 1
+            summary = ", ".join(f"{outcome.title()}: {count}" for outcome, count in sorted(counts.items()))
+            messagebox.showinfo("Success", f"Attendance Saved Successfully!\n\n{summary}")
+            self.invalidate_pages("attendance")  # start again with a fresh roster
+
+        def show_save_error(error):
+            self.save_button.config(state="normal", text="✅ Save Attendance")
+            messagebox.showerror("Error", f"Error saving attendance.\n{error}")
+
+        self.save_button.config(state="disabled", text="⏳ Saving...")
+        self.worker.watch("save_attendance", submit_write(self.attendance.save_roster, today_date, statuses),
+                          show_outcomes, show_save_error)
+
+    def update_quick_mark_suggestions(self, *args):
+        """Show roster matches for the Quick Mark text as the user types."""
+        text = self.attendance_student_var.get()
+        matches = [] if text.endswith(")") else self.roster_index.lookup(text)
+        self.quick_mark_listbox.delete(0, tk.END)
+        for _, name, roll_number, class_name in matches:
+            self.quick_mark_listbox.insert(tk.END, f"{name} ({roll_number})")
+        if matches:
+            self.quick_mark_listbox.grid(row=1, column=1, padx=5, sticky="ew")
+        else:
+            self.quick_mark_listbox.grid_remove()
+
+    def focus_quick_mark_suggestions(self, event):
+        """Move from the Quick Mark entry into its suggestion list."""
+        if self.quick_mark_listbox.size():
+            self.quick_mark_listbox.focus_set()
+            self.quick_mark_listbox.selection_clear(0, tk.END)
+            self.quick_mark_listbox.selection_set(0)
+            self.quick_mark_listbox.activate(0)
+
+    def choose_quick_mark_suggestion(self, event):
+        """Copy the highlighted suggestion into the Quick Mark entry."""
+        selection = self.quick_mark_listbox.curselection()
+        if selection:
+            self.attendance_student_var.set(self.quick_mark_listbox.get(selection[0]))
+            self.quick_mark_entry.focus_set()
+            self.quick_mark_entry.icursor(tk.END)
 
-        messagebox.showinfo("Success", "Attendance Saved Successfully!")
-        self.show_mark_attendance()  # reload fresh
+    def find_quick_mark_student(self, text):
+        """Resolve Quick Mark text to a roster entry: an exact "Name (roll)" pick or a unique match."""
+        if text.endswith(")") and "(" in text:
+            return self.roster_index.by_roll(text.rsplit("(", 1)[1][:-1].strip())
+        matches = self.roster_index.lookup(text, limit=2)
+        return matches[0] if len(matches) == 1 else None
 
     def mark_attendance_now(self):
-        """Save Attendance Record into Database."""
-        selected_student = self.attendance_student_var.get()
+        """Save today's attendance for the student picked in Quick Mark."""
+        selected_student = self.attendance_student_var.get().strip()
         status = self.attendance_status_var.get()
 
         if not selected_student or not status:
             messagebox.showwarning("Warning", "Please select both Student and Attendance Status.")
             return
 
-        # Extract Roll Number
-        name_part, roll_part = selected_student.rsplit("(", 1)
-        roll_number = roll_part.replace(")", "").strip()
-
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-
-        # Get student_id based on roll_number
-        cursor.execute("SELECT id FROM students WHERE roll_number=? AND instructor_username=?",
-                       (roll_number, self.username))
-        result = cursor.fetchone()
-
-        if result:
-            student_id = result[0]
-
-            import datetime
-            today_date = datetime.date.today().strftime("%Y-%m-%d")
+        student = self.find_quick_mark_student(selected_student)
+        if not student:
+            messagebox.showerror("Error", "Student not found!\nPick one of the suggestions.")
+            return
+        student_id, name, roll_number, _ = student
 
-            # Insert Attendance
-            cursor.execute("INSERT INTO attendance (student_id, date, status) VALUES (?, ?, ?)",
-                           (student_id, today_date, status))
-            db.connection.commit()
-            messagebox.showinfo("Success", "Attendance marked successfully!")
-        else:
-            messagebox.showerror("Error", "Student not found!")
+        today_date = self.attendance.today()
 
-        db.close()
+        def marked(_):
+            # Keep a loaded class roster in step with the mark just saved
+            self.roster_grid.set_status([student_id], status)
+            self.quick_mark_label.config(text=f"✅ Marked {name} ({roll_number}) {status}")
 
-        # Refresh Students if needed
-        self.load_students_for_attendance()
+        # Insert or update today's mark
+        self.save_in_background(f"quick_mark_{student_id}", self.attendance.mark, (student_id, today_date, status),
+                                marked, "Error marking attendance.")
+        self.attendance_student_var.set("")
+        self.quick_mark_entry.focus_set()
 
     # Full Updated show_view_reports with Class and Date Range Filters
     def show_view_reports(self):
         """Show Attendance Reports with Class and Date Filters."""
-        self.clear_main_content()
-        tk.Label(self.main_content, text="Attendance Reports 📄", font=("Arial", 20, "bold"),
+        self.pages.show("reports")
+
+    def build_view_reports(self, page):
+        tk.Label(page, text="Attendance Reports 📄", font=("Arial", 20, "bold"),
                  bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
 
-        filter_frame = tk.Frame(self.main_content, bg="#f0f0f0")
+        filter_frame = tk.Frame(page, bg="#f0f0f0")
         filter_frame.pack(pady=10)
 
         # Class Dropdown
         tk.Label(filter_frame, text="Select Class:", font=("Arial", 12), bg="#f0f0f0").grid(row=0, column=0, padx=5)
         self.filter_class_var = tk.StringVar()
-        self.class_combobox = ttk.Combobox(filter_frame, textvariable=self.filter_class_var, font=("Arial", 12),
-                                           width=20, state="readonly")
-        self.class_combobox.grid(row=0, column=1, padx=5)
-        self.load_classes_for_reports()
+        self.report_class_combobox = ttk.Combobox(filter_frame, textvariable=self.filter_class_var,
+                                                  font=("Arial", 12), width=20, state="readonly")
+        self.report_class_combobox.grid(row=0, column=1, padx=5)
 
         # Start Date
         tk.Label(filter_frame, text="Start Date (YYYY-MM-DD):", font=("Arial", 12), bg="#f0f0f0").grid(row=0, column=2,
@@ -436,97 +546,99 @@ class InstructorDashboard:
         tk.Button(filter_frame, text="📄 View All Attendance", font=("Arial", 12),
                   command=self.load_all_attendance).grid(row=1, column=6, padx=10)
 
+        self.report_status_label = tk.Label(page, text="", font=("Arial", 11),
+                                            bg="#f0f0f0", fg="#2e2e2e")
+        self.report_status_label.pack()
+        self.report_summary_label = tk.Label(page, text="", font=("Arial", 11, "bold"),
+                                             bg="#f0f0f0", fg="#2e2e2e")
+        self.report_summary_label.pack()
+
         # Table Area
-        table_frame = tk.Frame(self.main_content, bg="#f0f0f0")
+        table_frame = tk.Frame(page, bg="#f0f0f0")
         table_frame.pack(pady=20, expand=True, fill="both")
 
         columns = ("Date", "Student Name", "Roll No", "Status")
-        self.attendance_tree = ttk.Treeview(table_frame, columns=columns, show="headings")
-        for col in columns:
-            self.attendance_tree.heading(col, text=col)
-            self.attendance_tree.column(col, anchor="center", width=150)
-
-        self.attendance_tree.pack(expand=True, fill="both")
-
-        self.load_all_attendance()
+        self.report_table = VirtualTreeview(table_frame, columns, self.worker, "reports", column_width=150,
+                                            on_status=self.update_report_status,
+                                            on_error=self.show_background_error, bg="#f0f0f0")
+        self.report_table.pack(expand=True, fill="both")
+        self.attendance_tree = self.report_table.tree
+
+    def refresh_view_reports(self):
+        """Reload the class list and re-run the active report filter (all attendance at first)."""
+        self.load_classes_for_reports()
+        self.show_report(self.active_report or self.reports.report(instructor_username=self.username))
 
     def load_classes_for_reports(self):
         """Load Classes into filter dropdown."""
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute("SELECT DISTINCT class_name FROM students WHERE instructor_username=?", (self.username,))
-        classes = [row[0] for row in cursor.fetchall()]
-        self.class_combobox["values"] = classes
-        db.close()
+        def show_classes(classes):
+            self.report_class_combobox["values"] = classes
+
+        self.worker.submit("report_classes", lambda: self.students.class_names(self.username), show_classes,
+                           self.show_background_error)
 
     def load_all_attendance(self):
         """Load all attendance records."""
-        self.attendance_tree.delete(*self.attendance_tree.get_children())
-
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-
-        query = '''
-            SELECT attendance.date, students.name, students.roll_number, attendance.status
-            FROM attendance
-            JOIN students ON attendance.student_id = students.id
-            WHERE students.instructor_username=?
-            ORDER BY attendance.date DESC
-        '''
-        cursor.execute(query, (self.username,))
-        records = cursor.fetchall()
-
-        for record in records:
-            self.attendance_tree.insert("", "end", values=record)
-
-        db.close()
+        self.show_report(self.reports.report(instructor_username=self.username))
 
     def filter_attendance_reports(self):
         """Filter attendance records based on selected filters."""
-        self.attendance_tree.delete(*self.attendance_tree.get_children())
-
         selected_class = self.filter_class_var.get()
         start_date = self.start_date_var.get()
         end_date = self.end_date_var.get()
 
-        query = '''
-            SELECT attendance.date, students.name, students.roll_number, attendance.status
-            FROM attendance
-            JOIN students ON attendance.student_id = students.id
-            WHERE students.instructor_username=?
-        '''
-        params = [self.username]
-
-        if selected_class:
-            query += " AND students.class_name=?"
-            params.append(selected_class)
-
-        if start_date and end_date:
-            query += " AND attendance.date BETWEEN ? AND ?"
-            params.extend([start_date, end_date])
+        self.show_report(self.reports.report(instructor_username=self.username,
+                                             class_name=selected_class or None,
+                                             start_date=start_date or None, end_date=end_date or None))
+
+    def show_report(self, report):
+        """Point the report table at a new filter; rows are fetched as the user scrolls."""
+        self.active_report = report
+        self.report_status_label.config(text="⏳ Loading attendance...")
+        self.report_table.load(report.page)
+        self.report_summary_label.config(text="")
+        self.worker.submit("report_summary", lambda: self.reports.totals(report),
+                           self.show_report_summary, self.show_background_error)
+
+    def show_report_summary(self, totals):
+        """Show present/absent totals for the active report filter."""
+        present, absent = totals
+        marked = present + absent
+        rate = f"{100 * present / marked:.1f}%" if marked else "-"
+        self.report_summary_label.config(text=f"✅ Present: {present}    ❌ Absent: {absent}    📈 Rate: {rate}")
+
+    def update_report_status(self, row_count, complete):
+        """Show how many report rows are loaded so far."""
+        if complete:
+            self.report_status_label.config(text=f"{row_count} records")
+        else:
+            self.report_status_label.config(text=f"Showing {row_count} records (scroll for more)")
 
-        query += " ORDER BY attendance.date DESC"
+    def show_analytics(self):
+        """Show Class Analytics: attendance %, absence streaks and trends."""
+        self.pages.show("analytics")
 
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-        cursor.execute(query, tuple(params))
-        records = cursor.fetchall()
+    def build_analytics(self, page):
+        tk.Label(page, text="Class Analytics 📊", font=("Arial", 20, "bold"),
+                 bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
 
-        for record in records:
-            self.attendance_tree.insert("", "end", values=record)
+        self.analytics_pane = AnalyticsPane(page, self.worker, self.get_instructor_classes,
+                                            self.reports.class_analytics, instructor_username=self.username)
+        self.analytics_pane.pack(expand=True, fill="both")
 
-        db.close()
+    def get_instructor_classes(self):
+        """Return the distinct classes of the Instructor's students."""
+        return self.students.class_names(self.username)
 
     def show_profile(self):
         """Show Profile Settings to Change Password."""
-        self.clear_main_content()
-        tk.Label(self.main_content, text="Profile Settings ⚙️", font=("Arial", 20, "bold"),
+        self.pages.show("profile")
+
+    def build_profile(self, page):
+        tk.Label(page, text="Profile Settings ⚙️", font=("Arial", 20, "bold"),
                  bg="#f0f0f0", fg="#2e2e2e").pack(pady=20)
 
-        profile_frame = tk.Frame(self.main_content, bg="#f0f0f0")
+        profile_frame = tk.Frame(page, bg="#f0f0f0")
         profile_frame.pack(pady=10)
 
         self.old_pass_var = tk.StringVar()
@@ -557,32 +669,23 @@ class InstructorDashboard:
             messagebox.showwarning("Warning", "Please fill all fields.")
             return
 
-        db = Database()
-        db.connect()
-        cursor = db.connection.cursor()
-
-        cursor.execute("SELECT password FROM users WHERE username=?", (self.username,))
-        record = cursor.fetchone()
-
-        if record:
-            stored_password = record[0]
-            if Security.verify_password(old_pass, stored_password):
-                if new_pass == confirm_pass:
-                    hashed_password = Security.hash_password(new_pass).decode('utf-8')
-                    cursor.execute("UPDATE users SET password=? WHERE username=?", (hashed_password, self.username))
-                    db.connection.commit()
-                    messagebox.showinfo("Success", "Password changed successfully!")
-                    self.old_pass_var.set("")
-                    self.new_pass_var.set("")
-                    self.confirm_pass_var.set("")
-                else:
-                    messagebox.showwarning("Warning", "New passwords do not match.")
-            else:
-                messagebox.showerror("Error", "Old password is incorrect.")
-        else:
-            messagebox.showerror("Error", "User not found!")
+        if new_pass != confirm_pass:
+            messagebox.showwarning("Warning", "New passwords do not match.")
+            return
+
+        errors = {"not_found": "User not found!", "wrong_password": "Old password is incorrect."}
+
+        def changed(outcome):
+            if outcome in errors:
+                messagebox.showerror("Error", errors[outcome])
+                return
+            messagebox.showinfo("Success", "Password changed successfully!")
+            self.old_pass_var.set("")
+            self.new_pass_var.set("")
+            self.confirm_pass_var.set("")
 
-        db.close()
+        job = Security.submit(self.auth.change_password, self.username, old_pass, new_pass)
+        self.worker.watch("password", job, changed, self.show_background_error)
 
     def toggle_theme(self):
         self.is_dark_mode = not self.is_dark_mode
@@ -606,6 +709,8 @@ class InstructorDashboard:
 
     def logout(self):
         if messagebox.askyesno("Confirm Logout", "Are you sure you want to logout?"):
+            self.worker.shutdown()
+            self.services.close()
             self.root.destroy()
 
             import tkinter as tk
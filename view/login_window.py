@@ -3,11 +3,9 @@
 
 import tkinter as tk
 from tkinter import messagebox, simpledialog
-from StudentAttendanceTracker.controller.auth_controller import AuthController
+from StudentAttendanceTracker.controller.services import Services
 from StudentAttendanceTracker.utils.security import Security
-from StudentAttendanceTracker.model.database import Database
-from StudentAttendanceTracker.view.admin_dashboard import AdminDashboard
-from StudentAttendanceTracker.view.instructor_dashboard import InstructorDashboard
+from StudentAttendanceTracker.utils.worker import BackgroundWorker
 
 class LoginWindow:
     """Login Window with Modern Split Left-Right Design."""
@@ -16,7 +14,9 @@ class LoginWindow:
         """Initialize the Login Window."""
         self.root = root
         self.root.title("Student Attendance Tracker - Login")
-        self.auth = AuthController()
+        self.services = Services.default()
+        self.auth = self.services.auth
+        self.worker = BackgroundWorker(self.root)
 
         # Set window size
         self.root.geometry("850x500")
@@ -59,28 +59,50 @@ class LoginWindow:
         self.error_label.place(relx=0.5, rely=0.52, anchor="center")
 
         # Login Button
-        tk.Button(self.right_frame, text="LOGIN", font=("Arial", 12, "bold"),
-                  width=20, bg="white", fg="#2e2e2e", command=self.login).place(relx=0.5, rely=0.62, anchor="center")
+        self.login_button = tk.Button(self.right_frame, text="LOGIN", font=("Arial", 12, "bold"),
+                                      width=20, bg="white", fg="#2e2e2e", command=self.login)
+        self.login_button.place(relx=0.5, rely=0.62, anchor="center")
+        self.password_entry.bind("<Return>", lambda event: self.login())
 
         # Register Button (Admin Only)
         tk.Button(self.right_frame, text="Register Admin", font=("Arial", 10),
                   width=20, bg="#4d4d4d", fg="white", command=self.register_admin).place(relx=0.5, rely=0.7, anchor="center")
 
     def login(self):
-        """Authenticate user and open appropriate dashboard."""
+        """Check the credentials off the Tk thread; finish_login() runs with the result."""
+        if str(self.login_button["state"]) == "disabled":
+            return  # a check is already running
         username = self.username_entry.get()
         password = self.password_entry.get()
-        role = self.auth.login(username, password)
+
+        self.error_label.config(text="")
+        self.login_button.config(state="disabled", text="⏳ Checking...")
+        self.worker.watch("login", self.auth.login_async(username, password),
+                          lambda role: self.finish_login(username, role), self.show_login_error)
+
+    def show_login_error(self, error):
+        """Report a login check that failed to run."""
+        self.login_button.config(state="normal", text="LOGIN")
+        messagebox.showerror("Login Error", f"Could not check credentials.\n{error}")
+
+    def finish_login(self, username, role):
+        """Open the appropriate dashboard, or report wrong credentials."""
+        self.login_button.config(state="normal", text="LOGIN")
 
         if role:
             self.error_label.config(text="")
             messagebox.showinfo("Login Success", f"Welcome {role}!")
+            self.worker.shutdown()
+            self.services.close()
             self.root.destroy()
 
+            # Dashboards are imported only now, keeping them off the cold-start path
             dashboard_root = tk.Tk()
             if role == "Admin":
+                from StudentAttendanceTracker.view.admin_dashboard import AdminDashboard
                 AdminDashboard(dashboard_root, username)
             elif role == "Instructor":
+                from StudentAttendanceTracker.view.instructor_dashboard import InstructorDashboard
                 InstructorDashboard(dashboard_root, username)
             else:
                 messagebox.showerror("Login Error", "Unknown role detected!")
@@ -132,33 +154,22 @@ class LoginWindow:
                 message_label.config(text="Passwords do not match!", fg="red")
                 return
 
-            db = Database()
-            db.connect()
-            cursor = db.connection.cursor()
-
-            try:
-                # Check if user exists
-                cursor.execute("SELECT * FROM users WHERE username = ?", (username,))
-                if cursor.fetchone():
+            def registered(created):
+                if not created:
                     message_label.config(text="Username already exists!", fg="red")
                     return
-
-                hashed_password = Security.hash_password(password)
-                hashed_password = hashed_password.decode('utf-8')
-
-                cursor.execute("INSERT INTO users (username, password, role) VALUES (?, ?, ?)",
-                               (username, hashed_password, "Admin"))
-                db.connection.commit()
                 message_label.config(text="Admin registered successfully!", fg="green")
 
                 username_entry.delete(0, tk.END)
                 password_entry.delete(0, tk.END)
                 confirm_entry.delete(0, tk.END)
 
-            except Exception as e:
+            def failed(e):
                 message_label.config(text=f"Error: {e}", fg="red")
-            finally:
-                db.close()
+
+            message_label.config(text="⏳ Registering...", fg="black")
+            job = Security.submit(self.auth.register_admin, username, password)
+            self.worker.watch("register", job, registered, failed)
 
         tk.Button(frame, text="Register", font=("Arial", 12),
                   width=20, command=register_action).grid(row=5, column=0, columnspan=2, pady=20)
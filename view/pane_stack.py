@@ -0,0 +1,86 @@
+# view/pane_stack.py
+# OOP Concept: Class, Encapsulation, Lazy Construction
+
+import tkinter as tk
+
+
+class PaneStack:
+    """Keeps every page of a dashboard alive and swaps them in one container.
+
+    Each page is registered with a builder that creates its widgets once,
+    inside a frame of its own, and an optional refresh that reloads its data.
+    show() hides the visible page and packs the requested one, building it on
+    first use. A page refreshes when it is first built and afterwards only
+    once invalidate() has marked it stale or the data version has moved
+    since its last refresh (another PC saved something), so going back to a
+    page shows it exactly as it was left without running its queries again.
+    Pages whose data is a single cheap query can ask to refresh on every
+    show instead.
+    """
+
+    def __init__(self, container, bg="#f0f0f0", version=None):
+        """Initialize with the frame the pages are packed into.
+
+        Args:
+            version (callable): Returns a value that changes when another process writes,
+                or None if unknown, e.g. Services.data_version.
+        """
+        self.container = container
+        self.bg = bg
+        self.version = version
+        self.pages = {}
+        self.frames = {}
+        self.stale = set()
+        self.versions = {}  # page -> version at its last refresh
+        self.current = None
+
+    def register(self, name, build, refresh=None, always_refresh=False):
+        """Add a page.
+
+        Args:
+            name (str): Page key used by show() and invalidate().
+            build (callable): Called once with the page's frame to create its widgets.
+            refresh (callable): Reloads the page's data; called with no arguments.
+            always_refresh (bool): Refresh on every show, not only when stale.
+        """
+        self.pages[name] = (build, refresh, always_refresh)
+
+    def show(self, name):
+        """Show one page, building or refreshing it first if needed, and return its frame."""
+        build, refresh, always_refresh = self.pages[name]
+        if self.current not in (None, name):
+            self.frames[self.current].pack_forget()
+
+        frame = self.frames.get(name)
+        if frame is None:
+            frame = self.frames[name] = tk.Frame(self.container, bg=self.bg)
+            build(frame)
+            self.stale.add(name)
+        if self.current != name:
+            frame.pack(expand=True, fill="both")
+            self.current = name
+
+        if refresh:
+            version = self.version() if self.version else None
+            if version is not None and version != self.versions.get(name):
+                self.stale.add(name)
+            if always_refresh or name in self.stale:
+                self.stale.discard(name)
+                self.versions[name] = version
+                refresh()
+        return frame
+
+    def invalidate(self, *names):
+        """Mark pages (or every page) as out of date.
+
+        The visible page refreshes straight away; the others wait until they are next shown.
+        """
+        for name in names or tuple(self.pages):
+            if name in self.frames:
+                self.stale.add(name)
+        if self.current in self.stale:
+            self.show(self.current)
+
+    def is_built(self, name):
+        """Return True once a page's widgets exist."""
+        return name in self.frames
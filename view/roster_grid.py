@@ -0,0 +1,118 @@
+# view/roster_grid.py
+# OOP Concept: Inheritance (tk.Frame), Encapsulation, Reusable GUI Component
+
+import tkinter as tk
+import tkinter.ttk as ttk
+
+
+class RosterGrid(tk.Frame):
+    """One Treeview for marking a whole class, however large.
+
+    Each student is a single row keyed by student id, and their status is a
+    cell that is toggled in place, so a class costs one widget instead of
+    three per student. Keyboard:
+
+        Space / Enter / double-click   toggle the selected rows
+        P / A                          mark the selected rows Present / Absent
+        Ctrl+A                         select every row
+        Ctrl+I                         invert the selection
+    """
+
+    COLUMNS = ("Roll Number", "Student Name", "Attendance Status")
+    STATUSES = ("Present", "Absent")
+
+    def __init__(self, parent, on_change=None, **kwargs):
+        """Initialize the grid.
+
+        Args:
+            on_change (callable): Called with (present, absent) counts after any status change.
+        """
+        super().__init__(parent, **kwargs)
+        self.on_change = on_change
+        self.statuses = {}  # student id -> status, in roster order
+
+        self.tree = ttk.Treeview(self, columns=self.COLUMNS, show="headings", selectmode="extended")
+        for col, width in zip(self.COLUMNS, (180, 320, 180)):
+            self.tree.heading(col, text=col)
+            self.tree.column(col, anchor="center", width=width)
+        self.tree.tag_configure("Absent", background="#f8d7da")
+
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", expand=True, fill="both")
+
+        for sequence in ("<space>", "<Return>", "<Double-Button-1>"):
+            self.tree.bind(sequence, lambda event: self._key(self.toggle_selected))
+        for key, status in (("p", "Present"), ("a", "Absent")):
+            self.tree.bind(f"<KeyPress-{key}>", lambda event, status=status: self._key(self.mark_selected, status))
+            self.tree.bind(f"<KeyPress-{key.upper()}>", lambda event, status=status: self._key(self.mark_selected, status))
+        self.tree.bind("<Control-a>", lambda event: self._key(self.select_all))
+        self.tree.bind("<Control-i>", lambda event: self._key(self.invert_selection))
+
+    @staticmethod
+    def _key(action, *args):
+        action(*args)
+        return "break"  # keep Treeview's own bindings (e.g. Return, Ctrl+A) from also firing
+
+    def load(self, roster, status="Present"):
+        """Show a class roster of (student_id, name, roll_number) rows, everyone marked status."""
+        self.tree.delete(*self.tree.get_children())
+        self.statuses = {}
+        for student_id, name, roll_number in roster:
+            self.statuses[student_id] = status
+            self.tree.insert("", "end", iid=str(student_id), values=(roll_number, name, status), tags=(status,))
+        children = self.tree.get_children()
+        if children:
+            self.tree.focus(children[0])
+            self.tree.focus_set()
+        self._changed()
+
+    def clear(self):
+        """Remove every row."""
+        self.load([])
+
+    def items(self):
+        """Return [(student_id, status)] in roster order, ready for AttendanceController.save_roster."""
+        return list(self.statuses.items())
+
+    def set_status(self, student_ids, status):
+        """Mark the given students; ids not in the roster are ignored."""
+        for student_id in student_ids:
+            if student_id in self.statuses:
+                self.statuses[student_id] = status
+                self.tree.set(str(student_id), "Attendance Status", status)
+                self.tree.item(str(student_id), tags=(status,))
+        self._changed()
+
+    def mark_all(self, status):
+        """Mark every student in the roster."""
+        self.set_status(list(self.statuses), status)
+
+    def selected_ids(self):
+        return [int(item) for item in self.tree.selection()]
+
+    def mark_selected(self, status):
+        self.set_status(self.selected_ids(), status)
+
+    def toggle_selected(self):
+        """Flip each selected student between Present and Absent."""
+        for student_id in self.selected_ids():
+            flipped = "Absent" if self.statuses[student_id] == "Present" else "Present"
+            self.statuses[student_id] = flipped
+            self.tree.set(str(student_id), "Attendance Status", flipped)
+            self.tree.item(str(student_id), tags=(flipped,))
+        self._changed()
+
+    def select_all(self):
+        self.tree.selection_set(self.tree.get_children())
+
+    def invert_selection(self):
+        """Select exactly the rows that are not selected now."""
+        selected = set(self.tree.selection())
+        self.tree.selection_set([item for item in self.tree.get_children() if item not in selected])
+
+    def _changed(self):
+        if self.on_change:
+            absent = sum(1 for status in self.statuses.values() if status == "Absent")
+            self.on_change(len(self.statuses) - absent, absent)
@@ -0,0 +1,175 @@
+# view/virtual_tree.py
+# OOP Concept: Inheritance (tk.Frame), Encapsulation, Lazy Loading
+
+import bisect
+import tkinter as tk
+import tkinter.ttk as ttk
+
+
+def stable_items(old_positions, new_ids):
+    """Return the ids of new_ids that can keep their place: a longest run whose old order is unchanged.
+
+    Args:
+        old_positions (dict): Item id -> index in the current order.
+        new_ids (list): Item ids in the wanted order.
+    """
+    kept = [item for item in new_ids if item in old_positions]
+    tails, tail_items, previous = [], [], {}
+    for item in kept:
+        position = old_positions[item]
+        slot = bisect.bisect_left(tails, position)
+        previous[item] = tail_items[slot - 1] if slot else None
+        if slot == len(tails):
+            tails.append(position)
+            tail_items.append(item)
+        else:
+            tails[slot] = position
+            tail_items[slot] = item
+    stable, item = set(), tail_items[-1] if tail_items else None
+    while item is not None:
+        stable.add(item)
+        item = previous[item]
+    return stable
+
+
+class VirtualTreeview(tk.Frame):
+    """Treeview that fetches its rows a page at a time as the user scrolls.
+
+    Rows come from a ``fetch_page(after, limit)`` callable, where ``after`` is
+    the last row already shown (None for the first page). Each row's first
+    value is its unique key and is used as the Treeview item id; the rest are
+    the displayed column values. Pages are fetched on a BackgroundWorker so
+    scrolling never blocks on SQLite.
+
+    load() does not clear the table. It re-reads as many rows as are shown
+    now (at least one page) from the new source and patches the Treeview to
+    match: rows that left are deleted, new rows inserted, changed rows
+    updated and only rows out of order moved. A refilter that changes a
+    handful of rows costs a handful of Treeview operations.
+    """
+
+    PAGE_SIZE = 200
+    PREFETCH_AT = 0.85  # fetch the next page once the view is scrolled this far down
+
+    def __init__(self, parent, columns, worker, channel, column_width=150, on_status=None, on_error=None, **kwargs):
+        """Initialize the table.
+
+        Args:
+            columns (tuple): Column headings.
+            worker (BackgroundWorker): Runs page fetches off the Tk thread.
+            channel (str): Worker channel used for this table's fetches.
+            on_status (callable): Called with (rows_loaded, complete) after each page.
+            on_error (callable): Called with the exception if a fetch fails.
+        """
+        super().__init__(parent, **kwargs)
+        self.worker = worker
+        self.channel = channel
+        self.on_status = on_status
+        self.on_error = on_error
+
+        self.tree = ttk.Treeview(self, columns=columns, show="headings")
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, anchor="center", width=column_width)
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", expand=True, fill="both")
+
+        self.fetch_page = None
+        self.last_row = None
+        self.row_count = 0
+        self.complete = True
+        self.loading = False
+        self.values = {}  # item id -> displayed values, to spot changed rows without asking Tk
+        self.diff_pending = False
+
+    def load(self, fetch_page):
+        """Show rows from a new source, reusing the rows already shown where they still match."""
+        self.worker.cancel(self.channel)
+        self.fetch_page = fetch_page
+        self.complete = False
+        self.loading = False
+        self.diff_pending = True
+        self._fetch_next()
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        # A hidden table reports everything as visible; wait until it is shown again
+        if float(last) >= self.PREFETCH_AT and self.tree.winfo_ismapped():
+            self._fetch_next()
+
+    def _fetch_next(self):
+        if self.loading or self.complete or self.fetch_page is None:
+            return
+        self.loading = True
+        if self.diff_pending:
+            # The first fetch after load() covers everything shown now, so it can be diffed in one go
+            after, limit = None, max(self.PAGE_SIZE, self.row_count)
+        else:
+            after, limit = self.last_row, self.PAGE_SIZE
+        fetch_page = self.fetch_page
+        self.worker.submit(self.channel, lambda: fetch_page(after, limit),
+                           lambda rows: self._receive(rows, limit), self._fetch_failed)
+
+    def _receive(self, rows, limit):
+        self.loading = False
+        if self.diff_pending:
+            self.diff_pending = False
+            self._apply_diff(rows)
+            self.row_count = len(rows)
+        else:
+            for row in rows:
+                item = str(row[0])
+                if item in self.values:
+                    # Edited since its first page and now sorts past the cursor: move it, don't add it twice
+                    self.tree.move(item, "", "end")
+                    if self.values[item] != tuple(row[1:]):
+                        self.tree.item(item, values=row[1:])
+                else:
+                    self.tree.insert("", "end", iid=item, values=row[1:])
+                    self.row_count += 1
+                self.values[item] = tuple(row[1:])
+        self.last_row = rows[-1] if rows else self.last_row
+        self.complete = len(rows) < limit
+        if self.on_status:
+            self.on_status(self.row_count, self.complete)
+
+    def _apply_diff(self, rows):
+        """Make the table show exactly rows, in order, with as few Treeview operations as possible."""
+        new_ids = [str(row[0]) for row in rows]
+        new_values = {item: tuple(row[1:]) for item, row in zip(new_ids, rows)}
+
+        gone = [item for item in self.values if item not in new_values]
+        if gone:
+            self.tree.delete(*gone)
+        for item in gone:
+            del self.values[item]
+
+        for item, values in new_values.items():
+            if item in self.values and self.values[item] != values:
+                self.tree.item(item, values=values)
+
+        # Rows in the longest run that is already in order stay put. Every other row is detached,
+        # which leaves exactly the stable rows, in order; one pass down the new order then puts
+        # each detached or new row at its final index
+        old_positions = {item: position for position, item in enumerate(self.tree.get_children())}
+        stable = stable_items(old_positions, new_ids)
+        unstable = [item for item in old_positions if item not in stable]
+        if unstable:
+            self.tree.detach(*unstable)
+        for index, item in enumerate(new_ids):
+            if item in stable:
+                continue
+            if item in old_positions:
+                self.tree.move(item, "", index)  # reattaches the detached row
+            else:
+                self.tree.insert("", index, iid=item, values=new_values[item])
+        self.values = new_values
+
+    def _fetch_failed(self, error):
+        self.loading = False
+        self.complete = True
+        if self.on_error:
+            self.on_error(error)